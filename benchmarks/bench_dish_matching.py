@@ -0,0 +1,109 @@
+import sys
+import json
+import math
+import time
+import argparse
+import numpy as np
+from dish_matching import MAIN_INGREDIENTS, DISH_WORDS, MinHasher, NameGuards, lsh_clusters
+
+# Scaling of MinHash/LSH dish clustering on generated names:
+#   python -m benchmarks.bench_dish_matching --sizes 10000 30000 100000 300000
+# Base names are two or three menu words plus a made-up word. Every base is
+# planted with a misspelt and a prefixed variant, and the run reports how
+# many variants land in their base's cluster. Recall falls as the sizes grow
+# because random bases built from 60 words start to resemble one another
+# and merge. Exits non-zero if time grows faster than names^1.5.
+
+WORDS = [
+    "dal", "makhani", "paneer", "tikka", "butter", "chicken", "masala", "kadhai", "palak", "shahi",
+    "korma", "biryani", "mutton", "rogan", "josh", "tandoori", "malai", "achari", "hariyali", "seekh",
+    "kebab", "naan", "roti", "paratha", "laccha", "jeera", "pulao", "raita", "soup", "manchow",
+    "chilli", "garlic", "noodles", "hakka", "fried", "rice", "momos", "spring", "roll", "dumplings",
+    "lababdar", "kofta", "methi", "matar", "aloo", "gobi", "bhindi", "baingan", "bharta", "chole",
+    "rajma", "amritsari", "fish", "prawns", "lasooni", "pudina", "afghani", "reshmi", "galouti", "nihari",
+]
+LETTERS = "abcdeghiklmnoprstuvy"
+PREFIXES = ["punjabi", "special", "house", "classic", "royal", "dhaba", "smoked", "homestyle"]
+
+
+def misspell(name, rng):
+    """Drop one inner vowel from the first word longer than four letters that is not a MAIN_INGREDIENT or DISH_WORD."""
+    start = 0
+    for word in name.split():
+        if len(word) > 4 and word not in MAIN_INGREDIENTS + DISH_WORDS:
+            vowels = [start + i for i, c in enumerate(word[1:-1], 1) if c in "aeiou"]
+            if vowels:
+                i = vowels[rng.integers(len(vowels))]
+                return name[:i] + name[i + 1:]
+        start += len(word) + 1
+    return name + "s"
+
+
+def synthetic_names(count, seed=0):
+    """count names: bases plus a misspelt and a prefixed copy of each; returns (names, base index per name)."""
+    rng = np.random.default_rng(seed)
+    bases, seen = [], set()
+    while len(bases) * 3 < count:
+        words = list(rng.choice(WORDS, rng.integers(2, 4), replace=False))
+        words.insert(rng.integers(len(words) + 1), "".join(rng.choice(list(LETTERS), rng.integers(4, 8))))
+        name = " ".join(words)
+        if name not in seen:
+            seen.add(name)
+            bases.append(name)
+    names, base_of = [], []
+    for index, base in enumerate(bases):
+        names.append(base)
+        names.append(misspell(base, rng))
+        names.append(f"{PREFIXES[rng.integers(len(PREFIXES))]} {base}")
+        base_of.extend([index, index, index])
+    return names[:count], np.array(base_of[:count])
+
+
+def measure(count):
+    names, base_of = synthetic_names(count)
+    start = time.perf_counter()
+    signatures = MinHasher().signatures(names)
+    signed = time.perf_counter()
+    labels, compared = lsh_clusters(signatures, NameGuards(names))
+    done = time.perf_counter()
+    # A planted variant is recovered when it shares its base's cluster.
+    base_rows = np.flatnonzero(np.r_[True, base_of[1:] != base_of[:-1]])
+    recovered = labels == labels[base_rows][np.searchsorted(base_of[base_rows], base_of)]
+    variants = len(names) - len(base_rows)
+    return {
+        "names": count,
+        "signature_seconds": round(signed - start, 3),
+        "cluster_seconds": round(done - signed, 3),
+        "total_seconds": round(done - start, 3),
+        "pairs_compared": int(compared),
+        "all_pairs": count * (count - 1) // 2,
+        "variant_recall": round(float((recovered.sum() - len(base_rows)) / max(variants, 1)), 3),
+    }
+
+
+def scaling_exponent(results):
+    """Least-squares slope of log(time) against log(names)."""
+    x = np.log([r["names"] for r in results])
+    y = np.log([r["total_seconds"] for r in results])
+    return float(np.polyfit(x, y, 1)[0]) if len(results) > 1 else math.nan
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 30000, 100000, 300000])
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'Names':>9}{'Sign s':>9}{'Cluster s':>11}{'Total s':>9}{'Compared':>12}{'All pairs':>16}{'Recall':>8}")
+    for count in args.sizes:
+        r = measure(count)
+        results.append(r)
+        print(f"{r['names']:>9}{r['signature_seconds']:>9.2f}{r['cluster_seconds']:>11.2f}{r['total_seconds']:>9.2f}"
+              f"{r['pairs_compared']:>12}{r['all_pairs']:>16}{r['variant_recall']:>8.1%}")
+    exponent = scaling_exponent(results)
+    print(f"Time grows as names^{exponent:.2f} (all-pairs comparison would be names^2)")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"results": results, "scaling_exponent": exponent}, f, indent=2)
+    sys.exit(0 if exponent < 1.5 or math.isnan(exponent) else 1)
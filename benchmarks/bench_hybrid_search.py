@@ -0,0 +1,89 @@
+import os
+import re
+import sys
+import json
+import tempfile
+import argparse
+import numpy as np
+from menu_index import build_index, MenuIndex
+from menu_search import HybridSearcher
+
+# Recall and latency of BM25, vector and hybrid retrieval on a labelled query set:
+#   python -m benchmarks.bench_hybrid_search                 # builds a hashing index from ./*_menu.csv
+#   python -m benchmarks.bench_hybrid_search --index menu_index --budget-ms 5
+# A query's relevant items are those whose name matches its "relevant"
+# pattern; recall@k counts distinct (restaurant, name) pairs found in the
+# top k, out of at most k.
+
+QUERIES_PATH = os.path.join(os.path.dirname(__file__), "menu_queries.json")
+MODES = ["bm25", "vector", "hybrid"]
+
+
+def relevant_items(rows, pattern):
+    matcher = re.compile(pattern, re.I)
+    return {(restaurant, name) for restaurant, name in
+            zip(rows["restaurant"].to_pylist(), rows["name"].to_pylist()) if matcher.search(name)}
+
+
+def recall_at_k(hits, relevant, k):
+    found = {(hit["restaurant"], hit["name"]) for hit in hits[:k]}
+    return len(found & relevant) / min(len(relevant), k) if relevant else 1.0
+
+
+def run(searcher, queries, k, repeat, budget_ms):
+    results = {}
+    labelled = [(q["query"], relevant_items(searcher.index.rows, q["relevant"])) for q in queries]
+    for mode in MODES:
+        latencies, recalls, skipped = [], [], 0
+        for query, relevant in labelled:
+            for _ in range(repeat):
+                result = searcher.search(query, k, budget_ms, mode)
+                latencies.append(result["total_ms"])
+                skipped += bool(result["skipped"])
+            recalls.append(recall_at_k(result["hits"], relevant, k))
+        results[mode] = {
+            f"recall@{k}": round(float(np.mean(recalls)), 4),
+            "p50_ms": round(float(np.percentile(latencies, 50)), 3),
+            "p99_ms": round(float(np.percentile(latencies, 99)), 3),
+            "budget_misses": skipped,
+            "per_query_recall": dict(zip([query for query, _ in labelled], recalls)),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--index", help="existing index directory (default: build one from --dir)")
+    parser.add_argument("--dir", default=".", help="scraper outputs to index when --index is not given")
+    parser.add_argument("--encoder", default="hashing")
+    parser.add_argument("--queries", default=QUERIES_PATH)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per query")
+    parser.add_argument("--budget-ms", type=float)
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--verbose", action="store_true", help="print recall per query")
+    args = parser.parse_args()
+
+    with open(args.queries, encoding="utf-8") as f:
+        queries = json.load(f)
+    with tempfile.TemporaryDirectory() as scratch:
+        index_dir = args.index
+        if not index_dir:
+            index_dir = os.path.join(scratch, "index")
+            build_index(args.dir, index_dir, args.encoder)
+        searcher = HybridSearcher(MenuIndex.load(index_dir))
+        results = run(searcher, queries, args.k, args.repeat, args.budget_ms)
+        searcher.close()
+
+    print(f"{len(queries)} queries x {args.repeat} runs, {searcher.index.meta['rows']} items, "
+          f"{searcher.index.meta['encoder_version']}")
+    print(f"{'Mode':<8}{f'Recall@{args.k}':>11}{'p50 ms':>9}{'p99 ms':>9}{'Over budget':>13}")
+    for mode, r in results.items():
+        print(f"{mode:<8}{r[f'recall@{args.k}']:>11.3f}{r['p50_ms']:>9.2f}{r['p99_ms']:>9.2f}{r['budget_misses']:>13}")
+    if args.verbose:
+        for query in results["hybrid"]["per_query_recall"]:
+            print(f"  {query:<32}" + "".join(f"{results[mode]['per_query_recall'][query]:>8.2f}" for mode in MODES))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    sys.exit(0)
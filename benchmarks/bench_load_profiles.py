@@ -0,0 +1,92 @@
+import sys
+import json
+import time
+import argparse
+from driver_session import build_driver, browser_rss_mb, LOAD_PROFILES
+from menu_engine import MenuScraper, load_restaurant, load_restaurants
+
+# Compares page-load profiles on the live order pages:
+#   python -m benchmarks.bench_load_profiles tamasha local --runs 3
+# Each run uses a cold browser so profiles are measured on equal terms.
+
+# Raise the resource timing buffer before any page script runs so large pages
+# do not stop recording after the default 250 entries.
+RESOURCE_BUFFER_JS = "performance.setResourceTimingBufferSize(100000);"
+
+TRANSFERRED_BYTES_JS = """
+var entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+var total = 0;
+for (var i = 0; i < entries.length; i++) total += entries[i].transferSize || 0;
+return {bytes: total, requests: entries.length};
+"""
+
+
+def measure(key, profile, extraction_mode):
+    restaurant = load_restaurant(key)
+    driver = build_driver(restaurant.get("chrome_arguments", []), profile=profile)
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": RESOURCE_BUFFER_JS})
+        scraper = MenuScraper(restaurant, extraction_mode=extraction_mode, driver=driver)
+        start = time.perf_counter()
+        scraper.load_page()
+        ready_seconds = time.perf_counter() - start
+        scraper.extract_menu()
+        transfer = driver.execute_script(TRANSFERRED_BYTES_JS)
+        return {
+            "restaurant": key,
+            "profile": profile,
+            "ready_seconds": round(ready_seconds, 3),
+            "transferred_kb": round(transfer["bytes"] / 1024, 1),
+            "requests": transfer["requests"],
+            "browser_rss_mb": round(browser_rss_mb(driver), 1),
+            "items": sum(len(items) for items in scraper.menu_data.values()),
+            "menu": scraper.menu_data,
+        }
+    finally:
+        driver.quit()
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+
+def run(keys, profiles, runs, extraction_mode):
+    rows = []
+    for key in keys:
+        menus = {}
+        for profile in profiles:
+            samples = [measure(key, profile, extraction_mode) for _ in range(runs)]
+            menus[profile] = samples[-1]["menu"]
+            rows.append({
+                "restaurant": key,
+                "profile": profile,
+                "runs": runs,
+                "ready_seconds": median([s["ready_seconds"] for s in samples]),
+                "transferred_kb": median([s["transferred_kb"] for s in samples]),
+                "requests": median([s["requests"] for s in samples]),
+                "browser_rss_mb": median([s["browser_rss_mb"] for s in samples]),
+                "items": samples[-1]["items"],
+                "menu_identical": samples[-1]["menu"] == menus[profiles[0]],
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark page-load profiles.")
+    parser.add_argument("restaurants", nargs="*", default=list(load_restaurants()))
+    parser.add_argument("--profiles", nargs="+", default=list(LOAD_PROFILES), choices=list(LOAD_PROFILES))
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--mode", choices=["element", "js"], default="js")
+    parser.add_argument("--output", default="load_profile_benchmark.json")
+    args = parser.parse_args()
+    rows = run(args.restaurants, args.profiles, args.runs, args.mode)
+    print(f"\n{'Restaurant':<18}{'Profile':<9}{'Ready (s)':>10}{'KB':>10}{'Requests':>10}{'RSS (MB)':>10}{'Items':>7}  Same menu")
+    for r in rows:
+        print(f"{r['restaurant']:<18}{r['profile']:<9}{r['ready_seconds']:>10.2f}{r['transferred_kb']:>10.0f}"
+              f"{r['requests']:>10.0f}{r['browser_rss_mb']:>10.0f}{r['items']:>7}  {r['menu_identical']}")
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(rows, f, indent=2)
+    print(f"Results saved to {args.output}")
+    sys.exit(0 if all(r["menu_identical"] for r in rows) else 1)
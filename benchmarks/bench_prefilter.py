@@ -0,0 +1,79 @@
+import sys
+import json
+import time
+import argparse
+import numpy as np
+from menu_filters import FilterIndex, synthetic_rows
+
+# Structured filter latency, FilterIndex against a plain pandas boolean filter:
+#   python -m benchmarks.bench_prefilter --rows 2000000
+# Every query's row ids are checked to be identical between the two.
+
+QUERIES = {
+    "veg": dict(veg_status="Veg"),
+    "under_300": dict(max_price=300),
+    "veg_under_300": dict(veg_status="Veg", max_price=300),
+    "one_restaurant": dict(restaurants=["restaurant_7"]),
+    "two_restaurants_veg_under_300": dict(restaurants=["restaurant_7", "restaurant_42"], veg_status="Veg", max_price=300),
+    "price_200_to_400_non_veg": dict(veg_status="Non-Veg", min_price=200, max_price=400),
+}
+
+
+def pandas_select(frame, restaurants=None, veg_status=None, min_price=None, max_price=None):
+    mask = np.ones(len(frame), dtype=bool)
+    if restaurants:
+        mask &= frame["restaurant"].isin(restaurants).to_numpy()
+    if veg_status:
+        mask &= (frame["veg_status"] == veg_status).to_numpy()
+    if min_price is not None:
+        mask &= (frame["price"] >= min_price).to_numpy()
+    if max_price is not None:
+        mask &= (frame["price"] <= max_price).to_numpy()
+    return np.flatnonzero(mask)
+
+
+def timed(function, repeat):
+    times, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append((time.perf_counter() - start) * 1000)
+    return result, times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000000)
+    parser.add_argument("--restaurants", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    rows = synthetic_rows(args.rows, args.restaurants)
+    frame = rows.to_pandas()
+    start = time.perf_counter()
+    filters = FilterIndex(rows)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"{args.rows} rows, {args.restaurants} restaurants; FilterIndex built in {build_ms:.0f} ms")
+    print(f"{'Query':<32}{'Matches':>10}{'Index p50':>11}{'p99':>8}{'pandas p50':>12}{'p99':>8}{'Speedup':>9}")
+    results = {"rows": args.rows, "build_ms": round(build_ms, 1), "queries": {}}
+    for name, query in QUERIES.items():
+        ids, index_times = timed(lambda: filters.select(**query), args.repeat)
+        expected, pandas_times = timed(lambda: pandas_select(frame, **query), max(3, args.repeat // 5))
+        if not np.array_equal(ids, expected):
+            print(f"{name}: FilterIndex returned {len(ids)} rows, pandas {len(expected)}")
+            sys.exit(1)
+        r = {
+            "matches": int(len(ids)),
+            "index_p50_ms": round(float(np.percentile(index_times, 50)), 3),
+            "index_p99_ms": round(float(np.percentile(index_times, 99)), 3),
+            "pandas_p50_ms": round(float(np.percentile(pandas_times, 50)), 3),
+            "pandas_p99_ms": round(float(np.percentile(pandas_times, 99)), 3),
+        }
+        r["speedup"] = round(r["pandas_p50_ms"] / max(r["index_p50_ms"], 1e-6), 1)
+        results["queries"][name] = r
+        print(f"{name:<32}{r['matches']:>10}{r['index_p50_ms']:>11.2f}{r['index_p99_ms']:>8.2f}"
+              f"{r['pandas_p50_ms']:>12.2f}{r['pandas_p99_ms']:>8.2f}{r['speedup']:>8.1f}x")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
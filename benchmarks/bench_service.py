@@ -0,0 +1,146 @@
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import tempfile
+import subprocess
+import numpy as np
+from urllib.parse import quote
+from menu_index import build_index
+from menu_search import HybridSearcher
+from menu_service import MAX_BATCH, MAX_WAIT_MS
+from benchmarks.bench_hybrid_search import QUERIES_PATH
+
+# Throughput of menu_service under concurrent clients against answering one
+# question at a time:
+#   python -m benchmarks.bench_service                       # builds a hashing index from ./*_menu.csv
+#   python -m benchmarks.bench_service --index menu_index --clients 100 --requests 3000
+#
+#   inline          HybridSearcher.search() called in a loop, as a UI embedding search would
+#   service x1      one HTTP client, one request at a time
+#   service xN      N keep-alive clients, encoder micro-batching on
+#   unbatched xN    N clients, --max-batch 1
+#
+# The service runs in its own process with the query cache off, so repeated
+# questions are searched every time.
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_service(index_dir, port, max_batch, max_wait_ms):
+    process = subprocess.Popen(
+        [sys.executable, "menu_service.py", "--index", index_dir, "--port", str(port), "--no-cache",
+         "--max-batch", str(max_batch), "--max-wait-ms", str(max_wait_ms)],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("menu_service did not start")
+
+
+async def client(port, questions, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for question in questions:
+        start = time.perf_counter()
+        writer.write(f"GET /search?q={quote(question)}&k=10 HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("latin-1"))
+        await writer.drain()
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        json.loads(await reader.readexactly(length))
+        latencies.append((time.perf_counter() - start) * 1000)
+    writer.close()
+
+
+async def load(port, questions, clients):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, questions[i::clients], latencies) for i in range(clients)))
+    return time.perf_counter() - start, latencies
+
+
+def summary(seconds, latencies):
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / seconds, 1),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 3),
+        "p99_ms": round(float(np.percentile(latencies, 99)), 3),
+    }
+
+
+def inline(index_dir, questions):
+    searcher = HybridSearcher.load(index_dir)
+    latencies = []
+    start = time.perf_counter()
+    for question in questions:
+        begin = time.perf_counter()
+        searcher.search(question)
+        latencies.append((time.perf_counter() - begin) * 1000)
+    seconds = time.perf_counter() - start
+    searcher.close()
+    return summary(seconds, latencies)
+
+
+def service(index_dir, questions, clients, max_batch, max_wait_ms):
+    port = free_port()
+    process = start_service(index_dir, port, max_batch, max_wait_ms)
+    try:
+        asyncio.run(load(port, questions[:50], min(clients, 10)))  # warm-up
+        return summary(*asyncio.run(load(port, questions, clients)))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--index", help="existing index directory (default: build one from --dir)")
+    parser.add_argument("--dir", default=".", help="scraper outputs to index when --index is not given")
+    parser.add_argument("--encoder", default="hashing")
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH)
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    with open(QUERIES_PATH, encoding="utf-8") as f:
+        questions = [q["query"] for q in json.load(f)]
+    questions = (questions * (args.requests // len(questions) + 1))[:args.requests]
+    with tempfile.TemporaryDirectory() as scratch:
+        index_dir = os.path.abspath(args.index) if args.index else os.path.join(scratch, "index")
+        if not args.index:
+            build_index(args.dir, index_dir, args.encoder)
+        results = {
+            "inline": inline(index_dir, questions),
+            "service x1": service(index_dir, questions, 1, args.max_batch, args.max_wait_ms),
+            f"service x{args.clients}": service(index_dir, questions, args.clients, args.max_batch, args.max_wait_ms),
+            f"unbatched x{args.clients}": service(index_dir, questions, args.clients, 1, 0),
+        }
+
+    print(f"{args.requests} requests, {args.encoder} encoder, max batch {args.max_batch}, max wait {args.max_wait_ms} ms")
+    print(f"{'Run':<18}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, r in results.items():
+        print(f"{name:<18}{r['throughput_rps']:>10.1f}{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}")
+    baseline = results["inline"]["throughput_rps"]
+    print(f"service x{args.clients} vs inline: {results[f'service x{args.clients}']['throughput_rps'] / baseline:.2f}x")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,92 @@
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+
+# Start-up budget for the data-only menu_cli.py commands. Each command runs
+# under `python -X importtime`; the import time it adds over a bare
+# interpreter must stay within BUDGET_MS, and none of the heavy modules may be
+# imported at all. tests/test_startup.py enforces this on a fixture catalog;
+# this script reports it for a directory of real outputs:
+#   python -m benchmarks.bench_startup                  # exits 1 when a command is over budget
+#   python -m benchmarks.bench_startup --budget-ms 50 --repeat 10
+#
+# `query` runs against a catalog built from --dir in a scratch directory.
+
+BUDGET_MS = 100.0
+HEAVY_MODULES = ("selenium", "webdriver_manager", "pandas", "pyarrow", "numpy", "faiss", "sklearn", "torch",
+                 "transformers", "sentence_transformers", "lxml", "requests")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(argv):
+    """{top-level module: cumulative µs} from `python -X importtime` running argv."""
+    process = subprocess.run([sys.executable, "-X", "importtime", *argv], cwd=ROOT, capture_output=True, text=True)
+    if process.returncode:
+        raise RuntimeError(f"{' '.join(argv)} failed:\n{process.stdout}{process.stderr}")
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.rstrip()] = int(cumulative)
+    return times
+
+
+def measure(argv, interpreter_modules, repeat):
+    """(best added import ms, top-level modules of the best run, heavy modules imported)."""
+    best = None
+    for _ in range(repeat):
+        times = import_times(argv)
+        added = {name.strip(): us for name, us in times.items()
+                 if not name.startswith("  ") and name.strip() not in interpreter_modules}
+        total = sum(added.values()) / 1000
+        heavy = sorted({name.strip().split(".")[0] for name in times} & set(HEAVY_MODULES))
+        if best is None or total < best[0]:
+            best = (total, added, heavy)
+    return best
+
+
+def build_catalog(directory, db):
+    from menu_catalog import connect, bulk_load, menus_from_outputs
+
+    bulk_load(connect(db), menus_from_outputs(directory))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dir", default=".", help="scraper outputs for stats and the query catalog")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS, help="import time a command may add")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per command; the fastest counts")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    directory = os.path.abspath(args.dir)
+    interpreter = {name.strip() for name in import_times(["-c", "pass"])}
+    results, failures = {}, 0
+    with tempfile.TemporaryDirectory() as scratch:
+        db = os.path.join(scratch, "menu_catalog.db")
+        build_catalog(directory, db)
+        commands = {
+            "query": ["menu_cli.py", "query", "veg paneer under ₹400", "--db", db],
+            "stats": ["menu_cli.py", "stats", "--dir", directory],
+        }
+        print(f"{'Command':<10}{'Import ms':>11}{'Budget ms':>11}  Heaviest imports")
+        for name, argv in commands.items():
+            total, added, heavy = measure(argv, interpreter, args.repeat)
+            over = total > args.budget_ms or heavy
+            failures += bool(over)
+            top = sorted(added.items(), key=lambda item: -item[1])[:3]
+            print(f"{name:<10}{total:>11.1f}{args.budget_ms:>11.0f}  "
+                  f"{', '.join(f'{module} {us / 1000:.1f}' for module, us in top)}"
+                  f"{'  OVER BUDGET' if total > args.budget_ms else ''}"
+                  f"{'  imports ' + ', '.join(heavy) if heavy else ''}")
+            results[name] = {"import_ms": round(total, 3), "budget_ms": args.budget_ms, "heavy_modules": heavy,
+                             "modules": {module: us for module, us in top}}
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,245 @@
+import io
+import os
+import csv
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import tempfile
+import contextlib
+import subprocess
+from functools import partial
+from html_snapshot import snapshot_scraper
+from menu_engine import MenuScraper
+from menu_sink import MenuSink, RowDeduper, CSV_HEADER, _encode, _indented_item
+from restaurant_config import load_restaurants
+from benchmarks.fixtures import load_fixture
+
+# Timings for the scraper's hot paths, written to JSON so two commits can be
+# compared:
+#
+#   extract/<restaurant>        extract_item() over the saved page, per item
+#   end_to_end/<restaurant>     parse the saved page, extract, save_data()
+#   sink_log/<n>                MenuSink.add() streaming n items to the log
+#   finalize/<policy>/<n>       MenuSink.finalize(): dedup + CSV + JSON from the log
+#   dedup/<policy>/<n>          RowDeduper.accept() alone
+#   write_csv/<n>, write_json/<n>
+#
+# Restaurant pages come from snapshots/<output>.html when recorded, otherwise
+# from benchmarks/fixtures/. Synthetic menus have n items, about 10% repeated.
+#
+#   python -m benchmarks.bench_suite --json bench_baseline.json              # on the base commit
+#   python -m benchmarks.bench_suite --baseline bench_baseline.json          # on the change; exits 1 on a regression
+#   python -m benchmarks.bench_suite --compare new.json --baseline old.json  # compare two saved runs
+#   python -m benchmarks.bench_suite --sizes 10000 100000 1000000 --only finalize
+
+SIZES = [10000, 100000]
+POLICIES = {
+    "none": {"drop_empty_categories": False, "dedupe": None, "skip_price_names": False},
+    "row": {"drop_empty_categories": True, "dedupe": "row", "skip_price_names": False},
+    "name_price": {"drop_empty_categories": True, "dedupe": "name_price", "skip_price_names": False},
+}
+INFO = {"name": "Benchmark Kitchen", "location": "Connaught Place, New Delhi",
+        "hours": "12:00 PM to 11:00 PM (Mon-Sun)", "contact": "+91 11 00000000"}
+THRESHOLD = 0.10
+# Differences smaller than this are timer noise whatever the ratio.
+MIN_DELTA_S = 0.002
+WORDS = ("paneer chicken mutton dal makhani butter tikka masala naan roti biryani veg soup salad "
+         "tandoori kebab garlic cheese mushroom prawn fish curry rice kulcha lassi brownie").split()
+
+
+def synthetic_menu(count, seed=0):
+    """{category: items} with count items, 100 to a category, about 10% of them repeats."""
+    rng = random.Random(seed)
+    menu, made = {}, []
+    for i in range(count):
+        if made and rng.random() < 0.1:
+            item = dict(rng.choice(made))
+        else:
+            words = rng.sample(WORDS, 3)
+            item = {
+                "name": " ".join(word.title() for word in words[:2]) + f" {i}",
+                "description": " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 12))),
+                "price": f"₹{rng.randint(50, 1500)}",
+                "veg_status": rng.choice(["Veg", "Non-Veg", "Unknown"]),
+            }
+            made.append(item)
+        menu.setdefault(f"Category {i // 100}", []).append(item)
+    return menu
+
+
+def csv_rows(menu):
+    prefix = (INFO["name"], INFO["location"], INFO["hours"], INFO["contact"])
+    return [prefix + (category, item["name"], item["description"], item["price"], item["veg_status"])
+            for category, items in menu.items() for item in items]
+
+
+@contextlib.contextmanager
+def quiet_in(directory):
+    """Run in directory with the scraper's progress output swallowed."""
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        os.chdir(cwd)
+
+
+def timed(run, repeat, setup=None):
+    """Seconds for each of repeat calls of run(setup()); setup is not timed."""
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        run(state) if setup else run()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def fill_sink(output, menu, policy):
+    sink = MenuSink(output, INFO, policy)
+    for category, items in menu.items():
+        sink.add_category(category)
+        sink.add(category, items)
+    return sink
+
+
+def write_json(path, menu):
+    """The JSON finalize() writes, straight from menu_data."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{")
+        for i, (category, items) in enumerate(menu.items()):
+            f.write(("," if i else "") + "\n    " + _encode(category) + ": ")
+            f.write("[" + ",".join("\n        " + _indented_item(item) for item in items) + "\n    ]" if items else "[]")
+        f.write("\n}")
+
+
+def restaurant_cases(scratch, repeat):
+    """(name, measure) pairs; measure() returns (seconds per run, items, extra fields)."""
+    for key, restaurant in load_restaurants().items():
+        page, origin = load_fixture(restaurant)
+        build = partial(MenuScraper, restaurant)
+
+        def measure(run, build=build, page=page, origin=origin):
+            with quiet_in(scratch):
+                items = sum(len(v) for v in snapshot_scraper(build, page).menu_data.values())
+                # Pages take milliseconds, so they get more runs than the synthetic menus.
+                return timed(partial(run, build, page), repeat * 4), items, {"page": origin}
+
+        yield f"extract/{key}", partial(measure, lambda build, page: snapshot_scraper(build, page))
+        yield f"end_to_end/{key}", partial(measure, lambda build, page: snapshot_scraper(build, page).save_data())
+
+
+def synthetic_cases(scratch, sizes, repeat):
+    output = os.path.join(scratch, "synthetic")
+    for size in sizes:
+        menu = synthetic_menu(size)
+        rows = csv_rows(menu)
+        runs = max(1, repeat if size <= 100000 else repeat // 3)
+        yield f"sink_log/{size}", lambda: (timed(lambda: fill_sink(output, menu, POLICIES["none"]).discard(), runs), size, {})
+        for name, policy in POLICIES.items():
+            yield f"dedup/{name}/{size}", partial(lambda policy: (timed(lambda: _dedup(policy, rows), runs), size, {}), policy)
+            yield f"finalize/{name}/{size}", partial(lambda policy: (timed(
+                lambda sink: sink.finalize(), runs, lambda: fill_sink(output, menu, policy)), size, {}), policy)
+        yield f"write_csv/{size}", lambda: (timed(lambda: _write_csv(os.path.join(scratch, "rows.csv"), rows), runs), size, {})
+        yield f"write_json/{size}", lambda: (timed(lambda: write_json(os.path.join(scratch, "menu.json"), menu), runs), size, {})
+
+
+def _dedup(policy, rows):
+    deduper = RowDeduper(policy)
+    for row in rows:
+        deduper.accept(row)
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(rows)
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run(sizes, repeat, only=None):
+    results = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        for cases in (restaurant_cases(scratch, repeat), synthetic_cases(scratch, sizes, repeat)):
+            for name, measure in cases:
+                if only and not any(part in name for part in only):
+                    continue
+                times, items, extra = measure()
+                times = sorted(times)
+                median = times[len(times) // 2]
+                results[name] = dict(extra, median_s=round(median, 6), min_s=round(times[0], 6), runs=len(times),
+                                     items=items, us_per_item=round(median / max(items, 1) * 1e6, 3))
+                print(f"{name:<32}{median * 1000:>10.2f} ms{results[name]['us_per_item']:>10.2f} us/item", flush=True)
+    return {
+        "meta": {"commit": git_commit(), "python": platform.python_version(), "machine": platform.machine(),
+                 "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "sizes": sizes, "repeat": repeat},
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold=THRESHOLD):
+    """[(case, baseline s, current s, ratio, regressed)] for cases in both runs.
+
+    Runs are compared on their fastest time, which moves least when other
+    work shares the machine.
+    """
+    rows = []
+    for name, now in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = now["min_s"] / max(before["min_s"], 1e-9)
+        regressed = ratio > 1 + threshold and now["min_s"] - before["min_s"] > MIN_DELTA_S
+        rows.append((name, before["min_s"], now["min_s"], ratio, regressed))
+    return rows
+
+
+def print_comparison(rows, current, baseline, threshold):
+    print(f"\n{baseline['meta'].get('commit') or 'baseline'} -> {current['meta'].get('commit') or 'current'} "
+          f"(regression: more than {threshold:.0%} slower)")
+    print(f"{'Case (best run)':<32}{'Before ms':>11}{'After ms':>11}{'Change':>9}")
+    for name, before, now, ratio, regressed in rows:
+        print(f"{name:<32}{before * 1000:>11.2f}{now * 1000:>11.2f}{(ratio - 1):>+9.1%}{'  REGRESSION' if regressed else ''}")
+    regressions = sum(row[4] for row in rows)
+    print(f"{regressions} regression(s) in {len(rows)} cases")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="synthetic menu sizes (10000 to 1000000)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case (a third of that above 100k items)")
+    parser.add_argument("--only", nargs="+", help="run only cases whose name contains one of these")
+    parser.add_argument("--json", default="bench_results.json", help="where to write this run's results")
+    parser.add_argument("--baseline", help="results file to compare against; exits 1 on a regression")
+    parser.add_argument("--compare", help="compare this results file with --baseline instead of running")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="slowdown ratio that counts as a regression")
+    args = parser.parse_args()
+
+    if args.compare:
+        if not args.baseline:
+            parser.error("--compare needs --baseline")
+        with open(args.compare, encoding="utf-8") as f:
+            current = json.load(f)
+    else:
+        current = run(args.sizes, args.repeat, args.only)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"Results written to {args.json}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare(current, baseline, args.threshold)
+        sys.exit(1 if print_comparison(rows, current, baseline, args.threshold) else 0)
@@ -0,0 +1,136 @@
+import os
+import csv
+import sys
+import zlib
+from html import escape
+from restaurant_config import load_restaurants
+
+# HTML fixtures for the six order pages, used by bench_suite when no recorded
+# snapshot (snapshots/<output>.html, saved by --mode snapshot) is
+# available. Each page lays out that restaurant's last scraped CSV in the
+# markup its recipe in restaurants.json selects from:
+#   python -m benchmarks.fixtures            # rewrite benchmarks/fixtures/*.html
+#
+# Category-click pages are saved with every item on the page and a single
+# category label, since a saved page cannot be clicked through; each item is
+# then extracted once, as on the live page.
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def menu_from_csv(path):
+    """{category: [item, ...]} from a scraper CSV, in file order."""
+    menu = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            menu.setdefault(row["Category"], []).append({
+                "name": row["Item Name"], "description": row["Description"],
+                "price": row["Price"], "veg_status": row["Veg Status"],
+            })
+    return menu
+
+
+def _veg_type(item):
+    return {"Veg": '<div type="veg"></div>', "Non-Veg": '<div type="non-veg"></div>'}.get(item["veg_status"], "")
+
+
+def _veg_icon(item):
+    icon = {"Veg": "#veg-icon", "Non-Veg": "#non-veg-icon"}.get(item["veg_status"])
+    return f'<svg><use href="{icon}"></use></svg>' if icon else ""
+
+
+def _description(item):
+    # Price-only descriptions come from pages that repeat the price; they are dropped here.
+    description = item["description"]
+    return "" if not description or description == item["price"] else description
+
+
+def category_click_page(menu, label_class):
+    items = [item for category in menu.values() for item in category]
+    lines = [f'<div class="tabs"><p color="#363636" class="{label_class}">All Items ({len(items)})</p></div>', "<section>"]
+    for item in items:
+        lines.append(f'<div class="sc-1s0saks-0"><h4>{escape(item["name"])}</h4><span>{escape(item["price"])}</span>'
+                     f'<p>{escape(_description(item))}</p>{_veg_type(item)}{_veg_icon(item)}</div>')
+    lines.append("</section>")
+    return lines
+
+
+def headers_page(menu):
+    lines = []
+    for category, items in menu.items():
+        lines.append(f'<section><h4 class="sc-1hp8d8a-0">{escape(category)}</h4>')
+        for item in items:
+            veg = f'<span>{item["veg_status"]}</span>' if item["veg_status"] != "Unknown" else ""
+            lines.append(f'<div><h4>{escape(item["name"])}</h4><span>{escape(item["price"])}</span>'
+                         f'<p>{escape(_description(item))}</p>{veg}</div>')
+        lines.append("</section>")
+    return lines
+
+
+def sections_page(menu):
+    lines = []
+    for category, items in menu.items():
+        lines.append(f'<section class="sc-bke1zw-0"><h4>{escape(category)}</h4>')
+        for item in items:
+            lines.append(f'<div class="sc-1s0saks-0"><h4>{escape(item["name"])}</h4><span>{escape(item["price"])}</span>'
+                         f'<p>{escape(_description(item))}</p>{_veg_type(item)}</div>')
+        lines.append("</section>")
+    return lines
+
+
+def tamasha_page(menu):
+    lines = []
+    for category, items in menu.items():
+        lines.append(f'<section class="sc-bke1zw-1"><h2>{escape(category)}</h2>')
+        for item in items:
+            veg = f' {item["veg_status"]}' if item["veg_status"] != "Unknown" else ""
+            lines.append(f'<div class="sc-item"><h4 class="sc-1s0saks-15">{escape(item["name"])}</h4>'
+                         f'<span class="sc-1s0saks-12">{escape(_description(item))}</span>'
+                         f'<img src="https://b.zmtcdn.com/data/dish_photos/{zlib.crc32(item["name"].encode("utf-8")) % 1000}.jpg">'
+                         f'{escape(item["price"])}{veg}</div>')
+        lines.append("</section>")
+    return lines
+
+
+def fixture_page(restaurant, menu):
+    key = restaurant["key"]
+    if key == "darzi_bar":
+        body = category_click_page(menu, "sc-1hez2tp-0 gdgQSV")
+    elif restaurant["recipe"]["strategy"] == "category_click":
+        body = category_click_page(menu, "sc-1herztp-0 kKmnbp")
+    elif restaurant["recipe"]["strategy"] == "headers":
+        body = headers_page(menu)
+    elif key == "tamasha":
+        body = tamasha_page(menu)
+    else:
+        body = sections_page(menu)
+    return "\n".join(["<html><head><title>" + escape(restaurant["restaurant_info"]["name"]) + "</title></head>",
+                      "<body><main>", *body, "</main></body></html>", ""])
+
+
+def fixture_path(restaurant, directory=FIXTURE_DIR):
+    return os.path.join(directory, f"{restaurant['output']}.html")
+
+
+def load_fixture(restaurant, snapshot_dir="snapshots"):
+    """(page source, origin) for a restaurant: its recorded snapshot if there is one, else the fixture."""
+    for path, origin in ((os.path.join(snapshot_dir, f"{restaurant['output']}.html"), "snapshot"),
+                         (fixture_path(restaurant), "fixture")):
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                return f.read(), origin
+    raise FileNotFoundError(f"No snapshot or fixture for {restaurant['key']}; run: python -m benchmarks.fixtures")
+
+
+if __name__ == "__main__":
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    for restaurant in load_restaurants().values():
+        source = f"{restaurant['output']}.csv"
+        if not os.path.exists(source):
+            print(f"Skipping {restaurant['key']}: no {source}")
+            continue
+        menu = menu_from_csv(source)
+        with open(fixture_path(restaurant), "w", encoding="utf-8", newline="\n") as f:
+            f.write(fixture_page(restaurant, menu))
+        print(f"{fixture_path(restaurant)}: {sum(len(items) for items in menu.values())} items in {len(menu)} categories")
+    sys.exit(0)
@@ -0,0 +1,306 @@
+import re
+import sys
+import glob
+import zlib
+import argparse
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from menu_cleaning import read_menu_frame, clean_menu
+
+# Groups the same dish across restaurants ("Dal Makhani", "Dal Makhni",
+# "Punjabi Dal Makhani") for price comparison.
+#
+# Each distinct dish name becomes a set of character trigrams, summarised by a
+# MinHash signature. Signatures are cut into bands and hashed into buckets
+# (locality-sensitive hashing); only names sharing a bucket are compared, and
+# a name joins a cluster centre when their estimated Jaccard similarity
+# clears the threshold. Work grows with the number of names, not the number
+# of pairs.
+
+# The thresholds below are tuned against the labelled match and non-match
+# pairs in tests/test_dish_matching.py.
+NUM_PERM = 64
+# 21 bands of 3 rows: a misspelt short name ("Gulab Jamoon", about 0.5 alike)
+# still shares a bucket with the correct spelling most of the time.
+BANDS = 21
+THRESHOLD = 0.5
+# Two short names share most of their trigrams through one common word
+# ("Chilli Chicken" / "Chicken 65"), so names of at most SHORT_TOKENS words
+# only join each other when this alike.
+SHORT_THRESHOLD = 0.55
+SHORT_TOKENS = 3
+# A name with no main ingredient only joins one that has one when this alike.
+UNQUALIFIED_THRESHOLD = 0.7
+# A name may join a cluster through one of its members when it is at least
+# THRESHOLD - CENTRE_SLACK alike to the cluster's centre.
+CENTRE_SLACK = 0.1
+# Names whose words pair up in order, each pair equal or at least WORD_MATCH
+# alike, are misspellings of each other ("Dal Makhani" / "Dal Makhni",
+# "Gulab Jamun" / "Gulab Jamoon") and match from TYPO_THRESHOLD.
+TYPO_THRESHOLD = 0.35
+WORD_MATCH = 0.55
+# A word stands for a MAIN_INGREDIENTS or DISH_WORDS entry with the same
+# first letter when at least VOCABULARY_MATCH alike ("panner" is paneer).
+# Words shorter than FUZZY_LENGTH ("veg", "egg") must be spelt exactly.
+VOCABULARY_MATCH = 0.7
+FUZZY_LENGTH = 4
+SHINGLE = 3
+BUCKET_COMPARISONS = 8
+PAIR_CHUNK = 200_000
+# Names that are otherwise alike but built on different main ingredients
+# ("Paneer Tikka" / "Chicken Tikka") are different dishes. "Non-Veg" is
+# normalised to the single word "nonveg".
+MAIN_INGREDIENTS = [
+    "nonveg", "chicken", "mutton", "lamb", "keema", "fish", "prawn", "crab", "egg",
+    "paneer", "veg", "subz", "mushroom", "khumbh", "dal", "aloo", "gobi", "soya", "corn", "chole", "rajma",
+]
+# Names must agree on all of these, not just differ by a missing one: the
+# bread ("Tandoori Roti" / "Tandoori Naan"), what the dish is served as
+# ("Chicken Tikka" / "Chicken Tikka Pizza", "Palak Paneer" / "Palak Paneer
+# ki Seekh") and the style that names it ("Chilli Chicken" / "Saag Chicken").
+BREADS = ["roti", "naan", "kulcha", "paratha", "bhatura", "puri", "toast", "bread", "bun"]
+FORMATS = [
+    "pizza", "roll", "biryani", "pulao", "burger", "sandwich", "wrap", "pasta", "noodles", "rice", "soup",
+    "salad", "raita", "platter", "combo", "momos", "chips", "strips", "fries", "cake", "shake", "bhel",
+    "seekh", "kebab", "tikka", "tikki",
+]
+QUALIFIERS = ["65", "chilli", "saag", "malai", "achari", "laccha", "pudina", "masala"]
+DISH_WORDS = BREADS + FORMATS + QUALIFIERS
+NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(name):
+    return NON_WORD.sub(" ", name.lower()).strip().replace("non veg", "nonveg")
+
+
+@lru_cache(maxsize=1 << 16)
+def bigrams(word):
+    padded = f" {word} "
+    return frozenset(padded[i:i + 2] for i in range(len(padded) - 1))
+
+
+def word_similarity(first, second):
+    """Dice coefficient of the two words' character bigrams."""
+    first, second = bigrams(first), bigrams(second)
+    return 2 * len(first & second) / (len(first) + len(second))
+
+
+def shingles(name):
+    padded = f" {name} "
+    grams = {padded[i:i + SHINGLE] for i in range(max(1, len(padded) - SHINGLE + 1))}
+    return [zlib.crc32(gram.encode("utf-8")) for gram in grams]
+
+
+class MinHasher:
+    """Multiply-shift hash family over 32-bit shingle hashes."""
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = np.random.default_rng(seed)
+        self.multipliers = rng.integers(1, 2 ** 63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self.offsets = rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64)
+
+    def signatures(self, names, chunk=5000):
+        """(len(names), num_perm) uint32 MinHash signatures."""
+        result = np.empty((len(names), len(self.multipliers)), dtype=np.uint32)
+        for begin in range(0, len(names), chunk):
+            grams = [shingles(name) for name in names[begin:begin + chunk]]
+            lengths = np.fromiter((len(g) for g in grams), dtype=np.int64, count=len(grams))
+            flat = np.fromiter((h for g in grams for h in g), dtype=np.uint64, count=int(lengths.sum()))
+            # Trigrams repeat across names: hash each distinct one once, then gather.
+            distinct, inverse = np.unique(flat, return_inverse=True)
+            table = ((distinct[:, None] * self.multipliers + self.offsets) >> np.uint64(32)).astype(np.uint32)
+            hashed = table[inverse]
+            starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            result[begin:begin + len(grams)] = np.minimum.reduceat(hashed, starts, axis=0)
+        return result
+
+
+class NameGuards:
+    """Per normalised name, what another name must share with it to be the same dish."""
+
+    def __init__(self, names):
+        self.words = [name.split() for name in names]
+        self.entries = {}
+        self.word_pairs = {}
+        self.by_initial = {}
+        for entry in MAIN_INGREDIENTS + DISH_WORDS:
+            self.by_initial.setdefault(entry[0], []).append(entry)
+        self.ingredients = self._masks(MAIN_INGREDIENTS)
+        self.dish_words = self._masks(DISH_WORDS)
+        self.lengths = np.fromiter((len(words) for words in self.words), dtype=np.int64, count=len(names))
+        self.short = self.lengths <= SHORT_TOKENS
+
+    def entry(self, word):
+        """The MAIN_INGREDIENTS or DISH_WORDS entry word stands for, if any, allowing for misspelling."""
+        if word not in self.entries:
+            best, best_similarity = None, VOCABULARY_MATCH
+            for entry in self.by_initial.get(word[0], ()):
+                if entry == word:
+                    best = entry
+                    break
+                if min(len(entry), len(word)) >= FUZZY_LENGTH:
+                    similarity = word_similarity(word, entry)
+                    if similarity >= best_similarity:
+                        best, best_similarity = entry, similarity
+            self.entries[word] = best
+        return self.entries[word]
+
+    def _masks(self, vocabulary):
+        bits = {entry: 1 << i for i, entry in enumerate(vocabulary)}
+        return np.fromiter((sum({bits[self.entry(w)] for w in words if self.entry(w) in bits}) for words in self.words),
+                           dtype=np.int64, count=len(self.words))
+
+    def misspelt(self, first, second):
+        """Whether the two names' words pair up in order, each pair equal or WORD_MATCH alike."""
+        return all(a == b or self._words_alike(a, b) for a, b in zip(self.words[first], self.words[second]))
+
+    def _words_alike(self, a, b):
+        if (a, b) not in self.word_pairs:
+            self.word_pairs[a, b] = min(len(a), len(b)) >= FUZZY_LENGTH and word_similarity(a, b) >= WORD_MATCH
+        return self.word_pairs[a, b]
+
+    def alike(self, first, second, similarity, threshold=THRESHOLD):
+        """Which (first, second) row pairs with this estimated similarity may be the same dish."""
+        first, second, similarity = np.atleast_1d(first, second, similarity)
+        a, b = self.ingredients[first], self.ingredients[second]
+        unqualified = ((a == 0) | (b == 0)) & (similarity >= max(threshold, UNQUALIFIED_THRESHOLD))
+        guarded = ((a == b) | unqualified) & (self.dish_words[first] == self.dish_words[second])
+        limit = np.where(self.short[first] & self.short[second], max(threshold, SHORT_THRESHOLD), threshold)
+        result = guarded & (similarity >= limit)
+        typos = guarded & ~result & (similarity >= TYPO_THRESHOLD) & (self.lengths[first] == self.lengths[second])
+        for i in np.flatnonzero(typos):
+            result[i] = self.misspelt(first[i], second[i])
+        return result
+
+
+def candidate_pairs(signatures, bands=BANDS, per_bucket=BUCKET_COMPARISONS):
+    """(earlier, later) row pairs that share at least one LSH bucket.
+
+    Within a bucket each row is paired with at most per_bucket rows before it,
+    so one very common band value cannot make the work quadratic.
+    """
+    count, num_perm = signatures.shape
+    rows = num_perm // bands
+    pairs = []
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows))).ravel()
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        for offset in range(1, per_bucket + 1):
+            same = np.flatnonzero(sorted_keys[offset:] == sorted_keys[:-offset])
+            if not len(same):
+                break
+            pairs.append(np.stack([order[same], order[same + offset]], axis=1))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.concatenate(pairs)
+    # One int64 per unordered pair makes de-duplication a flat sort.
+    keys = np.minimum(pairs[:, 0], pairs[:, 1]) * count + np.maximum(pairs[:, 0], pairs[:, 1])
+    keys.sort()
+    keys = keys[np.r_[True, keys[1:] != keys[:-1]]]
+    return np.stack([keys // count, keys % count], axis=1)
+
+
+def lsh_clusters(signatures, guards=None, threshold=THRESHOLD):
+    """Cluster label per signature row, plus the number of candidate pairs compared.
+
+    Rows should be in priority order (most common spelling first). Each row
+    joins the cluster of its most similar earlier candidate, provided it would
+    also match that cluster's centre within CENTRE_SLACK, or starts a
+    cluster of its own. Clusters therefore cannot drift through a long chain
+    of slightly different names. guards is the rows' NameGuards.
+    """
+    count = len(signatures)
+    pairs = candidate_pairs(signatures)
+    # In chunks: gathering both signatures of every pair at once takes gigabytes.
+    similarity = np.concatenate([
+        (signatures[chunk[:, 0]] == signatures[chunk[:, 1]]).mean(axis=1)
+        for chunk in np.array_split(pairs, max(1, len(pairs) // PAIR_CHUNK))
+    ]) if len(pairs) else np.empty(0)
+    def alike(first, second, similarity):
+        return similarity >= threshold if guards is None else guards.alike(first, second, similarity, threshold)
+
+    keep = alike(pairs[:, 0], pairs[:, 1], similarity)
+    pairs, similarity = pairs[keep], similarity[keep]
+    # By later row, best match first.
+    pairs = pairs[np.lexsort((-similarity, pairs[:, 1]))]
+    labels = list(range(count))
+    for earlier, later in pairs.tolist():
+        if labels[later] != later:
+            continue
+        centre = labels[earlier]
+        if centre != earlier:
+            to_centre = (signatures[later] == signatures[centre]).mean() + CENTRE_SLACK
+            if not alike(later, centre, to_centre):
+                continue
+        labels[later] = centre
+    return np.array(labels), len(keep)
+
+
+def cluster_names(names, threshold=THRESHOLD, hasher=None):
+    """Cluster label per normalised name, names in priority order."""
+    signatures = (hasher or MinHasher()).signatures(names)
+    labels, _ = lsh_clusters(signatures, NameGuards(names), threshold=threshold)
+    return labels
+
+
+def cluster_dishes(frame, threshold=THRESHOLD, hasher=None):
+    """Add dish_key and cluster columns to cleaned menu rows (restaurant_name, name, price...)."""
+    frame = frame.copy()
+    frame["dish_key"] = frame["name"].map(normalize_name)
+    # Most widely used spellings first, so they become the cluster centres.
+    counts = frame.groupby("dish_key").restaurant_name.nunique()
+    names = sorted(counts.index, key=lambda name: (-counts[name], len(name), name))
+    labels = cluster_names(names, threshold, hasher)
+    frame["cluster"] = frame["dish_key"].map(dict(zip(names, labels))).astype("int64")
+    return frame
+
+
+def canonical_clusters(frame, min_restaurants=2):
+    """One row per dish cluster found at min_restaurants or more, with price spread.
+
+    The canonical name is the spelling most restaurants use, shortest first on ties.
+    """
+    spelling = (frame.groupby(["cluster", "name"]).restaurant_name.nunique().rename("restaurants")
+                .reset_index().assign(length=lambda f: f["name"].str.len())
+                .sort_values(["cluster", "restaurants", "length"], ascending=[True, False, True])
+                .drop_duplicates("cluster").set_index("cluster")["name"])
+    grouped = frame.groupby("cluster")
+    clusters = pd.DataFrame({
+        "dish": spelling,
+        "restaurants": grouped.restaurant_name.nunique(),
+        "items": grouped.size(),
+        "names": grouped["name"].agg(lambda names: " | ".join(sorted(set(names)))),
+        "min_price": grouped.price.min(),
+        "median_price": grouped.price.median(),
+        "max_price": grouped.price.max(),
+    })
+    clusters = clusters[clusters.restaurants >= min_restaurants]
+    return clusters.sort_values(["restaurants", "items"], ascending=False).reset_index()
+
+
+def load_menus(paths):
+    frames = [clean_menu(read_menu_frame(path))[0] for path in paths]
+    return pd.concat(frames, ignore_index=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cluster near-duplicate dishes across restaurants.")
+    parser.add_argument("paths", nargs="*", help="*_menu.csv files (default: all in the current directory)")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="estimated Jaccard similarity to join two names")
+    parser.add_argument("--output", help="write the clusters to this CSV")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+    paths = args.paths or sorted(glob.glob("*_menu.csv"))
+    if not paths:
+        print("No *_menu.csv files found")
+        sys.exit(1)
+    clusters = canonical_clusters(cluster_dishes(load_menus(paths), threshold=args.threshold))
+    if args.output:
+        clusters.to_csv(args.output, index=False)
+        print(f"Wrote {len(clusters)} clusters to {args.output}")
+    print(f"{'Dish':<32}{'Restaurants':>12}{'Min ₹':>8}{'Median ₹':>10}{'Max ₹':>8}  Spellings")
+    for row in clusters.head(args.top).itertuples():
+        print(f"{row.dish[:31]:<32}{row.restaurants:>12}{row.min_price:>8}{row.median_price:>10.0f}{row.max_price:>8}  {row.names}")
@@ -0,0 +1,208 @@
+import os
+import sys
+import time
+from collections import Counter
+
+# Round-trip accounting for the element-by-element path. Every WebDriver call
+# the scraper makes (find_element(s), .text, get_attribute, click, tag_name,
+# get, execute_*script, page_source) is one chromedriver round trip; wrapping
+# the driver in ProfiledDriver counts them and their latency per call site
+# (the scraper line that made the call) and per pipeline stage (the innermost
+# scrape_trace span open at the time, e.g. extract_item or discover_sections).
+#
+#   profiler = DriverProfiler()
+#   scraper = MenuScraper(restaurant, profiler=profiler)
+#   scraper.scrape()
+#   profiler.report(items=...)
+#
+# Elements found through a ProfiledDriver come back wrapped as well, so
+# chained lookups such as ancestor walks are counted too.
+
+HOT_CALLS = 20
+NO_STAGE = "-"
+
+
+def _call_site():
+    """'function file:line' of the first frame outside this module and selenium."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module != __name__ and not module.startswith("selenium"):
+            code = frame.f_code
+            return f"{code.co_name} {os.path.basename(code.co_filename)}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "?"
+
+
+class DriverProfiler:
+    def __init__(self):
+        # (stage, site, call) -> [count, total ns, max ns]
+        self.calls = {}
+        self.stack = []
+        self.stage_entries = Counter()
+
+    def wrap(self, driver):
+        if driver is None or isinstance(driver, ProfiledDriver):
+            return driver
+        return ProfiledDriver(driver, self)
+
+    def stages(self, tracer):
+        """A tracer that also tells the profiler which stage is running."""
+        return StageTracer(self, tracer)
+
+    def timed(self, call, function, *args):
+        site = _call_site()
+        start = time.perf_counter_ns()
+        try:
+            return function(*args)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            key = (self.stack[-1] if self.stack else NO_STAGE, site, call)
+            entry = self.calls.get(key)
+            if entry is None:
+                self.calls[key] = [1, elapsed, elapsed]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed
+                if elapsed > entry[2]:
+                    entry[2] = elapsed
+
+    def total_calls(self):
+        return sum(entry[0] for entry in self.calls.values())
+
+    def hot_calls(self, top=HOT_CALLS):
+        """[{call, site, stage, count, total_ms, mean_ms, max_ms}], most total time first."""
+        rows = [{"call": call, "site": site, "stage": stage, "count": count, "total_ms": total / 1e6,
+                 "mean_ms": total / count / 1e6, "max_ms": longest / 1e6}
+                for (stage, site, call), (count, total, longest) in self.calls.items()]
+        rows.sort(key=lambda row: -row["total_ms"])
+        return rows[:top] if top else rows
+
+    def stage_rows(self):
+        """[{stage, entries, count, total_ms}] per pipeline stage, most total time first."""
+        stages = {}
+        for (stage, _, _), (count, total, _) in self.calls.items():
+            row = stages.setdefault(stage, {"stage": stage, "entries": self.stage_entries.get(stage, 0),
+                                            "count": 0, "total_ms": 0.0})
+            row["count"] += count
+            row["total_ms"] += total / 1e6
+        return sorted(stages.values(), key=lambda row: -row["total_ms"])
+
+    def report(self, top=HOT_CALLS, items=None):
+        total = self.total_calls()
+        total_ms = sum(entry[1] for entry in self.calls.values()) / 1e6
+        per_item = f", {total / items:.1f} per item over {items} items" if items else ""
+        print(f"\nWebDriver round trips: {total} calls, {total_ms:.1f} ms{per_item}")
+        if not total:
+            return
+        print(f"\n{'Calls':>7}{'Per item':>10}{'Total ms':>11}{'Mean ms':>10}  {'Call':<20}{'Stage':<20}Site")
+        for row in self.hot_calls(top):
+            share = f"{row['count'] / items:.2f}" if items else "-"
+            print(f"{row['count']:>7}{share:>10}{row['total_ms']:>11.1f}{row['mean_ms']:>10.3f}  "
+                  f"{row['call']:<20}{row['stage']:<20}{row['site']}")
+        print(f"\n{'Stage':<22}{'Entries':>8}{'Calls':>8}{'Per entry':>11}{'Total ms':>11}")
+        for row in self.stage_rows():
+            per_entry = f"{row['count'] / row['entries']:.1f}" if row["entries"] else "-"
+            print(f"{row['stage']:<22}{row['entries']:>8}{row['count']:>8}{per_entry:>11}{row['total_ms']:>11.1f}")
+
+
+class StageTracer:
+    def __init__(self, profiler, tracer):
+        self.profiler = profiler
+        self.tracer = tracer
+        self.enabled = tracer.enabled
+
+    def span(self, name, **args):
+        return _StageSpan(self.profiler, name, self.tracer.span(name, **args))
+
+    def instant(self, name, **args):
+        self.tracer.instant(name, **args)
+
+
+class _StageSpan:
+    __slots__ = ("profiler", "name", "span")
+
+    def __init__(self, profiler, name, span):
+        self.profiler = profiler
+        self.name = name
+        self.span = span
+
+    def __enter__(self):
+        self.profiler.stack.append(self.name)
+        self.profiler.stage_entries[self.name] += 1
+        return self.span.__enter__()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.stack.pop()
+        return self.span.__exit__(exc_type, exc, tb)
+
+
+class ProfiledElement:
+    __slots__ = ("element", "profiler")
+
+    def __init__(self, element, profiler):
+        self.element = element
+        self.profiler = profiler
+
+    def __eq__(self, other):
+        return self.element == getattr(other, "element", other)
+
+    def __hash__(self):
+        return hash(self.element)
+
+    def __getattr__(self, name):
+        return getattr(self.element, name)
+
+    @property
+    def text(self):
+        return self.profiler.timed("text", lambda: self.element.text)
+
+    @property
+    def tag_name(self):
+        return self.profiler.timed("tag_name", lambda: self.element.tag_name)
+
+    def get_attribute(self, name):
+        return self.profiler.timed("get_attribute", self.element.get_attribute, name)
+
+    def click(self):
+        return self.profiler.timed("click", self.element.click)
+
+    def find_element(self, *args, **kwargs):
+        return ProfiledElement(self.profiler.timed("find_element", lambda: self.element.find_element(*args, **kwargs)),
+                               self.profiler)
+
+    def find_elements(self, *args, **kwargs):
+        found = self.profiler.timed("find_elements", lambda: self.element.find_elements(*args, **kwargs))
+        return [ProfiledElement(element, self.profiler) for element in found]
+
+
+class ProfiledDriver:
+    """Pass-through WebDriver proxy that records each round trip in a DriverProfiler."""
+
+    def __init__(self, driver, profiler):
+        self.driver = driver
+        self.profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+    @property
+    def page_source(self):
+        return self.profiler.timed("page_source", lambda: self.driver.page_source)
+
+    def get(self, url):
+        return self.profiler.timed("get", self.driver.get, url)
+
+    def execute_script(self, script, *args):
+        return self.profiler.timed("execute_script", lambda: self.driver.execute_script(script, *args))
+
+    def execute_async_script(self, script, *args):
+        return self.profiler.timed("execute_async_script", lambda: self.driver.execute_async_script(script, *args))
+
+    def find_element(self, *args, **kwargs):
+        return ProfiledElement(self.profiler.timed("find_element", lambda: self.driver.find_element(*args, **kwargs)),
+                               self.profiler)
+
+    def find_elements(self, *args, **kwargs):
+        found = self.profiler.timed("find_elements", lambda: self.driver.find_elements(*args, **kwargs))
+        return [ProfiledElement(element, self.profiler) for element in found]
@@ -0,0 +1,197 @@
+import os
+import json
+import time
+from contextlib import contextmanager
+import psutil
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "zomato-menu-scraper")
+DRIVER_CACHE_FILE = os.path.join(CACHE_DIR, "chromedriver.json")
+DRIVER_CACHE_MAX_AGE_DAYS = 7
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Page-load profiles. "default" is what the scrapers always used. "lean" skips
+# everything that is not needed to read menu text: images, fonts, media and
+# third-party analytics/ad hosts are blocked through CDP, and driver.get()
+# returns at DOMContentLoaded (the readiness waits cover the rest). SVG is left
+# alone because the veg/non-veg markers are SVG icons.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*googleadservices.com*", "*facebook.net*",
+    "*connect.facebook.*", "*hotjar.com*", "*clarity.ms*", "*branch.io*",
+    "*nr-data.net*", "*newrelic.com*", "*amplitude.com*", "*segment.io*",
+    "*criteo.*", "*taboola.com*", "*moengage.com*",
+]
+
+LOAD_PROFILES = {
+    "default": {
+        "page_load_strategy": "normal",
+        "block_images": False,
+        "blocked_urls": [],
+    },
+    "lean": {
+        "page_load_strategy": "eager",
+        "block_images": True,
+        "blocked_urls": BLOCKED_URL_PATTERNS,
+    },
+}
+
+
+def resolve_chromedriver(max_age_days=DRIVER_CACHE_MAX_AGE_DAYS):
+    """Return a chromedriver path, calling ChromeDriverManager only when the cached one is stale."""
+    try:
+        with open(DRIVER_CACHE_FILE, encoding="utf-8") as f:
+            cached = json.load(f)
+        fresh = time.time() - cached["resolved_at"] < max_age_days * 86400
+        if fresh and os.access(cached["path"], os.X_OK):
+            return cached["path"]
+    except (OSError, ValueError, KeyError):
+        pass
+    path = ChromeDriverManager().install()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{DRIVER_CACHE_FILE}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"path": path, "resolved_at": time.time()}, f)
+    os.replace(tmp_path, DRIVER_CACHE_FILE)
+    return path
+
+
+def build_driver(extra_arguments=(), profile="default"):
+    settings = LOAD_PROFILES[profile]
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    for argument in extra_arguments:
+        options.add_argument(argument)
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument(f"user-agent={USER_AGENT}")
+    options.page_load_strategy = settings["page_load_strategy"]
+    if settings["block_images"]:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    driver = webdriver.Chrome(service=Service(resolve_chromedriver()), options=options)
+    if settings["blocked_urls"]:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": settings["blocked_urls"]})
+    return driver
+
+
+def browser_rss_mb(driver):
+    """Resident memory of chromedriver plus every Chrome process it started."""
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+    except (AttributeError, psutil.Error):
+        return 0.0
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            pass
+    return total / (1024 * 1024)
+
+
+def reset_session(driver):
+    """Drop cookies, storage and cache so the next restaurant starts from a clean browser state."""
+    try:
+        origin = driver.execute_script("return window.location.origin")
+        if origin and origin != "null":
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+    except Exception as e:
+        print(f"Could not clear page storage: {e}")
+    driver.delete_all_cookies()
+    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    driver.get("about:blank")
+
+
+class BrowserSession:
+    def __init__(self, driver, arguments=()):
+        self.driver = driver
+        self.arguments = arguments
+        self.pages = 0
+        self.started = time.time()
+
+
+class SessionManager:
+    """Pool of warm Chrome sessions reused across restaurant pages.
+
+    A session is recycled (quit and replaced on next acquire) once it has
+    served max_pages pages or its browser RSS exceeds max_rss_mb. Sessions
+    are only reused for the same Chrome arguments (a restaurant's
+    chrome_arguments on top of the manager's extra_arguments).
+    """
+
+    def __init__(self, max_pages=50, max_rss_mb=1500, extra_arguments=(), profile="default"):
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.extra_arguments = tuple(extra_arguments)
+        self.profile = profile
+        self.idle = []
+        self.stats = {"started": 0, "reused": 0, "recycled": 0}
+
+    @contextmanager
+    def session(self, extra_arguments=()):
+        session = self.acquire(extra_arguments)
+        healthy = False
+        try:
+            yield session.driver
+            healthy = True
+        finally:
+            self.release(session, healthy)
+
+    def acquire(self, extra_arguments=()):
+        arguments = self.extra_arguments + tuple(extra_arguments)
+        for session in reversed(self.idle):
+            if session.arguments == arguments:
+                self.idle.remove(session)
+                self.stats["reused"] += 1
+                return session
+        # Idle browsers started with other arguments are quit rather than kept
+        # alongside the new one.
+        while self.idle:
+            print("Recycling browser session (different Chrome arguments)")
+            self.stats["recycled"] += 1
+            self._quit(self.idle.pop())
+        self.stats["started"] += 1
+        return BrowserSession(build_driver(arguments, self.profile), arguments)
+
+    def release(self, session, healthy=True):
+        session.pages += 1
+        reason = None
+        if not healthy:
+            reason = "error during page"
+        elif session.pages >= self.max_pages:
+            reason = f"served {session.pages} pages"
+        else:
+            rss = browser_rss_mb(session.driver)
+            if rss > self.max_rss_mb:
+                reason = f"RSS {rss:.0f} MB over {self.max_rss_mb} MB"
+        if reason is None:
+            try:
+                reset_session(session.driver)
+                self.idle.append(session)
+                return
+            except Exception as e:
+                reason = f"reset failed: {e}"
+        print(f"Recycling browser session ({reason})")
+        self.stats["recycled"] += 1
+        self._quit(session)
+
+    def close(self):
+        while self.idle:
+            self._quit(self.idle.pop())
+
+    def _quit(self, session):
+        try:
+            session.driver.quit()
+        except Exception:
+            pass
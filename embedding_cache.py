@@ -0,0 +1,131 @@
+import sys
+import sqlite3
+import argparse
+import numpy as np
+from menu_fingerprint import text_hash
+
+# On-disk cache of item embeddings, addressed by content: the key is a hash of
+# the encoder version and the whitespace-normalised item text. Rebuilding the
+# index after a re-scrape only encodes items whose text (or encoder) changed;
+# every other vector is read back from here.
+#
+#   cache = EmbeddingCache()
+#   build_index(..., cache=cache)   # also evicts this version's vectors no current item uses
+#
+# Vectors of other encoder versions are kept, so switching encoders back and
+# forth stays cheap; `python embedding_cache.py clear --version V` drops them.
+
+CACHE_PATH = "embedding_cache.db"
+LOOKUP_CHUNK = 500
+
+
+def cache_key(version, text):
+    return bytes.fromhex(text_hash(f"{version}\n{text}"))
+
+
+class EmbeddingCache:
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS vectors (
+                key BLOB PRIMARY KEY,
+                version TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS vectors_version ON vectors (version)")
+        self.used = set()
+        self.stats = {"hits": 0, "misses": 0, "encoded": 0, "evicted": 0}
+
+    def hit_rate(self):
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+    def lookup(self, keys):
+        """{key: float32 vector} for the keys already cached."""
+        found = {}
+        for start in range(0, len(keys), LOOKUP_CHUNK):
+            chunk = keys[start:start + LOOKUP_CHUNK]
+            rows = self.conn.execute(
+                f"SELECT key, vector FROM vectors WHERE key IN ({', '.join('?' * len(chunk))})", chunk)
+            for key, vector in rows:
+                found[key] = np.frombuffer(vector, dtype=np.float32)
+        return found
+
+    def store(self, version, keys, vectors):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO vectors (key, version, dim, vector) VALUES (?, ?, ?, ?)",
+                ((key, version, vectors.shape[1], vector.tobytes()) for key, vector in zip(keys, vectors)))
+
+    def encode(self, encoder, texts):
+        """Vectors for texts, encoding only those missing from the cache."""
+        keys = [cache_key(encoder.version, text) for text in texts]
+        self.used.update(keys)
+        found = self.lookup(list(set(keys)))
+        missing = [i for i, key in enumerate(keys) if key not in found]
+        self.stats["hits"] += len(keys) - len(missing)
+        self.stats["misses"] += len(missing)
+        if missing:
+            # Identical texts in one batch are encoded once.
+            pending = {}
+            for i in missing:
+                pending.setdefault(keys[i], texts[i])
+            encoded = encoder.encode(list(pending.values()))
+            self.stats["encoded"] += len(pending)
+            self.store(encoder.version, list(pending), encoded)
+            found.update(zip(pending, encoded))
+        return np.vstack([found[key] for key in keys]).astype(np.float32, copy=False)
+
+    def batches(self, encoder, texts, batch_size):
+        """Drop-in for menu_index.encode_batches that goes through the cache."""
+        for start in range(0, len(texts), batch_size):
+            yield self.encode(encoder, texts[start:start + batch_size])
+
+    def evict_orphans(self, version):
+        """Delete vectors of this encoder version not used since this cache was opened."""
+        with self.conn:
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS used (key BLOB PRIMARY KEY) WITHOUT ROWID")
+            self.conn.execute("DELETE FROM used")
+            self.conn.executemany("INSERT INTO used (key) VALUES (?)", ((key,) for key in self.used))
+            evicted = self.conn.execute(
+                "DELETE FROM vectors WHERE version = ? AND key NOT IN (SELECT key FROM used)", (version,)).rowcount
+        self.stats["evicted"] += evicted
+        return evicted
+
+    def clear(self, version=None):
+        """Delete every vector, or every vector of one encoder version; returns how many."""
+        with self.conn:
+            if version is None:
+                removed = self.conn.execute("DELETE FROM vectors").rowcount
+            else:
+                removed = self.conn.execute("DELETE FROM vectors WHERE version = ?", (version,)).rowcount
+        self.conn.execute("VACUUM")
+        return removed
+
+    def summary(self):
+        """[(version, dim, vectors)] currently held."""
+        return self.conn.execute(
+            "SELECT version, dim, COUNT(*) FROM vectors GROUP BY version, dim ORDER BY version").fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Content-addressed embedding cache.")
+    parser.add_argument("command", choices=["stats", "clear"])
+    parser.add_argument("--cache", default=CACHE_PATH)
+    parser.add_argument("--version", help="clear only this encoder version (as listed by stats)")
+    args = parser.parse_args()
+    cache = EmbeddingCache(args.cache)
+    if args.command == "clear":
+        removed = cache.clear(args.version)
+        print(f"Removed {removed} {args.version + ' ' if args.version else ''}vectors from {args.cache}")
+        sys.exit(0)
+    for version, dim, count in cache.summary():
+        print(f"{version:<40}{dim:>6} dims{count:>10} vectors")
@@ -0,0 +1,167 @@
+import os
+import re
+import sys
+import time
+from lxml import etree, html as lxml_html
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+from page_waits import NoWait
+
+# Offline extraction: the rendered page source is saved once and the engine's
+# element-by-element extraction is re-run against it through SnapshotDriver,
+# which answers the small part of the Selenium API it uses from an lxml tree.
+
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "body", "dd", "details", "dialog", "div",
+    "dl", "dt", "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3",
+    "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section",
+    "summary", "table", "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+}
+SKIPPED_TAGS = {"head", "script", "style", "noscript", "template", "title", "meta", "link"}
+LINE_BREAK = "\x00"
+HIDDEN_STYLE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden")
+
+
+def _is_hidden(node):
+    if node.get("hidden") is not None:
+        return True
+    return bool(HIDDEN_STYLE.search(node.get("style", "")))
+
+
+def render_text(node):
+    """Approximate WebElement.text: visible text, one line per block element."""
+    parts = []
+
+    def walk(el):
+        if not isinstance(el.tag, str) or el.tag in SKIPPED_TAGS or _is_hidden(el):
+            return
+        block = el.tag in BLOCK_TAGS
+        if block:
+            parts.append(LINE_BREAK)
+        if el.tag == "br":
+            parts.append(LINE_BREAK)
+        if el.text:
+            parts.append(el.text)
+        for child in el:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append(LINE_BREAK)
+
+    walk(node)
+    lines = (" ".join(line.split()) for line in "".join(parts).split(LINE_BREAK))
+    return "\n".join(line for line in lines if line)
+
+
+def _to_xpath(by, value, relative):
+    if by == By.XPATH:
+        return value
+    if by == By.TAG_NAME:
+        return f".//{value}" if relative else f"//{value}"
+    raise ValueError(f"Unsupported locator for HTML snapshots: {by}")
+
+
+class SnapshotElement:
+    def __init__(self, node):
+        self.node = node
+
+    def __eq__(self, other):
+        return isinstance(other, SnapshotElement) and self.node is other.node
+
+    def __hash__(self):
+        return id(self.node)
+
+    @property
+    def text(self):
+        return render_text(self.node)
+
+    @property
+    def tag_name(self):
+        return self.node.tag.lower()
+
+    def get_attribute(self, name):
+        return self.node.get(name)
+
+    def click(self):
+        pass
+
+    def find_elements(self, by=By.ID, value=None):
+        return _select(self.node, _to_xpath(by, value, relative=True))
+
+    def find_element(self, by=By.ID, value=None):
+        return _first(self.find_elements(by, value), value)
+
+
+class SnapshotDriver:
+    def __init__(self, page_source):
+        self.page_source = page_source
+        self.root = lxml_html.document_fromstring(page_source)
+
+    def find_elements(self, by=By.ID, value=None):
+        return _select(self.root, _to_xpath(by, value, relative=False))
+
+    def find_element(self, by=By.ID, value=None):
+        return _first(self.find_elements(by, value), value)
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        pass
+
+
+def _select(node, xpath):
+    try:
+        result = node.xpath(xpath)
+    except etree.XPathError as e:
+        raise ValueError(f"Invalid XPath {xpath!r}: {e}")
+    if not isinstance(result, list):
+        return []
+    return [SnapshotElement(n) for n in result if isinstance(n, etree._Element) and isinstance(n.tag, str)]
+
+
+def _first(elements, value):
+    if not elements:
+        raise NoSuchElementException(f"Unable to locate element: {value}")
+    return elements[0]
+
+
+def save_snapshot(driver, path):
+    page_source = driver.page_source
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(page_source)
+    print(f"Page snapshot saved to {path}")
+    return page_source
+
+
+def snapshot_scraper(scraper_cls, page_source):
+    """scraper_cls is anything that builds a scraper from driver=, e.g. partial(MenuScraper, restaurant)."""
+    scraper = scraper_cls(driver=SnapshotDriver(page_source))
+    scraper.waiter = NoWait()
+    scraper.extract_menu()
+    return scraper
+
+
+def parse_snapshot(scraper_cls, page_source):
+    """Rebuild menu_data from saved HTML using the element-by-element path."""
+    return snapshot_scraper(scraper_cls, page_source).menu_data
+
+
+if __name__ == "__main__":
+    # python html_snapshot.py tamasha snapshots/tamasha_menu.html
+    from functools import partial
+    from menu_engine import MenuScraper, load_restaurant
+
+    if len(sys.argv) != 3:
+        print("Usage: python html_snapshot.py <restaurant_key> <snapshot.html>")
+        sys.exit(1)
+    with open(sys.argv[2], encoding="utf-8") as f:
+        page_source = f.read()
+    start = time.perf_counter()
+    scraper = snapshot_scraper(partial(MenuScraper, load_restaurant(sys.argv[1])), page_source)
+    elapsed = time.perf_counter() - start
+    scraper.save_data()
+    total_items = sum(len(items) for items in scraper.menu_data.values())
+    print(f"Parsed {total_items} items in {len(scraper.menu_data)} categories in {elapsed * 1000:.1f} ms")
@@ -0,0 +1,218 @@
+import os
+import re
+import sys
+import json
+import time
+import argparse
+from urllib.parse import urlsplit, quote
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import requests
+from driver_session import USER_AGENT
+
+# Browserless fast path: the order page ships its data as a preloaded Redux
+# state (window.__PRELOADED_STATE__ = JSON.parse("...")), and the same page
+# data is served as JSON by /webroutes/getPage. Either is read straight into
+# the scrapers' menu_data shape; the Selenium path is only needed when both fail.
+
+HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "en-US,en;q=0.9",
+}
+PRELOADED_STATE = re.compile(r"window\.__PRELOADED_STATE__\s*=\s*JSON\.parse\((\".*?(?<!\\)\")\)\s*;", re.S)
+PRELOADED_OBJECT = re.compile(r"window\.__PRELOADED_STATE__\s*=\s*(?=\{)")
+VEG_SLUGS = {"veg": "Veg", "non-veg": "Non-Veg", "egg": "Non-Veg"}
+
+
+class FastPathUnavailable(Exception):
+    pass
+
+
+def parse_preloaded_state(page_source):
+    match = PRELOADED_STATE.search(page_source)
+    if match:
+        return json.loads(json.loads(match.group(1)))
+    match = PRELOADED_OBJECT.search(page_source)
+    if match:
+        state, _ = json.JSONDecoder().raw_decode(page_source, match.end())
+        return state
+    raise FastPathUnavailable("no __PRELOADED_STATE__ in page")
+
+
+def find_menus(node):
+    """Depth-first search for the order page's list of menus (each with categories of items)."""
+    if isinstance(node, dict):
+        menus = node.get("menus")
+        if isinstance(menus, list) and any(isinstance(m, dict) and "menu" in m for m in menus):
+            return menus
+        children = node.values()
+    elif isinstance(node, list):
+        children = node
+    else:
+        return None
+    for child in children:
+        found = find_menus(child)
+        if found:
+            return found
+    return None
+
+
+def expect(value, kind, what):
+    """value, or FastPathUnavailable when the page state has a different shape than expected."""
+    if not isinstance(value, kind):
+        raise FastPathUnavailable(f"{what} is {type(value).__name__}, expected {kind.__name__}")
+    return value
+
+
+def text(value, what):
+    return expect(value or "", str, what).strip()
+
+
+def format_price(item):
+    for key in ("display_price", "price", "min_price", "default_price"):
+        value = item.get(key)
+        if value in (None, "", 0):
+            continue
+        if isinstance(value, str):
+            return value if value.startswith("₹") else f"₹{value}"
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise FastPathUnavailable(f"item {key} is {type(value).__name__}")
+        return f"₹{int(value) if float(value).is_integer() else value}"
+    return ""
+
+
+def veg_status(item):
+    slugs = expect(item.get("dietary_slugs") or item.get("tag_slugs") or [], list, "item slugs")
+    for slug in slugs:
+        if isinstance(slug, str) and slug in VEG_SLUGS:
+            return VEG_SLUGS[slug]
+    return "Unknown"
+
+
+def menu_from_state(state, item_defaults):
+    menus = find_menus(state)
+    if not menus:
+        raise FastPathUnavailable("no menu list in page state")
+    menu_data = {}
+    for menu_entry in menus:
+        menu = expect(expect(menu_entry, dict, "menu entry").get("menu", {}), dict, "menu")
+        for category_entry in expect(menu.get("categories", []), list, "menu categories"):
+            category_entry = expect(category_entry, dict, "category entry")
+            category = expect(category_entry.get("category", category_entry), dict, "category")
+            name = text(category.get("name") or menu.get("name") or "Menu Items", "category name")
+            items = menu_data.setdefault(name, [])
+            for item_entry in expect(category.get("items", []), list, "category items"):
+                item_entry = expect(item_entry, dict, "item entry")
+                source = expect(item_entry.get("item", item_entry), dict, "item")
+                item = dict(item_defaults)
+                item["name"] = text(source.get("name"), "item name")
+                item["description"] = text(source.get("desc") or source.get("description"), "item description")
+                item["price"] = format_price(source)
+                item["veg_status"] = veg_status(source)
+                if "image_url" in item:
+                    item["image_url"] = text(source.get("item_image_url") or source.get("item_image_thumb_url"),
+                                             "item image")
+                if item["name"]:
+                    items.append(item)
+    menu_data = {name: items for name, items in menu_data.items() if items}
+    if not menu_data:
+        raise FastPathUnavailable("page state has no menu items")
+    return menu_data
+
+
+def page_json_url(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}/webroutes/getPage?page_url={quote(parts.path)}&location=&isMobile=0"
+
+
+def fetch_menu_over_http(url, item_defaults, session=None, timeout=10):
+    """Return menu_data for an order page using plain HTTP, or raise FastPathUnavailable."""
+    http = session or requests
+    errors = []
+    try:
+        response = http.get(url, headers=HEADERS, timeout=timeout)
+        response.raise_for_status()
+        return menu_from_state(parse_preloaded_state(response.text), item_defaults)
+    except (requests.RequestException, ValueError, FastPathUnavailable) as e:
+        errors.append(f"page: {e}")
+    try:
+        response = http.get(page_json_url(url), headers=HEADERS, timeout=timeout)
+        response.raise_for_status()
+        return menu_from_state(response.json(), item_defaults)
+    except (requests.RequestException, ValueError, FastPathUnavailable) as e:
+        errors.append(f"page JSON: {e}")
+    raise FastPathUnavailable("; ".join(errors))
+
+
+def recording_path(directory, url):
+    parts = urlsplit(url)
+    name = (parts.path.strip("/") or "index").replace("/", "__")
+    if parts.query:
+        name += "__" + re.sub(r"[^A-Za-z0-9_.-]", "_", parts.query)
+    return os.path.join(directory, name + ".html")
+
+
+def record_pages(urls, directory):
+    os.makedirs(directory, exist_ok=True)
+    for url in urls:
+        for target in (url, page_json_url(url)):
+            response = requests.get(target, headers=HEADERS, timeout=10)
+            path = recording_path(directory, target)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(response.text)
+            print(f"{response.status_code} {target} -> {path}")
+
+
+class RecordedPageHandler(SimpleHTTPRequestHandler):
+    """Serves pages saved by record_pages() back under their original paths."""
+
+    recordings = "recordings"
+
+    def do_GET(self):
+        path = recording_path(self.recordings, f"http://localhost{self.path}")
+        if not os.path.exists(path):
+            self.send_error(404, "No recording for this URL")
+            return
+        with open(path, "rb") as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve_recordings(directory, port=8765):
+    handler = type("Handler", (RecordedPageHandler,), {"recordings": directory})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    print(f"Serving recordings from {directory} on http://127.0.0.1:{port}")
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Read Zomato menus over plain HTTP.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    fetch = commands.add_parser("fetch", help="print the menu read from an order page URL")
+    fetch.add_argument("url")
+    record = commands.add_parser("record", help="save order pages (and their page JSON) for offline use")
+    record.add_argument("urls", nargs="+")
+    record.add_argument("--dir", default="recordings")
+    serve = commands.add_parser("serve", help="serve recorded pages on a local stand-in server")
+    serve.add_argument("--dir", default="recordings")
+    serve.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    if args.command == "fetch":
+        start = time.perf_counter()
+        defaults = {"name": "", "description": "", "price": "", "veg_status": "Unknown"}
+        try:
+            menu_data = fetch_menu_over_http(args.url, defaults)
+        except FastPathUnavailable as e:
+            print(f"Fast path unavailable: {e}")
+            sys.exit(1)
+        elapsed = time.perf_counter() - start
+        print(json.dumps(menu_data, indent=4, ensure_ascii=False))
+        total_items = sum(len(items) for items in menu_data.values())
+        print(f"{total_items} items in {len(menu_data)} categories in {elapsed * 1000:.0f} ms")
+    elif args.command == "record":
+        record_pages(args.urls, args.dir)
+    else:
+        serve_recordings(args.dir, args.port).serve_forever()
@@ -0,0 +1,310 @@
+import re
+import sys
+import time
+import sqlite3
+import argparse
+from restaurant_config import restaurants_by_output, load_restaurant
+
+# Local SQLite catalog of every scraped menu: restaurants, categories and
+# items in their own tables, B-tree indexes for the structured filters and an
+# FTS5 index over item name and description. A full re-scrape of a restaurant
+# is upserted in one transaction; items it no longer lists are removed. An
+# item is identified by its position within its category, so repeated rows
+# (the same dish listed twice, with and without a description) are all kept.
+#
+# menu_store (pandas and pyarrow) is only imported by the functions that read
+# scraper outputs, so querying the catalog starts in milliseconds.
+
+CATALOG_PATH = "menu_catalog.db"
+# Bumped when the item identity changes; an older catalog is dropped and
+# rebuilt by the next load.
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS restaurants (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    location TEXT NOT NULL DEFAULT '',
+    hours TEXT NOT NULL DEFAULT '',
+    contact TEXT NOT NULL DEFAULT '',
+    loaded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY,
+    restaurant_id INTEGER NOT NULL REFERENCES restaurants(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    load_id INTEGER NOT NULL,
+    UNIQUE (restaurant_id, name)
+);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    restaurant_id INTEGER NOT NULL REFERENCES restaurants(id) ON DELETE CASCADE,
+    category_id INTEGER NOT NULL REFERENCES categories(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    price INTEGER,
+    veg_status TEXT NOT NULL DEFAULT 'Unknown' CHECK (veg_status IN ('Unknown', 'Veg', 'Non-Veg')),
+    position INTEGER NOT NULL,
+    load_id INTEGER NOT NULL,
+    UNIQUE (restaurant_id, category_id, position)
+);
+CREATE INDEX IF NOT EXISTS items_price ON items (price);
+CREATE INDEX IF NOT EXISTS items_veg_price ON items (veg_status, price);
+CREATE INDEX IF NOT EXISTS items_restaurant ON items (restaurant_id, category_id, position);
+CREATE INDEX IF NOT EXISTS restaurants_location ON restaurants (location COLLATE NOCASE);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5 (
+    name, description,
+    content = 'items', content_rowid = 'id',
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+CREATE TRIGGER IF NOT EXISTS items_fts_insert AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts (rowid, name, description) VALUES (new.id, new.name, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS items_fts_delete AFTER DELETE ON items BEGIN
+    INSERT INTO items_fts (items_fts, rowid, name, description) VALUES ('delete', old.id, old.name, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS items_fts_update AFTER UPDATE OF name, description ON items BEGIN
+    INSERT INTO items_fts (items_fts, rowid, name, description) VALUES ('delete', old.id, old.name, old.description);
+    INSERT INTO items_fts (rowid, name, description) VALUES (new.id, new.name, new.description);
+END;
+"""
+
+UPSERT_ITEM = """
+INSERT INTO items (restaurant_id, category_id, name, description, price, veg_status, position, load_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (restaurant_id, category_id, position) DO UPDATE SET
+    name = excluded.name,
+    description = excluded.description,
+    price = excluded.price,
+    veg_status = excluded.veg_status,
+    load_id = excluded.load_id
+WHERE items.name IS NOT excluded.name
+   OR items.description IS NOT excluded.description
+   OR items.price IS NOT excluded.price
+   OR items.veg_status IS NOT excluded.veg_status
+   OR items.load_id IS NOT excluded.load_id
+"""
+
+
+def connect(path=CATALOG_PATH):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA foreign_keys = ON")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.executescript("""
+            DROP TABLE IF EXISTS items_fts; DROP TABLE IF EXISTS items;
+            DROP TABLE IF EXISTS categories; DROP TABLE IF EXISTS restaurants;
+        """)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def upsert_restaurant(conn, key, info, items, load_id):
+    """Replace one restaurant's menu with `items` (an Arrow table from menu_store.to_items).
+
+    Returns (items stored, items removed).
+    """
+    conn.execute("""
+        INSERT INTO restaurants (key, name, location, hours, contact, loaded_at) VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (key) DO UPDATE SET name = excluded.name, location = excluded.location,
+            hours = excluded.hours, contact = excluded.contact, loaded_at = excluded.loaded_at
+    """, (key, info["name"], info["location"], info["hours"], info["contact"], time.time()))
+    restaurant_id = conn.execute("SELECT id FROM restaurants WHERE key = ?", (key,)).fetchone()[0]
+
+    categories = items["category"].combine_chunks().dictionary.to_pylist()
+    conn.executemany("""
+        INSERT INTO categories (restaurant_id, name, load_id) VALUES (?, ?, ?)
+        ON CONFLICT (restaurant_id, name) DO UPDATE SET load_id = excluded.load_id
+    """, [(restaurant_id, name, load_id) for name in categories])
+    category_ids = dict(conn.execute("SELECT name, id FROM categories WHERE restaurant_id = ?", (restaurant_id,)))
+
+    columns = items.to_pydict()
+    positions = {}
+    rows = []
+    for category, name, description, price, veg_status in zip(
+            columns["category"], columns["name"], columns["description"], columns["price"], columns["veg_status"]):
+        position = positions[category] = positions.get(category, -1) + 1
+        rows.append((restaurant_id, category_ids[category], name, description, price, veg_status, position, load_id))
+    conn.executemany(UPSERT_ITEM, rows)
+    removed = conn.execute("DELETE FROM items WHERE restaurant_id = ? AND load_id != ?",
+                           (restaurant_id, load_id)).rowcount
+    conn.execute("DELETE FROM categories WHERE restaurant_id = ? AND load_id != ?", (restaurant_id, load_id))
+    stored = conn.execute("SELECT COUNT(*) FROM items WHERE restaurant_id = ?", (restaurant_id,)).fetchone()[0]
+    return stored, removed
+
+
+def bulk_load(conn, menus):
+    """Upsert several restaurants in a single transaction.
+
+    menus is an iterable of (key, info, items) where info has name, location,
+    hours and contact, and items comes from menu_store.to_items(). Returns
+    {key: (items stored, items removed)}.
+    """
+    load_id = time.time_ns()
+    loaded = {}
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for key, info, items in menus:
+            loaded[key] = upsert_restaurant(conn, key, info, items, load_id)
+    conn.execute("PRAGMA optimize")
+    return loaded
+
+
+def menus_from_outputs(directory="."):
+    """(key, info, items) for every *_menu.csv / *_menu.json in directory."""
+    from menu_store import find_sources, read_menu_csv, read_menu_json, to_items
+
+    configs = restaurants_by_output()
+    for output, path in find_sources(directory).items():
+        config = configs.get(output)
+        key = config["key"] if config else output[:-len("_menu")]
+        if path.endswith(".csv"):
+            table = read_menu_csv(path)
+            if not len(table) and not config:
+                continue
+            info = config["restaurant_info"] if not len(table) else {
+                "name": table["restaurant_name"][0].as_py(), "location": table["location"][0].as_py(),
+                "hours": table["hours"][0].as_py(), "contact": table["contact"][0].as_py(),
+            }
+        elif config:
+            info = config["restaurant_info"]
+            table = read_menu_json(path, info)
+        else:
+            continue
+        yield key, info, to_items(table)
+
+
+def menu_from_scrape(key, menu_data):
+    """(key, info, items) for a scraper's in-memory menu_data."""
+    from menu_store import menu_table, to_items
+
+    info = load_restaurant(key)["restaurant_info"]
+    return key, info, to_items(menu_table(menu_data, info))
+
+
+QUESTION_VEG = re.compile(r"\b(non[- ]?veg|veg(?:etarian)?)\b", re.I)
+QUESTION_MAX_PRICE = re.compile(r"\b(?:under|below|less than|upto|up to|within)\s*(?:₹|rs\.?|inr)?\s*(\d+)", re.I)
+QUESTION_MIN_PRICE = re.compile(r"\b(?:over|above|more than)\s*(?:₹|rs\.?|inr)?\s*(\d+)", re.I)
+# "in Connaught Place" and "at Punjab Grill" read the same, so a location
+# filter also matches restaurant names.
+QUESTION_LOCATION = re.compile(r"\b(?:in|at|near)\s+([A-Z][\w.]*(?:\s+[A-Z][\w.]*)*)")
+STOP_WORDS = {"a", "an", "the", "and", "or", "with", "for", "of", "dish", "dishes", "food", "something", "some", "me",
+              "show", "find", "any", "options", "option", "items", "item"}
+
+
+def parse_question(question):
+    """Split "veg paneer under ₹400 in Connaught Place" into search text and filters."""
+    filters = {}
+    text = question
+    match = QUESTION_VEG.search(text)
+    if match:
+        filters["veg_status"] = "Non-Veg" if match.group(1).lower().startswith("non") else "Veg"
+        text = text[:match.start()] + " " + text[match.end():]
+    for pattern, field in ((QUESTION_MAX_PRICE, "max_price"), (QUESTION_MIN_PRICE, "min_price")):
+        match = pattern.search(text)
+        if match:
+            filters[field] = int(match.group(1))
+            text = text[:match.start()] + " " + text[match.end():]
+    match = QUESTION_LOCATION.search(text)
+    if match:
+        filters["location"] = match.group(1)
+        text = text[:match.start()] + " " + text[match.end():]
+    words = [w for w in re.findall(r"\w+", text.lower()) if w not in STOP_WORDS]
+    return " ".join(words), filters
+
+
+def name_key(name):
+    """Comparable form of a restaurant key or display name: "punjab_grill" and "Punjab Grill" both give "punjab grill"."""
+    return " ".join(re.findall(r"[a-z0-9]+", name.lower()))
+
+
+def restaurant_keys(conn, restaurants):
+    """Keys of the catalog restaurants named in restaurants, by key or display name."""
+    wanted = {name_key(name) for name in restaurants}
+    return [key for key, name in conn.execute("SELECT key, name FROM restaurants")
+            if name_key(key) in wanted or name_key(name) in wanted]
+
+
+def fts_query(text):
+    """Every word must match, as a prefix, in name or description."""
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text))
+
+
+def search(conn, text="", veg_status=None, min_price=None, max_price=None, location=None,
+           restaurants=None, limit=20):
+    conditions, params = [], []
+    if text.strip():
+        source = "items_fts JOIN items i ON i.id = items_fts.rowid"
+        conditions.append("items_fts MATCH ?")
+        params.append(fts_query(text))
+        order = "bm25(items_fts, 10.0, 1.0), i.price"
+    else:
+        source = "items i"
+        order = "i.price"
+    if veg_status:
+        conditions.append("i.veg_status = ?")
+        params.append(veg_status)
+    if min_price is not None:
+        conditions.append("i.price >= ?")
+        params.append(min_price)
+    if max_price is not None:
+        conditions.append("i.price <= ?")
+        params.append(max_price)
+    if location:
+        conditions.append("(r.location LIKE ? COLLATE NOCASE OR r.name LIKE ? COLLATE NOCASE)")
+        params.extend([f"%{location}%"] * 2)
+    if restaurants:
+        keys = restaurant_keys(conn, restaurants)
+        if not keys:
+            return []
+        conditions.append(f"r.key IN ({', '.join('?' * len(keys))})")
+        params.extend(keys)
+    sql = f"""
+        SELECT r.name AS restaurant, c.name AS category, i.name, i.description, i.price, i.veg_status
+        FROM {source}
+        JOIN restaurants r ON r.id = i.restaurant_id
+        JOIN categories c ON c.id = i.category_id
+        {"WHERE " + " AND ".join(conditions) if conditions else ""}
+        ORDER BY {order}
+        LIMIT ?
+    """
+    return conn.execute(sql, params + [limit]).fetchall()
+
+
+def ask(conn, question, limit=20):
+    text, filters = parse_question(question)
+    return search(conn, text, limit=limit, **filters)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQLite catalog of scraped menus.")
+    parser.add_argument("--db", default=CATALOG_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+    load = commands.add_parser("load", help="upsert every *_menu.csv / *_menu.json in one transaction")
+    load.add_argument("--dir", default=".")
+    query = commands.add_parser("query", help='e.g. "veg paneer under ₹400 in Connaught Place"')
+    query.add_argument("question")
+    query.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    conn = connect(args.db)
+    if args.command == "load":
+        start = time.perf_counter()
+        loaded = bulk_load(conn, menus_from_outputs(args.dir))
+        for key, (count, removed) in loaded.items():
+            print(f"{key:<20}{count:>6} items{f' ({removed} removed)' if removed else ''}")
+        print(f"Loaded {sum(c for c, _ in loaded.values())} items into {args.db} in {time.perf_counter() - start:.2f}s")
+        sys.exit(0)
+    text, filters = parse_question(args.question)
+    start = time.perf_counter()
+    rows = search(conn, text, limit=args.limit, **filters)
+    elapsed = time.perf_counter() - start
+    print(f"text={text!r} filters={filters}")
+    for row in rows:
+        print(f"{row['restaurant']:<24}{row['name']:<40}{'₹' + str(row['price']) if row['price'] is not None else '':>8}  {row['veg_status']}")
+    print(f"{len(rows)} results in {elapsed * 1000:.2f} ms")
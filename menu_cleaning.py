@@ -0,0 +1,184 @@
+import sys
+import time
+import string
+import argparse
+import numpy as np
+import pandas as pd
+
+# Column-at-a-time cleaning of scraped menu rows. Scrapers keep what they read
+# off the page; this stage turns it into something queryable:
+#
+#   - whitespace runs collapsed and trimmed in every text column
+#   - ALL-CAPS / all-lowercase names and categories title-cased word by word
+#   - veg status mapped onto Unknown / Veg / Non-Veg
+#   - prices parsed to integers ("₹1,245" -> 1245, missing -> <NA>)
+#   - descriptions that only repeat the price blanked
+#   - cart widget rows ("Your Order (0)", "Subtotal: ₹0"), price-only and empty names dropped
+#
+# Every step is a pandas string op over the whole column, so it runs the same
+# on one restaurant or millions of synthetic rows.
+
+CSV_COLUMNS = {
+    "Restaurant Name": "restaurant_name", "Location": "location", "Operating Hours": "hours",
+    "Contact": "contact", "Category": "category", "Item Name": "name",
+    "Description": "description", "Price": "price", "Veg Status": "veg_status",
+}
+TEXT_COLUMNS = ["restaurant_name", "location", "hours", "contact", "category", "name", "description"]
+VEG_STATUSES = ["Unknown", "Veg", "Non-Veg"]
+VEG_ALIASES = {
+    "veg": "Veg", "vegetarian": "Veg", "pure veg": "Veg",
+    "non-veg": "Non-Veg", "non veg": "Non-Veg", "nonveg": "Non-Veg", "non-vegetarian": "Non-Veg",
+}
+PRICE_DIGITS = r"^\D*(\d+).*$"
+PRICE_ONLY = r"^(?:₹|Rs\.?|INR)?\s*\d[\d,]*(?:\.\d+)?$"
+CART_NOISE = r"^(?:Your Order \(\d+\)|Subtotal\b|Checkout\b|Add to cart\b)"
+REPORT_FIELDS = [
+    "rows_in", "rows_out", "cart_rows_dropped", "price_name_rows_dropped", "empty_name_rows_dropped", "whitespace_fixed",
+    "case_fixed", "veg_status_fixed", "prices_parsed", "prices_missing", "price_descriptions_cleared",
+]
+
+
+def read_menu_frame(path):
+    """A *_menu.csv as strings, with the snake_case column names menu_store uses."""
+    frame = pd.read_csv(path, dtype=str, keep_default_na=False)
+    return frame.rename(columns=CSV_COLUMNS)
+
+
+def _changed(before, after):
+    return int((before != after).sum())
+
+
+def _per_value(column, clean):
+    """Apply `clean` to each distinct value once; menu columns repeat heavily."""
+    codes, uniques = pd.factorize(column)
+    if len(uniques) * 2 > len(column):
+        return clean(column)
+    cleaned = clean(pd.Series(uniques, dtype=column.dtype))
+    return pd.Series(cleaned.to_numpy()[codes], index=column.index, dtype=cleaned.dtype)
+
+
+def normalize_whitespace(column):
+    return _per_value(column, lambda values: values.str.replace(r"\s+", " ", regex=True).str.strip())
+
+
+def normalize_case(column):
+    """Title-case values written entirely in upper or lower case; mixed case is left alone.
+
+    Each whitespace-separated word is capitalized as a whole, so "CHEF'S SPECIAL"
+    becomes "Chef's Special" rather than str.title()'s "Chef'S Special".
+    """
+    def title_case(values):
+        shouting = (values.str.isupper() | values.str.islower()) & (values.str.len() > 3)
+        return values.where(~shouting, values.map(string.capwords))
+    return _per_value(column, title_case)
+
+
+def normalize_veg_status(column):
+    def canonical(values):
+        return values.str.strip().str.lower().map(VEG_ALIASES).fillna("Unknown").astype(pd.CategoricalDtype(VEG_STATUSES))
+    return _per_value(column, canonical)
+
+
+def parse_prices(column):
+    """'₹1,245' -> 1245; values without digits become <NA>."""
+    def parse(values):
+        digits = values.str.replace(",", "", regex=False).str.replace(PRICE_DIGITS, r"\1", regex=True)
+        return pd.to_numeric(digits, errors="coerce").astype("Int32")
+    return _per_value(column, parse)
+
+
+def clean_menu(frame):
+    """Return (cleaned frame, report) for rows with the read_menu_frame() columns.
+
+    The input is not modified. Price becomes an Int32 column and veg_status a
+    categorical over VEG_STATUSES; the report counts what each step changed.
+    """
+    report = dict.fromkeys(REPORT_FIELDS, 0)
+    report["rows_in"] = len(frame)
+    frame = frame.copy()
+    for column in TEXT_COLUMNS + ["price", "veg_status"]:
+        if column not in frame:
+            frame[column] = ""
+        frame[column] = frame[column].fillna("").astype(str)
+
+    for column in TEXT_COLUMNS:
+        cleaned = normalize_whitespace(frame[column])
+        report["whitespace_fixed"] += _changed(frame[column], cleaned)
+        frame[column] = cleaned
+
+    noise = frame["name"].str.contains(CART_NOISE, regex=True) | frame["category"].str.contains(CART_NOISE, regex=True)
+    price_names = ~noise & frame["name"].str.fullmatch(PRICE_ONLY)
+    empty_names = ~noise & (frame["name"] == "")
+    report["cart_rows_dropped"] = int(noise.sum())
+    report["price_name_rows_dropped"] = int(price_names.sum())
+    report["empty_name_rows_dropped"] = int(empty_names.sum())
+    frame = frame[~(noise | price_names | empty_names)].reset_index(drop=True)
+
+    for column in ("name", "category"):
+        cased = normalize_case(frame[column])
+        report["case_fixed"] += _changed(frame[column], cased)
+        frame[column] = cased
+
+    veg_status = normalize_veg_status(frame["veg_status"])
+    report["veg_status_fixed"] = _changed(frame["veg_status"], veg_status.astype(str))
+    frame["veg_status"] = veg_status
+
+    price_text = frame["price"].str.strip()
+    description = frame["description"]
+    repeats_price = description.str.fullmatch(PRICE_ONLY) | ((description == price_text) & (description != ""))
+    report["price_descriptions_cleared"] = int(repeats_price.sum())
+    frame["description"] = description.where(~repeats_price, "")
+
+    frame["price"] = parse_prices(price_text)
+    missing = int(frame["price"].isna().sum())
+    report["prices_missing"] = missing
+    report["prices_parsed"] = len(frame) - missing
+    report["rows_out"] = len(frame)
+    return frame, report
+
+
+def print_report(report, label=""):
+    if label:
+        print(label)
+    for field in REPORT_FIELDS:
+        print(f"  {field:<28}{report[field]:>10}")
+
+
+def synthetic_frame(rows, seed=0):
+    """Messy rows shaped like the scraper outputs, for timing clean_menu()."""
+    rng = np.random.default_rng(seed)
+    dishes = np.array(["Dal Makhani", "PANEER TIKKA", "butter chicken", "Veg  Biryani", "Gulab Jamun",
+                       "Subtotal: ₹0", "₹245", "Chicken 65", "Masala   Dosa", "Your Order (0)"])
+    prices = np.array(["₹245", "₹1,245", "", "₹95", "Rs. 300", "₹0"])
+    descriptions = np.array(["Slow cooked black lentils", "₹245", "", "  Smoky,  charred  ", "A classic"])
+    vegs = np.array(["Veg", "Non-Veg", "Unknown", "veg", ""])
+    return pd.DataFrame({
+        "restaurant_name": "Synthetic", "location": "Connaught Place", "hours": "", "contact": "",
+        "category": pd.Series(rng.choice(["Starters", "MAINS", "Desserts"], rows)),
+        "name": pd.Series(dishes[rng.integers(0, len(dishes), rows)]),
+        "description": pd.Series(descriptions[rng.integers(0, len(descriptions), rows)]),
+        "price": pd.Series(prices[rng.integers(0, len(prices), rows)]),
+        "veg_status": pd.Series(vegs[rng.integers(0, len(vegs), rows)]),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Clean scraped menu CSVs and report what changed.")
+    parser.add_argument("paths", nargs="*", help="*_menu.csv files")
+    parser.add_argument("--output", help="write the cleaned rows of a single input to this CSV")
+    parser.add_argument("--synthetic", type=int, metavar="ROWS", help="time clean_menu() on generated rows instead")
+    args = parser.parse_args()
+    if args.synthetic:
+        frame = synthetic_frame(args.synthetic)
+        start = time.perf_counter()
+        _, report = clean_menu(frame)
+        print_report(report, f"{args.synthetic} synthetic rows cleaned in {time.perf_counter() - start:.2f}s")
+        sys.exit(0)
+    if not args.paths or (args.output and len(args.paths) != 1):
+        parser.error("give one or more CSVs (exactly one with --output), or --synthetic ROWS")
+    for path in args.paths:
+        cleaned, report = clean_menu(read_menu_frame(path))
+        print_report(report, path)
+        if args.output:
+            columns = {snake: header for header, snake in CSV_COLUMNS.items()}
+            cleaned.rename(columns=columns)[list(CSV_COLUMNS)].to_csv(args.output, index=False)
@@ -0,0 +1,181 @@
+import os
+import re
+import sys
+import csv
+import glob
+import time
+import argparse
+import statistics
+
+# One entry point for the scraper and the data tools:
+#
+#   python menu_cli.py scrape [restaurant ...] [--workers 3] [--resume]
+#   python menu_cli.py consolidate        # outputs -> menu_store/ and menu_catalog.db
+#   python menu_cli.py index              # outputs -> menu_index/
+#   python menu_cli.py query "veg paneer under ₹400"
+#   python menu_cli.py stats              # per-restaurant counts and prices from *_menu.csv
+#
+# Only the standard library is imported here. Each command imports what it
+# needs when it runs, so `query` (SQLite) and `stats` (csv) start without
+# Selenium, pandas, pyarrow, numpy or FAISS; benchmarks/bench_startup.py holds
+# them to that. For the same reason, default paths are spelled out below
+# rather than imported from the modules that own them.
+
+PRICE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+
+
+def scrape(args):
+    if args.workers > 1:
+        from scrape_runner import run_all
+
+        run_all(args.restaurants or restaurant_keys(), workers=args.workers, extraction_mode=args.mode,
+                load_profile=args.profile, fast_path=not args.no_fast_path, incremental=args.incremental,
+                trace=args.trace, resume=args.resume)
+        return
+    from menu_engine import scrape_many
+
+    scrape_many(args.restaurants or restaurant_keys(), extraction_mode=args.mode, load_profile=args.profile,
+                fast_path=not args.no_fast_path, incremental=args.incremental, trace=args.trace, resume=args.resume)
+
+
+def restaurant_keys():
+    from restaurant_config import load_restaurants
+
+    return list(load_restaurants())
+
+
+def consolidate(args):
+    from menu_store import consolidate as consolidate_store
+
+    written = consolidate_store(args.dir, args.root, args.date)
+    print(f"Stored {sum(written.values())} items from {len(written)} restaurants in {args.root}/")
+    if args.no_catalog:
+        return
+    from menu_catalog import connect, bulk_load, menus_from_outputs
+
+    loaded = bulk_load(connect(args.db), menus_from_outputs(args.dir))
+    print(f"Loaded {sum(count for count, _ in loaded.values())} items into {args.db}")
+
+
+def index(args):
+    from menu_index import build_index
+    from embedding_cache import EmbeddingCache
+
+    cache = None if args.no_cache else EmbeddingCache(args.cache)
+    meta = build_index(args.dir, args.out, args.encoder, args.factory, cache=cache)
+    print(f"Indexed {meta['rows']} items with {meta['encoder_version']} ({meta['factory']}, {meta['dim']} dims) "
+          f"into {args.out}/ in {meta['seconds']:.2f}s")
+
+
+def query(args):
+    from menu_catalog import parse_question
+
+    start = time.perf_counter()
+    text, filters = parse_question(args.question)
+    if args.mode == "catalog":
+        from menu_catalog import connect, search
+
+        if not os.path.exists(args.db):
+            print(f"No catalog at {args.db}; run: python menu_cli.py consolidate")
+            sys.exit(1)
+        hits = search(connect(args.db), text, limit=args.limit, **filters)
+    else:
+        from menu_search import HybridSearcher
+
+        try:
+            searcher = HybridSearcher.load(args.index)
+        except FileNotFoundError:
+            print(f"No index in {args.index}/; run: python menu_cli.py index")
+            sys.exit(1)
+        hits = searcher.search(text, args.limit, mode=args.mode, filters=filters)["hits"]
+        searcher.close()
+    print(f"text={text!r} filters={filters}")
+    for hit in hits:
+        price = f"₹{hit['price']}" if hit["price"] is not None else ""
+        print(f"{hit['restaurant']:<24}{hit['name'][:40]:<42}{price:>8}  {hit['veg_status']}")
+    print(f"{len(hits)} results in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+
+def menu_stats(path):
+    """Items, categories, veg count and price range for one scraper CSV."""
+    categories, prices, veg, items = set(), [], 0, 0
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            items += 1
+            categories.add(row["Category"])
+            veg += row["Veg Status"] == "Veg"
+            match = PRICE.search(row["Price"] or "")
+            if match:
+                prices.append(int(float(match.group().replace(",", ""))))
+    return {"items": items, "categories": len(categories), "veg": veg,
+            "min_price": min(prices, default=0), "median_price": statistics.median(prices) if prices else 0,
+            "max_price": max(prices, default=0)}
+
+
+def stats(args):
+    from restaurant_config import restaurants_by_output
+
+    configs = restaurants_by_output()
+    paths = sorted(glob.glob(os.path.join(args.dir, "*_menu.csv")))
+    if not paths:
+        print(f"No *_menu.csv in {args.dir}")
+        sys.exit(1)
+    print(f"{'Restaurant':<20}{'Items':>7}{'Categories':>12}{'Veg':>6}{'Min ₹':>8}{'Median ₹':>10}{'Max ₹':>8}")
+    for path in paths:
+        output = os.path.basename(path)[:-len(".csv")]
+        key = configs[output]["key"] if output in configs else output[:-len("_menu")]
+        row = menu_stats(path)
+        print(f"{key:<20}{row['items']:>7}{row['categories']:>12}{row['veg']:>6}"
+              f"{row['min_price']:>8}{row['median_price']:>10.0f}{row['max_price']:>8}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Scrape restaurant menus and search the results.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("scrape", help="scrape restaurants listed in restaurants.json")
+    command.add_argument("restaurants", nargs="*", help="restaurant keys (default: all)")
+    command.add_argument("--workers", type=int, default=1, help="browsers in parallel (more than 1 uses scrape_runner)")
+    command.add_argument("--mode", choices=["element", "js", "snapshot"], default="element")
+    command.add_argument("--profile", choices=["default", "lean"], default="default", help="page-load profile")
+    command.add_argument("--no-fast-path", action="store_true", help="always use the browser, never plain HTTP")
+    command.add_argument("--incremental", action="store_true", help="skip menus and categories unchanged since the last run")
+    command.add_argument("--trace", action="store_true", help="write stage spans to traces/<output>.trace.json")
+    command.add_argument("--resume", action="store_true", help="continue an interrupted batch from checkpoints/")
+    command.set_defaults(run=scrape)
+
+    command = commands.add_parser("consolidate", help="load *_menu.csv / *_menu.json into the store and catalog")
+    command.add_argument("--dir", default=".", help="directory holding the scraper outputs")
+    command.add_argument("--date", help="scrape date for the store partitions (default: each file's modification date)")
+    command.add_argument("--root", default="menu_store")
+    command.add_argument("--db", default="menu_catalog.db")
+    command.add_argument("--no-catalog", action="store_true", help="only write the Arrow store")
+    command.set_defaults(run=consolidate)
+
+    command = commands.add_parser("index", help="build the vector index over the scraper outputs")
+    command.add_argument("--dir", default=".", help="directory holding the scraper outputs")
+    command.add_argument("--out", default="menu_index")
+    command.add_argument("--encoder", default="hashing", help="hashing[:dim], tfidf[:dim] or st[:model]")
+    command.add_argument("--factory", default="Flat", help='FAISS index factory string, e.g. "IVF256,Flat" or "HNSW32"')
+    command.add_argument("--cache", default="embedding_cache.db", help="embedding cache database")
+    command.add_argument("--no-cache", action="store_true", help="encode every item")
+    command.set_defaults(run=index)
+
+    command = commands.add_parser("query", help='e.g. "veg paneer under ₹400 in Connaught Place"')
+    command.add_argument("question")
+    command.add_argument("--limit", "-k", type=int, default=20)
+    command.add_argument("--mode", choices=["catalog", "hybrid", "bm25", "vector"], default="catalog",
+                         help="catalog searches menu_catalog.db; the others the vector index")
+    command.add_argument("--db", default="menu_catalog.db")
+    command.add_argument("--index", default="menu_index")
+    command.set_defaults(run=query)
+
+    command = commands.add_parser("stats", help="item counts and prices from the saved CSVs")
+    command.add_argument("--dir", default=".", help="directory holding the scraper outputs")
+    command.set_defaults(run=stats)
+    return parser
+
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+    args.run(args)
@@ -0,0 +1,728 @@
+import os
+import re
+import sys
+import time
+import argparse
+from collections import Counter
+from functools import partial
+import requests
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    TimeoutException, StaleElementReferenceException, NoSuchElementException, WebDriverException,
+)
+from driver_session import build_driver, SessionManager
+from menu_js import extract_menu_with_js, compare_extraction_methods
+from html_snapshot import save_snapshot, parse_snapshot
+from page_waits import PageWaiter
+from http_fast_path import fetch_menu_over_http, FastPathUnavailable
+from menu_fingerprint import FingerprintStore, text_hash
+from menu_sink import MenuSink
+from scrape_trace import NULL_TRACER, Tracer, trace_path, print_summary
+from driver_profiler import DriverProfiler
+from scrape_checkpoint import CategoryCheckpoint, BatchState, with_backoff
+from restaurant_config import load_restaurants, load_restaurant
+
+# One scraper for every restaurant. Everything that differed between the old
+# per-restaurant scripts (URL, metadata, waits, selectors and item rules, output
+# policy) lives in restaurants.json; the "recipe" there is interpreted here
+# through WebDriver calls and by menu_js.py inside the page.
+
+RESULT_FIELDS = [
+    "restaurant", "status", "method", "categories", "items", "worker_pid",
+    "started_at", "setup_seconds", "scrape_seconds", "total_seconds", "reused_categories", "error",
+]
+
+
+class MenuScraper:
+    def __init__(self, restaurant, url=None, extraction_mode="element", driver=None,
+                 load_profile="default", fast_path=False, incremental=False, tracer=None, profiler=None,
+                 checkpoint=False, resume=False):
+        self.restaurant = restaurant
+        self.recipe = restaurant["recipe"]
+        self.url = url or restaurant["url"]
+        self.extraction_mode = extraction_mode
+        self.load_profile = load_profile
+        self.fast_path = fast_path
+        self.http_session = None
+        self.menu_data = {}
+        self.restaurant_info = dict(restaurant["restaurant_info"])
+        self.owns_driver = driver is None
+        # A DriverProfiler (see driver_profiler.py) counts every WebDriver round trip.
+        self.profiler = profiler
+        self.driver = profiler.wrap(driver) if profiler else driver
+        self.waiter = PageWaiter(self.driver, restaurant["waits"]["timeouts"])
+        # Incremental runs compare against fingerprints/<output>.json from the last run.
+        self.fingerprints = FingerprintStore.for_output(restaurant["output"]) if incremental else None
+        # With checkpoint, finished categories go to checkpoints/<output>.jsonl;
+        # resume reuses the ones an interrupted run left there.
+        self.checkpoint = CategoryCheckpoint.for_output(restaurant["output"], self.url, resume) if checkpoint else None
+        # "<category>#<n>" for the nth region of a category, shared by checkpoints and fingerprints.
+        self.category_keys = Counter()
+        self.failed_categories = []
+        self.unchanged = False
+        # While the element path runs, items are streamed to this sink as each
+        # category is extracted (see menu_sink.py).
+        self.sink = None
+        # Stage spans (see scrape_trace.py); the default records nothing.
+        self.tracer = tracer or NULL_TRACER
+        if profiler:
+            self.tracer = profiler.stages(self.tracer)
+
+    def setup_driver(self):
+        with self.tracer.span("driver_setup"):
+            self.driver = build_driver(self.restaurant.get("chrome_arguments", []), profile=self.load_profile)
+        if self.profiler:
+            self.driver = self.profiler.wrap(self.driver)
+        self.waiter.driver = self.driver
+
+    def scrape(self):
+        with self.tracer.span("scrape", restaurant=self.restaurant["key"], mode=self.extraction_mode):
+            try:
+                if not (self.fast_path and self.scrape_over_http()):
+                    self.load_page()
+                    if not self.page_unchanged():
+                        if self.extraction_mode == "element":
+                            self.sink = self.open_sink()
+                        self.extract_menu()
+                self.save_results()
+                self.waiter.report()
+                return self.menu_data
+            except Exception as e:
+                print(f"Error during scraping: {str(e)}")
+                if self.sink is not None:
+                    self.sink.abort()
+                return None
+            finally:
+                # A failed run keeps its checkpoint for --resume, but not the open handle.
+                if self.checkpoint is not None:
+                    self.checkpoint.close()
+                if self.owns_driver and self.driver is not None:
+                    self.driver.quit()
+
+    def scrape_over_http(self):
+        with self.tracer.span("http_fast_path"):
+            try:
+                self.menu_data = fetch_menu_over_http(self.url, self.recipe["item"]["defaults"], session=self.http_session)
+                print(f"Read menu over HTTP from {self.url}")
+                return True
+            except FastPathUnavailable as e:
+                print(f"HTTP fast path unavailable, falling back to Selenium: {e}")
+                return False
+
+    def page_unchanged(self):
+        """Reuse the whole previous menu when the rendered menu region hashes the same as last run."""
+        if self.fingerprints is None:
+            return False
+        with self.tracer.span("page_fingerprint"):
+            region = self.driver.find_element(By.XPATH, self.recipe.get("fingerprint_xpath", "//main"))
+            page_hash = text_hash(region.text)
+        if not self.fingerprints.page_unchanged(page_hash) or not self.outputs_exist():
+            return False
+        self.menu_data = self.fingerprints.previous_menu()
+        self.unchanged = True
+        print("Menu region unchanged since the last run, skipping extraction")
+        return True
+
+    def outputs_exist(self):
+        output = self.restaurant["output"]
+        return os.path.exists(f"{output}.json") and os.path.exists(f"{output}.csv")
+
+    def save_results(self):
+        """save_data(), unless an incremental run produced the same menu as last time."""
+        if self.fingerprints is not None:
+            if self.fingerprints.menu_unchanged(self.menu_data) and self.outputs_exist():
+                self.unchanged = True
+            stats = self.fingerprints.stats
+            if stats["reused"]:
+                print(f"Reused {stats['reused']} of {stats['reused'] + stats['extracted']} categories from the last run")
+        if self.unchanged:
+            print(f"Menu unchanged, keeping {self.restaurant['output']}.json and .csv")
+            if self.sink is not None:
+                self.sink.discard()
+        else:
+            with self.tracer.span("save_data"):
+                self.save_data()
+        if self.checkpoint is not None:
+            if self.failed_categories:
+                self.checkpoint.close()
+                print(f"{len(self.failed_categories)} categories failed; rerun with --resume to retry only those")
+            else:
+                self.checkpoint.clear()
+        if self.fingerprints is not None:
+            self.fingerprints.save(self.menu_data)
+
+    def load_page(self):
+        if self.driver is None:
+            self.setup_driver()
+        print(f"Opening URL: {self.url}")
+        with self.tracer.span("page_load", url=self.url):
+            self.driver.get(self.url)
+        with self.tracer.span("wait_main"):
+            wait = WebDriverWait(self.driver, 20)
+            wait.until(EC.presence_of_element_located((By.TAG_NAME, "main")))
+        with self.tracer.span("post_load_wait"):
+            self.waiter.wait_for_page_ready("post_load", baseline=self.restaurant["waits"]["replaced_post_load_sleep"])
+        self.handle_cookie_consent()
+
+    def handle_cookie_consent(self):
+        with self.tracer.span("cookie_consent"):
+            try:
+                cookie_button = WebDriverWait(self.driver, 5).until(
+                    EC.element_to_be_clickable((By.XPATH, self.restaurant["cookie_button_xpath"]))
+                )
+                cookie_button.click()
+                self.waiter.wait_for_dom_quiet("cookie_consent", quiet_ms=300, baseline=1)
+            except TimeoutException:
+                pass
+
+    def extract_menu(self):
+        with self.tracer.span("extract_menu", mode=self.extraction_mode):
+            if self.extraction_mode == "js":
+                self.menu_data = extract_menu_with_js(self.driver, self.recipe)
+            elif self.extraction_mode == "snapshot":
+                page_source = save_snapshot(self.driver, self.snapshot_path)
+                self.menu_data = parse_snapshot(partial(MenuScraper, self.restaurant, tracer=self.tracer), page_source)
+            else:
+                self.extract_menu_by_recipe()
+
+    @property
+    def snapshot_path(self):
+        return os.path.join("snapshots", f"{self.restaurant['output']}.html")
+
+    # Element-by-element interpretation of the recipe. menu_js.py implements
+    # the same rules in the page; keep the two in step.
+
+    def extract_menu_by_recipe(self):
+        strategy = self.recipe["strategy"]
+        try:
+            if strategy == "category_click":
+                self.extract_by_category_click()
+            elif strategy == "sections":
+                self.extract_by_sections()
+            elif strategy == "headers":
+                self.extract_by_headers()
+            else:
+                raise ValueError(f"Unknown extraction strategy {strategy!r}")
+        except Exception as e:
+            print(f"Error extracting menu categories: {e}")
+        if not self.menu_data:
+            self.extract_fallback()
+
+    def add_category(self, name, merge=False):
+        if not merge or name not in self.menu_data:
+            self.menu_data[name] = []
+        if self.sink is not None:
+            self.sink.add_category(name, reset=not merge)
+
+    def add_items(self, category_name, items):
+        self.menu_data[category_name].extend(items)
+        if self.sink is not None:
+            self.sink.add(category_name, items)
+
+    def extract_by_category_click(self):
+        labels = []
+        with self.tracer.span("discover_categories"):
+            for xpath in self.recipe["category_xpaths"]:
+                labels = self.driver.find_elements(By.XPATH, xpath)
+                if labels:
+                    break
+        print(f"Found {len(labels)} menu categories")
+        for index, label in enumerate(labels):
+            match = re.search(self.recipe["label_regex"], label.text.strip())
+            if not match:
+                continue
+            category_name = match.group(1).strip()
+            item_count = match.group(2)
+            print(f"Processing category: {category_name} with {item_count} items")
+            self.add_category(category_name)
+            with self.tracer.span("category", category=category_name):
+                try:
+                    self.add_items(category_name, self.extract_category(
+                        category_name, partial(self.clicked_category_items, category_name, int(item_count)), label,
+                        partial(self.relocate, partial(self.driver.find_elements, By.XPATH, xpath), index)))
+                except Exception as e:
+                    print(f"Error clicking on category {category_name}: {e}")
+
+    def clicked_category_items(self, category_name, item_count, label):
+        with self.tracer.span("category_wait"):
+            self.waiter.mark_items(self.recipe["count_xpath"])
+            label.click()
+            self.waiter.wait_for_item_count("category_click", self.recipe["count_xpath"], item_count, baseline=1)
+        region = self.driver.find_element(By.XPATH, self.recipe.get("fingerprint_xpath", "//main"))
+        return self.extract_region(category_name, region, self.category_items)
+
+    def extract_category(self, category_name, extract, element, locate):
+        """Items for one category: from the checkpoint if an interrupted run finished it, else extract(element).
+
+        Failed attempts are retried with backoff. A retry runs on a fresh
+        handle from locate(), since the usual failure is element going stale.
+        """
+        self.category_keys[category_name] += 1
+        key = f"{category_name}#{self.category_keys[category_name]}"
+        if self.checkpoint is not None:
+            checkpointed = self.checkpoint.get(key)
+            if checkpointed is not None:
+                items, region_hash = checkpointed
+                if self.fingerprints is not None and region_hash:
+                    self.fingerprints.record(key, region_hash, items)
+                return items
+        handles = [element]
+
+        def attempt():
+            return extract(handles.pop() if handles else locate())
+
+        try:
+            items = with_backoff(attempt, WebDriverException, label=category_name)
+        except WebDriverException as e:
+            print(f"Giving up on category {category_name}: {type(e).__name__}")
+            self.failed_categories.append(category_name)
+            return []
+        if self.checkpoint is not None:
+            region = self.fingerprints.regions.get(key) if self.fingerprints is not None else None
+            self.checkpoint.record(key, items, region["hash"] if region else None)
+        return items
+
+    def relocate(self, find, index):
+        """find()[index]: a fresh handle on a category's element for retrying it."""
+        elements = find()
+        if index >= len(elements):
+            raise NoSuchElementException(f"Category element {index} is no longer on the page")
+        return elements[index]
+
+    def extract_region(self, category_name, region, extract):
+        """Run extract() for one category, or reuse last run's items if the region's text is unchanged."""
+        if self.fingerprints is None:
+            return extract()
+        key = f"{category_name}#{self.category_keys[category_name]}"
+        region_hash = text_hash(region.text)
+        items = self.fingerprints.reuse(key, region_hash)
+        if items is None:
+            items = extract()
+        self.fingerprints.record(key, region_hash, items)
+        return items
+
+    def category_items(self):
+        scope_xpath = self.recipe.get("scope_xpath")
+        if not scope_xpath:
+            return self.items_in(self.driver, self.recipe["item_xpath"])
+        for scope in self.driver.find_elements(By.XPATH, scope_xpath):
+            items = self.items_in(scope, self.recipe["item_xpath"])
+            if items:
+                return items
+        return []
+
+    def find_sections(self):
+        sections = self.driver.find_elements(By.XPATH, self.recipe["section_xpath"])
+        section_fallback = self.recipe.get("section_fallback")
+        if not sections and section_fallback:
+            for anchor in self.driver.find_elements(By.XPATH, section_fallback["anchor"]):
+                section = self.ancestor_matching(anchor, section_fallback)
+                if section is not None and section not in sections:
+                    sections.append(section)
+        return sections
+
+    def extract_by_sections(self):
+        with self.tracer.span("discover_sections"):
+            sections = self.find_sections()
+        print(f"Found {len(sections)} menu sections")
+        header_tags = self.recipe["header_tags"]
+        for index, section in enumerate(sections):
+            with self.tracer.span("category") as span:
+                try:
+                    if self.recipe.get("require_header") and not section.find_elements(By.TAG_NAME, header_tags[0]):
+                        continue
+                    category_name = self.section_category_name(section)
+                    if self.tracer.enabled:
+                        span.args["category"] = category_name
+                    limit = self.recipe.get("skip_price_sections_under")
+                    if limit:
+                        section_text = section.text.strip()
+                        if "₹" in section_text and len(section_text) < limit:
+                            continue
+                    print(f"Processing category: {category_name}")
+                    self.add_category(category_name, merge=self.recipe.get("merge_categories", False))
+                    self.add_items(category_name, self.extract_category(
+                        category_name, partial(self.section_region_items, category_name), section,
+                        partial(self.relocate, self.find_sections, index)))
+                except Exception as e:
+                    print(f"Error processing section: {e}")
+
+    def section_region_items(self, category_name, section):
+        return self.extract_region(category_name, section, partial(self.section_items, section))
+
+    def section_category_name(self, section):
+        for tag in self.recipe["header_tags"]:
+            headers = section.find_elements(By.TAG_NAME, tag)
+            if headers:
+                return headers[0].text.strip()
+        category_fallback = self.recipe.get("category_fallback")
+        if category_fallback:
+            for element in section.find_elements(By.XPATH, category_fallback["xpath"]):
+                text = element.text.strip()
+                keyword = any(k in text.lower() for k in category_fallback.get("keywords", []))
+                if text and (keyword or len(text) < category_fallback["max_len"]):
+                    return text
+        return "Uncategorized"
+
+    def section_items(self, section):
+        candidate_filter = self.recipe.get("candidate_filter")
+        if not candidate_filter:
+            return self.items_in(section, self.recipe["item_xpath"])
+        items = []
+        processed = set()
+        for candidate in section.find_elements(By.XPATH, self.recipe["item_xpath"]):
+            try:
+                text = candidate.text.strip()
+                if len(text) < candidate_filter["min_len"] or text in processed:
+                    continue
+                css_class = (candidate.get_attribute("class") or "").lower()
+                if not re.search(candidate_filter["regex"], text) and candidate_filter["class_contains"] not in css_class:
+                    continue
+                item = self.extract_item(candidate)
+                if not item:
+                    continue
+                unique_key = f"{item['name']}-{item['price']}"
+                if unique_key not in processed:
+                    items.append(item)
+                    processed.add(unique_key)
+            except StaleElementReferenceException:
+                raise
+            except Exception:
+                continue
+        return items
+
+    def extract_by_headers(self):
+        seen = set()
+        with self.tracer.span("discover_headers"):
+            headers = self.driver.find_elements(By.XPATH, self.recipe["header_xpath"])
+        for index, header in enumerate(headers):
+            category_name = header.text.strip()
+            if not category_name or category_name in seen:
+                continue
+            seen.add(category_name)
+            print(f"Found category: {category_name}")
+            self.add_category(category_name)
+            with self.tracer.span("category", category=category_name):
+                self.add_items(category_name, self.extract_category(
+                    category_name, partial(self.header_items, category_name), header,
+                    partial(self.relocate, partial(self.driver.find_elements, By.XPATH, self.recipe["header_xpath"]), index)))
+
+    def header_items(self, category_name, header):
+        section = self.ancestor_matching(header, self.recipe["section_walk"])
+        if section is None:
+            return []
+        return self.extract_region(category_name, section, partial(self.items_in, section, self.recipe["item_xpath"]))
+
+    def extract_fallback(self):
+        fallback = self.recipe.get("fallback")
+        if not fallback:
+            return
+        print("Using alternative extraction method...")
+        with self.tracer.span("fallback"):
+            self._extract_fallback(fallback)
+
+    def _extract_fallback(self, fallback):
+        category_name = fallback["category"]
+        self.add_category(category_name)
+        try:
+            anchors = self.driver.find_elements(By.XPATH, fallback["anchor"])
+        except Exception as e:
+            print(f"Error in alternative extraction: {e}")
+            return
+        for anchor in anchors:
+            try:
+                headers = fallback.get("category_headers")
+                if headers and self.is_category_header(anchor, headers):
+                    category_name = anchor.text.strip()
+                    self.add_category(category_name, merge=True)
+                    continue
+                container = self.ancestor_matching(anchor, fallback)
+                if container is None:
+                    continue
+                item = self.extract_item(container)
+                if item:
+                    self.add_items(category_name, [item])
+            except Exception:
+                continue
+
+    def is_category_header(self, element, rule):
+        text = element.text.strip()
+        if rule.get("regex") and re.search(rule["regex"], text):
+            return True
+        if any(word in text for word in rule.get("contains", [])):
+            return True
+        try:
+            parent_class = element.find_element(By.XPATH, "..").get_attribute("class") or ""
+        except Exception:
+            return False
+        return bool(rule.get("parent_class_contains")) and rule["parent_class_contains"] in parent_class.lower()
+
+    def ancestor_matching(self, element, walk):
+        current = element
+        for _ in range(walk["levels"]):
+            try:
+                parent = current.find_element(By.XPATH, "..")
+            except StaleElementReferenceException:
+                raise
+            except Exception:
+                return None
+            if walk.get("tag") and parent.tag_name == walk["tag"]:
+                return parent
+            if walk.get("test_text") and walk["test_text"] in parent.text:
+                return parent
+            if walk.get("test") and parent.find_elements(By.XPATH, walk["test"]):
+                return parent
+            current = parent
+        if walk.get("default_parent"):
+            try:
+                return element.find_element(By.XPATH, "..")
+            except Exception:
+                return None
+        return None
+
+    def items_in(self, context, xpath):
+        items = []
+        try:
+            for container in context.find_elements(By.XPATH, xpath):
+                item = self.extract_item(container)
+                if item:
+                    items.append(item)
+        except StaleElementReferenceException:
+            raise
+        except Exception as e:
+            print(f"Error extracting items: {e}")
+        return items
+
+    def extract_item(self, container):
+        with self.tracer.span("extract_item"):
+            try:
+                spec = self.recipe["item"]
+                item = dict(spec["defaults"])
+                text = None
+                for field in spec["fields"]:
+                    for step in field["steps"]:
+                        if text is None and not ("xpath" in step or "exists" in step):
+                            text = container.text.strip()
+                        value = self.run_step(step, container, item, text)
+                        if value is not None:
+                            item[field["field"]] = value
+                            break
+                return item if item["name"] else None
+            except StaleElementReferenceException:
+                # The page re-rendered under us; extract_category retries the whole category.
+                raise
+            except Exception as e:
+                print(f"Error extracting item details: {e}")
+                return None
+
+    def run_step(self, step, container, item, text):
+        if "xpath" in step:
+            for element in container.find_elements(By.XPATH, step["xpath"]):
+                value = (element.get_attribute(step["attr"]) or "") if "attr" in step else element.text.strip()
+                if passes_filters(value, step.get("filters", []), item):
+                    return value
+            return None
+        if "exists" in step:
+            return step["value"] if container.find_elements(By.XPATH, step["exists"]) else None
+        if "regex" in step:
+            match = re.search(step["regex"], text)
+            return step["format"].format(match.group(1)) if match else None
+        if "contains" in step:
+            if step["contains"] not in text or any(word in text for word in step.get("excludes", [])):
+                return None
+            return step["value"]
+        if step.get("remainder"):
+            if not text or not item["name"]:
+                return None
+            remainder = text.replace(item["name"], "", 1)
+            if item["price"]:
+                remainder = remainder.replace(item["price"], "", 1)
+            remainder = remainder.strip()
+            split = step.get("split")
+            if split and split in remainder:
+                remainder = remainder.split(split)[0].strip()
+            return remainder
+        if step.get("first_line"):
+            return text.split("\n")[0].strip() if text else None
+        return None
+
+    def open_sink(self):
+        return MenuSink(self.restaurant["output"], self.restaurant_info, self.restaurant["save"])
+
+    def save_data(self):
+        """Save scraped data to JSON and CSV files with restaurant metadata"""
+        if self.restaurant["save"].get("drop_empty_categories"):
+            self.menu_data = {k: v for k, v in self.menu_data.items() if v}
+        if self.sink is None:
+            # Menus read in one piece (JS, snapshot, HTTP) go through the same sink.
+            self.sink = self.open_sink()
+            for category, items in self.menu_data.items():
+                self.sink.add_category(category)
+                self.sink.add(category, items)
+        self.sink.finalize()
+        self.sink = None
+        output = self.restaurant["output"]
+        print(f"Data saved to {output}.json, {output}.jsonl and {output}.csv")
+
+
+def passes_filters(text, filters, item):
+    for rule in filters:
+        if rule == "nonempty" and not text:
+            return False
+        if rule == "not_name" and text == item["name"]:
+            return False
+        if rule == "no_rupee" and "₹" in text:
+            return False
+        if rule == "has_rupee" and "₹" not in text:
+            return False
+        if isinstance(rule, dict) and "max_len" in rule and not len(text) < rule["max_len"]:
+            return False
+    return True
+
+
+def scrape_restaurant(key, sessions, extraction_mode="element", fast_path=True, http_session=None, run_started=None,
+                      incremental=False, trace=False, profiler=None, resume=False):
+    """Scrape one restaurant with a pooled browser session and return its result row.
+
+    With trace, the scrape's stage spans are written to traces/<output>.trace.json.
+    With resume, categories checkpointed by an interrupted run are not extracted again.
+    """
+    run_started = run_started or time.time()
+    tracer = Tracer(process_name=f"{key} (pid {os.getpid()})") if trace else None
+    result = {
+        "restaurant": key, "status": "failed", "method": "browser", "categories": 0, "items": 0,
+        "worker_pid": os.getpid(), "started_at": round(time.time() - run_started, 3),
+        "setup_seconds": 0.0, "scrape_seconds": 0.0, "total_seconds": 0.0, "reused_categories": 0, "error": "",
+    }
+    start = time.perf_counter()
+    try:
+        restaurant = load_restaurant(key)
+        if fast_path and extraction_mode == "element":
+            scraper = MenuScraper(restaurant, extraction_mode=extraction_mode, incremental=incremental, tracer=tracer,
+                                  checkpoint=True, resume=resume)
+            scraper.http_session = http_session
+            if scraper.scrape_over_http():
+                scraper.save_results()
+                result.update(status="unchanged" if scraper.unchanged else "ok", method="http",
+                              categories=len(scraper.menu_data),
+                              items=sum(len(items) for items in scraper.menu_data.values()))
+                result["scrape_seconds"] = result["total_seconds"] = round(time.perf_counter() - start, 3)
+                if tracer:
+                    tracer.write_chrome(trace_path(restaurant["output"]))
+                return result
+        session = sessions.acquire(restaurant.get("chrome_arguments", []))
+        result["setup_seconds"] = round(time.perf_counter() - start, 3)
+        scrape_start = time.perf_counter()
+        menu_data = None
+        try:
+            scraper = MenuScraper(restaurant, extraction_mode=extraction_mode, driver=session.driver,
+                                  incremental=incremental, tracer=tracer, profiler=profiler,
+                                  checkpoint=True, resume=resume)
+            menu_data = scraper.scrape()
+        finally:
+            sessions.release(session, healthy=menu_data is not None)
+        result["scrape_seconds"] = round(time.perf_counter() - scrape_start, 3)
+        if menu_data:
+            result["status"] = "unchanged" if scraper.unchanged else "ok"
+            if scraper.failed_categories:
+                # Kept out of the batch's finished list, so --resume retries the failed categories.
+                result["status"] = "partial"
+                result["error"] = f"categories failed: {', '.join(scraper.failed_categories)}"
+            if scraper.fingerprints is not None:
+                result["reused_categories"] = scraper.fingerprints.stats["reused"]
+            result["categories"] = len(menu_data)
+            result["items"] = sum(len(items) for items in menu_data.values())
+        else:
+            result["error"] = "scrape() returned no data"
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["total_seconds"] = round(time.perf_counter() - start, 3)
+    if tracer and tracer.events:
+        tracer.write_chrome(trace_path(restaurant["output"]))
+    return result
+
+
+def scrape_many(keys, extraction_mode="element", load_profile="default", fast_path=True,
+                max_pages=50, max_rss_mb=1500, incremental=False, trace=False, round_trips=False, resume=False):
+    """Scrape restaurants one after another in this process, sharing warm browsers and HTTP connections.
+
+    With resume, restaurants the last batch finished are skipped and interrupted ones continue
+    from their checkpoints.
+    """
+    sessions = SessionManager(max_pages=max_pages, max_rss_mb=max_rss_mb, profile=load_profile)
+    http_session = requests.Session()
+    run_started = time.time()
+    profiler = DriverProfiler() if round_trips else None
+    batch = BatchState.load(resume)
+    results = []
+    try:
+        for key in keys:
+            if batch.done(key):
+                print(f"[skipped] {key}: finished by the previous batch")
+                results.append(batch.completed[key])
+                continue
+            result = scrape_restaurant(key, sessions, extraction_mode, fast_path, http_session, run_started, incremental,
+                                       trace, profiler, resume)
+            batch.mark(result)
+            print(f"[{result['status']}] {key}: {result['items']} items via {result['method']} in {result['total_seconds']}s")
+            results.append(result)
+        batch.finish(keys)
+    finally:
+        sessions.close()
+        http_session.close()
+    if profiler:
+        profiler.report(items=sum(result["items"] for result in results if result["method"] == "browser"))
+    return results
+
+
+def run_cli(scraper_cls):
+    """Command line used by the restaurant_*.py scripts."""
+    if "--compare" in sys.argv:
+        compare_extraction_methods(scraper_cls())
+        sys.exit(0)
+    mode = "js" if "--js" in sys.argv else "snapshot" if "--snapshot" in sys.argv else "element"
+    profile = "lean" if "--lean" in sys.argv else "default"
+    fast_path = mode == "element" and "--no-fast-path" not in sys.argv
+    incremental = "--incremental" in sys.argv
+    tracer = Tracer(process_name=scraper_cls.__name__) if "--trace" in sys.argv else None
+    profiler = DriverProfiler() if "--round-trips" in sys.argv else None
+    scraper = scraper_cls(extraction_mode=mode, load_profile=profile, fast_path=fast_path, incremental=incremental,
+                          tracer=tracer, profiler=profiler, checkpoint=True, resume="--resume" in sys.argv)
+    menu_data = scraper.scrape()
+    if profiler:
+        profiler.report(items=sum(len(items) for items in menu_data.values()) if menu_data else None)
+    if tracer:
+        path = tracer.write_chrome(trace_path(scraper.restaurant["output"]))
+        print(f"Trace saved to {path}")
+        print_summary(tracer.summary())
+    if menu_data:
+        total_items = sum(len(items) for items in menu_data.values())
+        print(f"\nScraping completed successfully!")
+        print(f"Total categories: {len(menu_data)}")
+        print(f"Total menu items: {total_items}")
+    else:
+        print("Scraping failed.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape restaurants listed in restaurants.json in one process.")
+    parser.add_argument("restaurants", nargs="*", help="restaurant keys (default: all)")
+    parser.add_argument("--mode", choices=["element", "js", "snapshot"], default="element")
+    parser.add_argument("--profile", choices=["default", "lean"], default="default", help="page-load profile")
+    parser.add_argument("--no-fast-path", action="store_true", help="always use the browser, never plain HTTP")
+    parser.add_argument("--max-pages", type=int, default=50, help="recycle a browser after this many pages")
+    parser.add_argument("--max-rss-mb", type=int, default=1500, help="recycle a browser above this resident memory")
+    parser.add_argument("--incremental", action="store_true", help="skip menus and categories unchanged since the last run")
+    parser.add_argument("--trace", action="store_true", help="write stage spans to traces/<output>.trace.json")
+    parser.add_argument("--round-trips", action="store_true", help="count WebDriver calls and print the hottest ones")
+    parser.add_argument("--resume", action="store_true",
+                        help="skip restaurants the last batch finished and continue interrupted ones from checkpoints/")
+    args = parser.parse_args()
+    keys = args.restaurants or list(load_restaurants())
+    for key in keys:
+        load_restaurant(key)
+    scrape_many(keys, extraction_mode=args.mode, load_profile=args.profile, fast_path=not args.no_fast_path,
+                max_pages=args.max_pages, max_rss_mb=args.max_rss_mb, incremental=args.incremental, trace=args.trace,
+                round_trips=args.round_trips, resume=args.resume)
@@ -0,0 +1,213 @@
+import os
+import sys
+import time
+import argparse
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from menu_catalog import name_key
+
+# Precomputed indexes for the structured part of a menu question (which
+# restaurants, what price range, veg or not), applied before any text or
+# vector scoring:
+#
+#   - restaurant and veg status: a sorted array of row ids per value
+#   - price: row ids sorted by price, so a range is a searchsorted slice
+#
+# Restaurants are named by key ("punjab_grill") or display name ("Punjab
+# Grill"), and a location also matches restaurant names, as menu_catalog does.
+#
+# A query starts from whichever constraint matches the fewest rows and checks
+# the others against compact per-row code arrays, so its cost follows the size
+# of that smallest set rather than the number of rows. When even that set is a
+# large share of the rows, one scan over the code arrays is cheaper instead.
+
+VEG_STATUSES = ["Unknown", "Veg", "Non-Veg"]
+FILTER_KEYS = ("restaurants", "location", "veg_status", "min_price", "max_price")
+SCAN_SHARE = 10
+
+
+def _codes(column):
+    """(int32 codes, values) of a string or dictionary column."""
+    column = column.combine_chunks() if isinstance(column, pa.ChunkedArray) else column
+    if not pa.types.is_dictionary(column.type):
+        column = pc.dictionary_encode(column)
+    return column.indices.to_numpy(zero_copy_only=False).astype(np.int32), column.dictionary.to_pylist()
+
+
+def _postings(codes, count):
+    """Sorted row ids for every code value, as one argsort split at value boundaries."""
+    order = np.argsort(codes, kind="stable").astype(np.int32)
+    bounds = np.searchsorted(codes[order], np.arange(count + 1))
+    return [order[bounds[i]:bounds[i + 1]] for i in range(count)]
+
+
+class FilterIndex:
+    def __init__(self, rows):
+        self.size = len(rows)
+        self.restaurant_codes, self.restaurants = _codes(rows["restaurant"])
+        veg_codes, veg_values = _codes(rows["veg_status"])
+        # Re-code veg status onto VEG_STATUSES whatever order the dictionary had.
+        remap = np.array([VEG_STATUSES.index(value) if value in VEG_STATUSES else 0 for value in veg_values] or [0],
+                         dtype=np.int8)
+        self.veg_codes = remap[veg_codes]
+        price = rows["price"].to_numpy(zero_copy_only=False)
+        self.price = np.where(np.isnan(price), -1, price).astype(np.int32) if price.dtype.kind == "f" else price.astype(np.int32)
+        self.by_restaurant = _postings(self.restaurant_codes, len(self.restaurants))
+        self.by_veg = _postings(self.veg_codes, len(VEG_STATUSES))
+        # Rows without a price (-1) sort first and are never inside a price range.
+        self.price_order = np.argsort(self.price, kind="stable").astype(np.int32)
+        self.sorted_price = self.price[self.price_order]
+        self.locations = {}
+        self.names = list(self.restaurants)
+        for code, postings in enumerate(self.by_restaurant):
+            if not len(postings):
+                continue
+            if "location" in rows.column_names:
+                self.locations[code] = rows["location"][int(postings[0])].as_py() or ""
+            if "restaurant_name" in rows.column_names:
+                self.names[code] = rows["restaurant_name"][int(postings[0])].as_py() or self.names[code]
+
+    def restaurant_codes_for(self, restaurants=None, location=None):
+        codes = set(range(len(self.restaurants)))
+        if restaurants:
+            wanted = {name_key(name) for name in restaurants}
+            codes &= {code for code, (key, name) in enumerate(zip(self.restaurants, self.names))
+                      if name_key(key) in wanted or name_key(name) in wanted}
+        if location:
+            location = location.lower()
+            codes &= {code for code in codes
+                      if location in self.locations.get(code, "").lower() or location in self.names[code].lower()}
+        return sorted(codes)
+
+    def restaurant_keys(self, restaurants):
+        """Keys of the restaurants named in restaurants, by key or display name."""
+        return [self.restaurants[code] for code in self.restaurant_codes_for(restaurants)]
+
+    def select(self, restaurants=None, location=None, veg_status=None, min_price=None, max_price=None):
+        """Sorted int32 row ids matching every given constraint (None means all rows)."""
+        checks = []
+        if restaurants or location:
+            codes = self.restaurant_codes_for(restaurants, location)
+            allowed = np.zeros(len(self.restaurants) + 1, dtype=bool)
+            allowed[codes] = True
+            size = sum(len(self.by_restaurant[code]) for code in codes)
+            checks.append((size, "restaurant", codes, allowed))
+        if veg_status:
+            code = VEG_STATUSES.index(veg_status)
+            checks.append((len(self.by_veg[code]), "veg", code, None))
+        if min_price is not None or max_price is not None:
+            # Rows without a price are -1, below any range.
+            bounds = (max(min_price or 0, 0), max_price if max_price is not None else np.iinfo(np.int32).max)
+            # np.int32 bounds: a Python int would make searchsorted copy the whole column.
+            low = np.searchsorted(self.sorted_price, np.int32(min(bounds[0], np.iinfo(np.int32).max)), side="left")
+            high = np.searchsorted(self.sorted_price, np.int32(min(bounds[1], np.iinfo(np.int32).max)), side="right")
+            checks.append((max(high - low, 0), "price", bounds, (low, high)))
+        if not checks:
+            return None
+        checks.sort(key=lambda check: check[0])
+        if len(checks) > 1 and checks[0][0] * SCAN_SHARE > self.size:
+            # Even the smallest set is a large share of the rows: a column scan beats gathering it.
+            return self._scan(checks)
+        ids, ordered = self._candidates(checks[0])
+        for _, kind, value, extra in checks[1:]:
+            if not len(ids):
+                break
+            if kind == "restaurant":
+                ids = ids[extra[self.restaurant_codes[ids]]]
+            elif kind == "veg":
+                ids = ids[self.veg_codes[ids] == value]
+            else:
+                price = self.price[ids]
+                ids = ids[(price >= value[0]) & (price <= value[1])]
+        return ids if ordered else np.sort(ids)
+
+    def _scan(self, checks):
+        mask = None
+        for _, kind, value, extra in checks:
+            if kind == "restaurant":
+                matched = extra[self.restaurant_codes]
+            elif kind == "veg":
+                matched = self.veg_codes == value
+            else:
+                matched = (self.price >= value[0]) & (self.price <= value[1])
+            mask = matched if mask is None else mask & matched
+        return np.flatnonzero(mask).astype(np.int32)
+
+    def _candidates(self, check):
+        """(row ids, already sorted) for the most selective constraint."""
+        _, kind, value, extra = check
+        if kind == "restaurant":
+            if len(value) == 1:
+                return self.by_restaurant[value[0]], True
+            return (np.concatenate([self.by_restaurant[code] for code in value]) if value else np.empty(0, np.int32)), False
+        if kind == "veg":
+            return self.by_veg[value], True
+        low, high = extra
+        return self.price_order[low:high], False
+
+    def mask(self, ids):
+        """Boolean row mask for a select() result."""
+        mask = np.zeros(self.size, dtype=bool)
+        mask[ids] = True
+        return mask
+
+
+def split_filters(filters):
+    """Only the keys FilterIndex.select() understands, without empty values."""
+    return {key: value for key, value in (filters or {}).items() if key in FILTER_KEYS and value not in (None, "", [])}
+
+
+def check_filters(filters):
+    """split_filters(), raising ValueError for any value select() cannot use."""
+    if not isinstance(filters, dict):
+        raise ValueError(f"filters must be an object, not {type(filters).__name__}")
+    constraints = split_filters(filters)
+    restaurants = constraints.get("restaurants")
+    if restaurants is not None and (not isinstance(restaurants, list) or not all(isinstance(name, str) for name in restaurants)):
+        raise ValueError("restaurants must be a list of names")
+    if not isinstance(constraints.get("location", ""), str):
+        raise ValueError("location must be a string")
+    if constraints.get("veg_status", "Veg") not in VEG_STATUSES:
+        raise ValueError(f"unknown veg status {constraints['veg_status']!r}; expected one of {', '.join(VEG_STATUSES)}")
+    for key in ("min_price", "max_price"):
+        value = constraints.get(key, 0)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{key} must be a number")
+    return constraints
+
+
+def synthetic_rows(count, restaurants=500, seed=0):
+    rng = np.random.default_rng(seed)
+    return pa.table({
+        "restaurant": pa.DictionaryArray.from_arrays(
+            pa.array(np.sort(rng.integers(0, restaurants, count)).astype(np.int32)),
+            pa.array([f"restaurant_{i}" for i in range(restaurants)])),
+        "price": pa.array(rng.integers(20, 2500, count).astype(np.int32)),
+        "veg_status": pa.DictionaryArray.from_arrays(
+            pa.array(rng.choice(3, count, p=[0.5, 0.3, 0.2]).astype(np.int8)), pa.array(VEG_STATUSES)),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Select menu rows by restaurant, veg status and price.")
+    parser.add_argument("--index", default="menu_index", help="index directory whose rows.arrow is filtered")
+    parser.add_argument("--restaurant", action="append", help="restaurant key; repeat for several")
+    parser.add_argument("--location")
+    parser.add_argument("--veg", choices=VEG_STATUSES)
+    parser.add_argument("--min-price", type=int)
+    parser.add_argument("--max-price", type=int)
+    args = parser.parse_args()
+    rows = pa.ipc.open_file(pa.memory_map(os.path.join(args.index, "rows.arrow"))).read_all()
+    start = time.perf_counter()
+    filters = FilterIndex(rows)
+    built = time.perf_counter()
+    ids = filters.select(args.restaurant, args.location, args.veg, args.min_price, args.max_price)
+    selected = time.perf_counter()
+    if ids is None:
+        print("No filters given")
+        sys.exit(1)
+    for row in rows.take(pa.array(ids[:20])).to_pylist():
+        print(f"{row['restaurant']:<18}{row['name'][:40]:<42}{row['price'] if row['price'] is not None else '':>6}  {row['veg_status']}")
+    print(f"{len(ids)} of {len(rows)} rows; index built in {(built - start) * 1000:.1f} ms, "
+          f"selected in {(selected - built) * 1000:.3f} ms")
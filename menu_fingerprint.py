@@ -0,0 +1,76 @@
+import os
+import re
+import json
+import hashlib
+
+# Fingerprints from the previous run of each restaurant, used by incremental
+# scrapes. The rendered menu region, each category's region and the final
+# menu are hashed; a region whose hash has not changed reuses the items
+# extracted last time instead of being walked again.
+
+FINGERPRINT_DIR = "fingerprints"
+WHITESPACE = re.compile(r"\s+")
+
+
+def text_hash(text):
+    normalized = WHITESPACE.sub(" ", text or "").strip()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def menu_hash(menu_data):
+    # Empty categories write no rows, and some save policies drop them.
+    encoded = json.dumps({k: v for k, v in menu_data.items() if v}, ensure_ascii=False, sort_keys=True)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class FingerprintStore:
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.previous = json.load(f)
+        except (OSError, ValueError):
+            self.previous = {}
+        self.page = None
+        self.regions = {}
+        self.stats = {"reused": 0, "extracted": 0}
+
+    @classmethod
+    def for_output(cls, output, directory=FINGERPRINT_DIR):
+        return cls(os.path.join(directory, f"{output}.json"))
+
+    def page_unchanged(self, page_hash):
+        self.page = page_hash
+        return bool(self.previous.get("menu")) and self.previous.get("page") == page_hash
+
+    def previous_menu(self):
+        self.regions = dict(self.previous.get("regions", {}))
+        return {name: items for name, items in self.previous["menu"]}
+
+    def menu_unchanged(self, menu_data):
+        return self.previous.get("menu_hash") == menu_hash(menu_data)
+
+    def reuse(self, key, region_hash):
+        region = self.previous.get("regions", {}).get(key)
+        if region is not None and region["hash"] == region_hash:
+            self.stats["reused"] += 1
+            return region["items"]
+        self.stats["extracted"] += 1
+        return None
+
+    def record(self, key, region_hash, items):
+        self.regions[key] = {"hash": region_hash, "items": items}
+
+    def save(self, menu_data):
+        state = {
+            "page": self.page,
+            "menu_hash": menu_hash(menu_data),
+            # [name, items] pairs keep the category order through a reload.
+            "menu": [[name, items] for name, items in menu_data.items()],
+            "regions": self.regions,
+        }
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,329 @@
+import os
+import sys
+import json
+import time
+import pickle
+import hashlib
+import argparse
+import numpy as np
+import pyarrow as pa
+from menu_store import write_ipc
+from menu_catalog import menus_from_outputs
+from embedding_cache import CACHE_PATH, EmbeddingCache
+
+# Vector index over every scraped menu item. build_index() reads the scraper
+# outputs, embeds "name. description" in batches and writes:
+#
+#   menu_index/index.faiss    the FAISS index; vector id = row number in rows.arrow
+#   menu_index/rows.arrow     id -> restaurant, category, name, description, price, veg status
+#   menu_index/meta.json      encoder spec and version, dimension, row count, per-restaurant menu hashes
+#   menu_index/encoder.pkl    fitted encoder state, for encoders that need one
+#
+# MenuIndex.load() memory-maps index.faiss and rows.arrow, so query processes
+# start without rebuilding or copying the index.
+#
+# Encoders are pluggable: "hashing" and "tfidf" use scikit-learn and need no
+# download; "st" / "st:<model>" uses sentence-transformers (imported lazily).
+
+INDEX_DIR = "menu_index"
+DEFAULT_ENCODER = "hashing"
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+BATCH_SIZE = 1024
+EXACT_SUBSET_LIMIT = 8192
+
+
+def item_text(name, description):
+    """The text embedded for one item."""
+    name, description = (name or "").strip(), (description or "").strip()
+    return f"{name}. {description}" if description else name
+
+
+def _normalize(vectors):
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class HashingEncoder:
+    """Character and word n-grams hashed into a fixed number of dimensions; stateless."""
+
+    def __init__(self, dim=512):
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        self.dim = dim
+        self.spec = f"hashing:{dim}"
+        self.version = f"hashing-v1-{dim}"
+        self.chars = HashingVectorizer(analyzer="char_wb", ngram_range=(3, 4), n_features=dim,
+                                       alternate_sign=False, norm=None)
+        self.words = HashingVectorizer(analyzer="word", n_features=dim, alternate_sign=False, norm=None)
+
+    def fit(self, texts):
+        return self
+
+    def encode(self, texts):
+        lowered = [text.lower() for text in texts]
+        vectors = self.chars.transform(lowered) + 2 * self.words.transform(lowered)
+        return _normalize(vectors.toarray())
+
+
+class TfidfEncoder:
+    """TF-IDF over character n-grams reduced with truncated SVD; fitted on the corpus being indexed."""
+
+    def __init__(self, dim=128):
+        self.dim = dim
+        self.spec = f"tfidf:{dim}"
+        self.version = None
+        self.vectorizer = None
+        self.svd = None
+
+    def fit(self, texts):
+        from sklearn.decomposition import TruncatedSVD
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        self.vectorizer = TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4), sublinear_tf=True, lowercase=True)
+        matrix = self.vectorizer.fit_transform(texts)
+        self.dim = min(self.dim, matrix.shape[1] - 1, len(texts) - 1)
+        self.svd = TruncatedSVD(n_components=self.dim, random_state=0).fit(matrix)
+        # Refitting changes every vector, so the version is derived from the fitted model.
+        digest = hashlib.blake2b(self.svd.components_.tobytes(), digest_size=8).hexdigest()
+        self.version = f"tfidf-v1-{self.dim}-{digest}"
+        return self
+
+    def encode(self, texts):
+        return _normalize(self.svd.transform(self.vectorizer.transform(texts)))
+
+
+class SentenceTransformerEncoder:
+    def __init__(self, model=DEFAULT_MODEL):
+        from sentence_transformers import SentenceTransformer
+
+        self.spec = f"st:{model}"
+        self.version = f"st-{model}"
+        self.model = SentenceTransformer(model)
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def fit(self, texts):
+        return self
+
+    def encode(self, texts):
+        vectors = self.model.encode(texts, batch_size=64, normalize_embeddings=True, show_progress_bar=False)
+        return np.ascontiguousarray(vectors, dtype=np.float32)
+
+
+def make_encoder(spec=DEFAULT_ENCODER):
+    """"hashing", "tfidf", "st" or "st:<sentence-transformers model>"."""
+    name, _, argument = spec.partition(":")
+    if name == "hashing":
+        return HashingEncoder(int(argument) if argument else 512)
+    if name == "tfidf":
+        return TfidfEncoder(int(argument) if argument else 128)
+    if name == "st":
+        return SentenceTransformerEncoder(argument or DEFAULT_MODEL)
+    raise ValueError(f"Unknown encoder {spec!r}; expected hashing, tfidf or st[:model]")
+
+
+def encoder_needs_state(encoder):
+    return isinstance(encoder, TfidfEncoder)
+
+
+def menu_rows(directory="."):
+    """One Arrow table of every item in the scraper outputs, with an id column."""
+    tables = []
+    for key, info, items in menus_from_outputs(directory):
+        count = len(items)
+        items = items.append_column("restaurant", pa.array([key] * count, pa.string()))
+        items = items.append_column("restaurant_name", pa.array([info["name"]] * count, pa.string()))
+        items = items.append_column("location", pa.array([info["location"]] * count, pa.string()))
+        tables.append(items)
+    if not tables:
+        raise FileNotFoundError(f"No *_menu.csv or *_menu.json outputs in {directory}")
+    rows = pa.concat_tables(tables).unify_dictionaries().combine_chunks()
+    return rows.add_column(0, "id", pa.array(np.arange(len(rows), dtype=np.int64)))
+
+
+def restaurant_digests(rows):
+    """{restaurant: hash of its items}, to tell which menus changed between two builds."""
+    lines = {}
+    columns = [rows[name].to_pylist() for name in ("restaurant", "category", "name", "description", "price", "veg_status")]
+    for restaurant, *values in zip(*columns):
+        lines.setdefault(restaurant, []).append("\t".join(str(value) for value in values))
+    return {restaurant: hashlib.blake2b("\n".join(items).encode("utf-8"), digest_size=16).hexdigest()
+            for restaurant, items in lines.items()}
+
+
+def encode_batches(encoder, texts, batch_size=BATCH_SIZE):
+    """Yield float32 vectors for texts, batch_size at a time."""
+    for start in range(0, len(texts), batch_size):
+        yield encoder.encode(texts[start:start + batch_size])
+
+
+def new_faiss_index(dim, factory):
+    import faiss
+
+    return faiss.index_factory(dim, factory, faiss.METRIC_INNER_PRODUCT)
+
+
+def build_index(directory=".", out=INDEX_DIR, encoder_spec=DEFAULT_ENCODER, factory="Flat",
+                batch_size=BATCH_SIZE, encoder=None, cache=None):
+    """Embed every item in `directory` and write the index to `out`; returns the meta dict.
+
+    encoder overrides encoder_spec with a ready encoder. With an
+    EmbeddingCache, only items it has no vector for are encoded, and vectors
+    no longer used by any item are evicted afterwards.
+    """
+    import faiss
+
+    start = time.perf_counter()
+    rows = menu_rows(directory)
+    texts = [item_text(name, description) for name, description in
+             zip(rows["name"].to_pylist(), rows["description"].to_pylist())]
+    encoder = encoder or make_encoder(encoder_spec)
+    encoder.fit(texts)
+    index = new_faiss_index(encoder.dim, factory)
+    # Indexes that need training (IVF, PQ) buffer vectors until they have enough.
+    pending, train_size = [], max(batch_size, 64 * getattr(index, "nlist", 0))
+    for vectors in (cache.batches if cache else encode_batches)(encoder, texts, batch_size):
+        if index.is_trained:
+            index.add(vectors)
+            continue
+        pending.append(vectors)
+        if sum(len(v) for v in pending) >= train_size:
+            stacked = np.vstack(pending)
+            index.train(stacked)
+            index.add(stacked)
+            pending = []
+    if pending:
+        stacked = np.vstack(pending)
+        index.train(stacked)
+        index.add(stacked)
+
+    os.makedirs(out, exist_ok=True)
+    meta = {
+        "encoder": encoder.spec, "encoder_version": encoder.version, "dim": encoder.dim,
+        "factory": factory, "rows": len(rows), "built_at": time.time(),
+        "seconds": round(time.perf_counter() - start, 3),
+        "restaurants": restaurant_digests(rows),
+    }
+    if cache:
+        cache.evict_orphans(encoder.version)
+        meta["cache"] = dict(cache.stats, hit_rate=round(cache.hit_rate(), 4))
+    tmp_path = os.path.join(out, f"index.faiss.{os.getpid()}.tmp")
+    faiss.write_index(index, tmp_path)
+    os.replace(tmp_path, os.path.join(out, "index.faiss"))
+    write_ipc(rows, os.path.join(out, "rows.arrow"))
+    if encoder_needs_state(encoder):
+        with open(os.path.join(out, "encoder.pkl"), "wb") as f:
+            pickle.dump(encoder, f)
+    # meta.json is written last: a directory without it is an unfinished build.
+    with open(os.path.join(out, "meta.json.tmp"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    os.replace(os.path.join(out, "meta.json.tmp"), os.path.join(out, "meta.json"))
+    return meta
+
+
+class MenuIndex:
+    def __init__(self, index, rows, encoder, meta):
+        self.index = index
+        self.rows = rows
+        self.encoder = encoder
+        self.meta = meta
+
+    @classmethod
+    def load(cls, directory=INDEX_DIR, mmap=True):
+        import faiss
+
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmap else 0
+        index = faiss.read_index(os.path.join(directory, "index.faiss"), flags)
+        rows = pa.ipc.open_file(pa.memory_map(os.path.join(directory, "rows.arrow"))).read_all()
+        state_path = os.path.join(directory, "encoder.pkl")
+        if os.path.exists(state_path):
+            with open(state_path, "rb") as f:
+                encoder = pickle.load(f)
+        else:
+            encoder = make_encoder(meta["encoder"])
+        if encoder.version != meta["encoder_version"]:
+            raise ValueError(f"{directory} was built with {meta['encoder_version']}, not {encoder.version}")
+        return cls(index, rows, encoder, meta)
+
+    def search_vectors(self, vectors, k=10, ids=None):
+        """(scores, ids) arrays for a batch of query vectors; missing hits have id -1.
+
+        ids restricts the search to those rows (sorted, as from
+        menu_filters.FilterIndex.select).
+        """
+        import faiss
+
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if ids is None:
+            return self.index.search(vectors, k)
+        if isinstance(self.index, faiss.IndexFlat) and len(ids) <= EXACT_SUBSET_LIMIT:
+            # Few candidates: score just their vectors instead of scanning the index.
+            subset = self.index.reconstruct_batch(np.asarray(ids, dtype=np.int64))
+            scores = vectors @ subset.T
+            top = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+            found = np.take_along_axis(scores, top, axis=1)
+            padding = k - top.shape[1]
+            return (np.pad(found, ((0, 0), (0, padding)), constant_values=-np.inf),
+                    np.pad(np.asarray(ids, dtype=np.int64)[top], ((0, 0), (0, padding)), constant_values=-1))
+        bitmap = np.zeros(self.index.ntotal, dtype=bool)
+        bitmap[ids] = True
+        packed = np.packbits(bitmap, bitorder="little")
+        selector = faiss.IDSelectorBitmap(self.index.ntotal, faiss.swig_ptr(packed))
+        if isinstance(self.index, faiss.IndexIVF):
+            params = faiss.SearchParametersIVF(sel=selector, nprobe=self.index.nprobe)
+        elif isinstance(self.index, faiss.IndexHNSW):
+            params = faiss.SearchParametersHNSW(sel=selector, efSearch=self.index.hnsw.efSearch)
+        else:
+            params = faiss.SearchParameters(sel=selector)
+        return self.index.search(vectors, k, params=params)
+
+    def hits(self, scores, ids):
+        """Row dicts, best first, for one row of search_vectors() output."""
+        found = ids >= 0
+        rows = self.rows.take(pa.array(ids[found])).to_pylist()
+        for row, score in zip(rows, scores[found]):
+            row["score"] = float(score)
+        return rows
+
+    def search(self, query, k=10):
+        scores, ids = self.search_vectors(self.encoder.encode([query]), k)
+        return self.hits(scores[0], ids[0])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="FAISS index over the scraped menus.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="embed every *_menu.csv / *_menu.json and write the index")
+    build.add_argument("--dir", default=".", help="directory holding the scraper outputs")
+    build.add_argument("--out", default=INDEX_DIR)
+    build.add_argument("--encoder", default=DEFAULT_ENCODER, help="hashing[:dim], tfidf[:dim] or st[:model]")
+    build.add_argument("--factory", default="Flat", help='FAISS index factory string, e.g. "IVF256,Flat" or "HNSW32"')
+    build.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    build.add_argument("--cache", default=CACHE_PATH, help="embedding cache database")
+    build.add_argument("--no-cache", action="store_true", help="encode every item")
+    query = commands.add_parser("query", help="nearest items to a question")
+    query.add_argument("question")
+    query.add_argument("-k", type=int, default=10)
+    query.add_argument("--index", default=INDEX_DIR)
+    args = parser.parse_args()
+    if args.command == "build":
+        cache = None if args.no_cache else EmbeddingCache(args.cache)
+        meta = build_index(args.dir, args.out, args.encoder, args.factory, args.batch_size, cache=cache)
+        if cache:
+            stats = meta["cache"]
+            print(f"Embedding cache: {stats['hits']} hits, {stats['misses']} misses, {stats['encoded']} encoded "
+                  f"({stats['hit_rate']:.1%} hit rate), {stats['evicted']} orphaned vectors evicted")
+        print(f"Indexed {meta['rows']} items with {meta['encoder_version']} ({meta['factory']}, {meta['dim']} dims) "
+              f"into {args.out}/ in {meta['seconds']:.2f}s")
+        sys.exit(0)
+    start = time.perf_counter()
+    menu_index = MenuIndex.load(args.index)
+    loaded = time.perf_counter()
+    hits = menu_index.search(args.question, args.k)
+    searched = time.perf_counter()
+    for hit in hits:
+        price = f"₹{hit['price']}" if hit["price"] is not None else ""
+        print(f"{hit['score']:.3f}  {hit['restaurant']:<18}{hit['name'][:40]:<42}{price:>7}  {hit['veg_status']}")
+    print(f"Loaded in {(loaded - start) * 1000:.1f} ms, searched in {(searched - loaded) * 1000:.1f} ms")
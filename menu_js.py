@@ -0,0 +1,375 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# In-page menu extraction. The whole menu is read by one execute_async_script
+# call instead of one chromedriver round trip per find_element / .text.
+# Each restaurant describes its selectors as a "recipe" in restaurants.json;
+# this routine walks the DOM with the same XPaths as MenuScraper in menu_engine.py.
+MENU_EXTRACTION_JS = r"""
+var recipe = arguments[0];
+var done = arguments[arguments.length - 1];
+var menu = Object.create(null);
+var order = [];
+
+function xpathAll(expr, ctx) {
+    var out = [];
+    try {
+        var r = document.evaluate(expr, ctx || document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var i = 0; i < r.snapshotLength; i++) out.push(r.snapshotItem(i));
+    } catch (e) {}
+    return out;
+}
+
+function textOf(el) {
+    var t = (el.innerText !== undefined && el.innerText !== null) ? el.innerText : el.textContent;
+    return (t || '').trim();
+}
+
+function attrOf(el, name) {
+    var v = el[name];
+    if (v === undefined || v === null || typeof v === 'object') v = el.getAttribute(name);
+    return v === null || v === undefined ? '' : String(v);
+}
+
+function addCategory(name, merge) {
+    if (!(name in menu)) order.push(name);
+    if (!merge || !(name in menu)) menu[name] = [];
+}
+
+function passes(text, filters, item) {
+    for (var i = 0; i < (filters || []).length; i++) {
+        var f = filters[i];
+        if (f === 'nonempty' && !text) return false;
+        if (f === 'not_name' && text === item.name) return false;
+        if (f === 'no_rupee' && text.indexOf('₹') >= 0) return false;
+        if (f === 'has_rupee' && text.indexOf('₹') < 0) return false;
+        if (typeof f === 'object' && f.max_len !== undefined && !(text.length < f.max_len)) return false;
+    }
+    return true;
+}
+
+function runStep(step, container, item) {
+    if (step.xpath !== undefined) {
+        var els = xpathAll(step.xpath, container);
+        for (var i = 0; i < els.length; i++) {
+            var v = step.attr ? attrOf(els[i], step.attr) : textOf(els[i]);
+            if (passes(v, step.filters, item)) return v;
+        }
+        return null;
+    }
+    if (step.exists !== undefined) {
+        return xpathAll(step.exists, container).length ? step.value : null;
+    }
+    var text = textOf(container);
+    if (step.regex !== undefined) {
+        var m = new RegExp(step.regex).exec(text);
+        return m ? step.format.replace('{0}', m[1]) : null;
+    }
+    if (step.contains !== undefined) {
+        if (text.indexOf(step.contains) < 0) return null;
+        var excludes = step.excludes || [];
+        for (var j = 0; j < excludes.length; j++) {
+            if (text.indexOf(excludes[j]) >= 0) return null;
+        }
+        return step.value;
+    }
+    if (step.remainder) {
+        if (!text || !item.name) return null;
+        text = text.replace(item.name, '');
+        if (item.price) text = text.replace(item.price, '');
+        text = text.trim();
+        if (step.split && text.indexOf(step.split) >= 0) text = text.split(step.split)[0].trim();
+        return text;
+    }
+    if (step.first_line) {
+        return text ? text.split('\n')[0].trim() : null;
+    }
+    return null;
+}
+
+function extractItem(container) {
+    var spec = recipe.item;
+    var item = {};
+    for (var k in spec.defaults) item[k] = spec.defaults[k];
+    for (var i = 0; i < spec.fields.length; i++) {
+        var field = spec.fields[i];
+        for (var j = 0; j < field.steps.length; j++) {
+            var v = runStep(field.steps[j], container, item);
+            if (v !== null) { item[field.field] = v; break; }
+        }
+    }
+    return item.name ? item : null;
+}
+
+function itemsIn(ctx, xpath) {
+    var out = [];
+    var containers = xpathAll(xpath, ctx);
+    for (var i = 0; i < containers.length; i++) {
+        var item = extractItem(containers[i]);
+        if (item) out.push(item);
+    }
+    return out;
+}
+
+function ancestorMatching(el, walk) {
+    var current = el;
+    for (var i = 0; i < walk.levels; i++) {
+        var parent = current.parentElement;
+        if (!parent) return null;
+        if (walk.tag && parent.tagName.toLowerCase() === walk.tag) return parent;
+        if (walk.test_text && textOf(parent).indexOf(walk.test_text) >= 0) return parent;
+        if (walk.test && xpathAll(walk.test, parent).length) return parent;
+        current = parent;
+    }
+    return walk.default_parent ? el.parentElement : null;
+}
+
+function isCategoryHeader(el, rule) {
+    var text = textOf(el);
+    if (rule.regex && new RegExp(rule.regex).test(text)) return true;
+    for (var i = 0; i < (rule.contains || []).length; i++) {
+        if (text.indexOf(rule.contains[i]) >= 0) return true;
+    }
+    var parent = el.parentElement;
+    var cls = parent ? (parent.getAttribute('class') || '') : '';
+    return !!(rule.parent_class_contains && cls.toLowerCase().indexOf(rule.parent_class_contains) >= 0);
+}
+
+function runFallback() {
+    var fb = recipe.fallback;
+    if (!fb) return;
+    var category = fb.category;
+    addCategory(category, false);
+    var anchors = xpathAll(fb.anchor);
+    for (var i = 0; i < anchors.length; i++) {
+        if (fb.category_headers && isCategoryHeader(anchors[i], fb.category_headers)) {
+            category = textOf(anchors[i]);
+            addCategory(category, true);
+            continue;
+        }
+        var container = ancestorMatching(anchors[i], fb);
+        if (!container) continue;
+        var item = extractItem(container);
+        if (item) menu[category].push(item);
+    }
+}
+
+function sectionCategoryName(section) {
+    var tags = recipe.header_tags || ['h4'];
+    for (var i = 0; i < tags.length; i++) {
+        var headers = section.getElementsByTagName(tags[i]);
+        if (headers.length) return textOf(headers[0]);
+    }
+    var cf = recipe.category_fallback;
+    if (cf) {
+        var els = xpathAll(cf.xpath, section);
+        for (var j = 0; j < els.length; j++) {
+            var t = textOf(els[j]);
+            var lower = t.toLowerCase();
+            var keyword = (cf.keywords || []).some(function (k) { return lower.indexOf(k) >= 0; });
+            if (t && (keyword || t.length < cf.max_len)) return t;
+        }
+    }
+    return 'Uncategorized';
+}
+
+function sectionItems(section, category) {
+    var cf = recipe.candidate_filter;
+    if (!cf) {
+        menu[category] = menu[category].concat(itemsIn(section, recipe.item_xpath));
+        return;
+    }
+    var seen = Object.create(null);
+    var candidates = xpathAll(recipe.item_xpath, section);
+    for (var i = 0; i < candidates.length; i++) {
+        var text = textOf(candidates[i]);
+        if (text.length < cf.min_len || seen[text]) continue;
+        var cls = (candidates[i].getAttribute('class') || '').toLowerCase();
+        if (!new RegExp(cf.regex).test(text) && cls.indexOf(cf.class_contains) < 0) continue;
+        var item = extractItem(candidates[i]);
+        if (!item) continue;
+        var key = item.name + '-' + item.price;
+        if (!seen[key]) { menu[category].push(item); seen[key] = true; }
+    }
+}
+
+function runSections() {
+    var sections = xpathAll(recipe.section_xpath);
+    var sf = recipe.section_fallback;
+    if (!sections.length && sf) {
+        var anchors = xpathAll(sf.anchor);
+        for (var i = 0; i < anchors.length; i++) {
+            var section = ancestorMatching(anchors[i], sf);
+            if (section && sections.indexOf(section) < 0) sections.push(section);
+        }
+    }
+    for (var j = 0; j < sections.length; j++) {
+        var s = sections[j];
+        if (recipe.require_header && !s.getElementsByTagName(recipe.header_tags[0]).length) continue;
+        var name = sectionCategoryName(s);
+        var st = textOf(s);
+        if (recipe.skip_price_sections_under && st.indexOf('₹') >= 0 && st.length < recipe.skip_price_sections_under) continue;
+        addCategory(name, recipe.merge_categories);
+        sectionItems(s, name);
+    }
+    if (!order.length) runFallback();
+}
+
+function runHeaders() {
+    var headers = xpathAll(recipe.header_xpath);
+    var seen = Object.create(null);
+    for (var i = 0; i < headers.length; i++) {
+        var name = textOf(headers[i]);
+        if (!name || seen[name]) continue;
+        seen[name] = true;
+        addCategory(name, false);
+        var section = ancestorMatching(headers[i], recipe.section_walk);
+        if (section) menu[name] = menu[name].concat(itemsIn(section, recipe.item_xpath));
+    }
+    if (!order.length) runFallback();
+}
+
+function categoryItems(name) {
+    if (!recipe.scope_xpath) {
+        menu[name] = menu[name].concat(itemsIn(document, recipe.item_xpath));
+        return;
+    }
+    var scopes = xpathAll(recipe.scope_xpath);
+    for (var i = 0; i < scopes.length; i++) {
+        var items = itemsIn(scopes[i], recipe.item_xpath);
+        if (items.length) { menu[name] = menu[name].concat(items); return; }
+    }
+}
+
+function itemSnapshot() {
+    var found = xpathAll(recipe.count_xpath);
+    return {first: found.length ? found[0] : null, count: found.length};
+}
+
+function waitForItems(expected, before, then) {
+    // Poll for the "(N)" item count from the category label instead of
+    // sleeping; settle_ms caps the wait per category. The previous category's
+    // items can already meet the count, so it only counts once the items
+    // differ from those before the click, or the DOM has been quiet for 500ms.
+    var start = Date.now(), last = start;
+    var observer = new MutationObserver(function () { last = Date.now(); });
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    (function check() {
+        var now = itemSnapshot(), t = Date.now();
+        var changed = now.count !== before.count || now.first !== before.first;
+        if ((now.count >= expected && (changed || t - last >= 500)) || t - start >= (recipe.settle_ms || 0)) {
+            observer.disconnect();
+            then();
+            return;
+        }
+        setTimeout(check, 50);
+    })();
+}
+
+function runCategoryClick() {
+    var labels = [];
+    for (var i = 0; i < recipe.category_xpaths.length && !labels.length; i++) {
+        labels = xpathAll(recipe.category_xpaths[i]);
+    }
+    var pattern = new RegExp(recipe.label_regex);
+    var idx = 0;
+    function next() {
+        while (idx < labels.length) {
+            var el = labels[idx++];
+            var m = pattern.exec(textOf(el));
+            if (!m) continue;
+            var name = m[1].trim();
+            addCategory(name, false);
+            var before = itemSnapshot();
+            try { el.click(); } catch (e) { continue; }
+            waitForItems(parseInt(m[2], 10), before, function () { categoryItems(name); next(); });
+            return;
+        }
+        if (!order.length) runFallback();
+        finish();
+    }
+    next();
+}
+
+function finish() {
+    var out = [];
+    for (var i = 0; i < order.length; i++) out.push([order[i], menu[order[i]]]);
+    done({categories: out});
+}
+
+try {
+    if (recipe.strategy === 'category_click') {
+        runCategoryClick();
+    } else {
+        if (recipe.strategy === 'sections') runSections();
+        else if (recipe.strategy === 'headers') runHeaders();
+        finish();
+    }
+} catch (e) {
+    done({error: String(e)});
+}
+"""
+
+
+def extract_menu_with_js(driver, recipe, timeout=120):
+    driver.set_script_timeout(timeout)
+    result = driver.execute_async_script(MENU_EXTRACTION_JS, recipe)
+    if result.get("error"):
+        raise RuntimeError(f"In-page extraction failed: {result['error']}")
+    # Categories come back as [name, items] pairs so insertion order survives
+    # the trip through the WebDriver JSON protocol.
+    return {name: items for name, items in result["categories"]}
+
+
+class WebDriverCallCounter:
+    def __init__(self):
+        self.calls = 0
+        self.commands = Counter()
+
+
+@contextmanager
+def count_webdriver_calls(driver):
+    """Count every chromedriver command issued through driver (and its elements)."""
+    counter = WebDriverCallCounter()
+    original_execute = driver.execute
+
+    def counted_execute(driver_command, params=None):
+        counter.calls += 1
+        counter.commands[driver_command] += 1
+        return original_execute(driver_command, params)
+
+    driver.execute = counted_execute
+    try:
+        yield counter
+    finally:
+        del driver.execute
+
+
+def compare_extraction_methods(scraper):
+    """Load the page once, then run the per-element and JS extraction paths on it."""
+    results = {}
+    try:
+        scraper.load_page()
+        for mode in ("element", "js"):
+            scraper.menu_data = {}
+            scraper.extraction_mode = mode
+            with count_webdriver_calls(scraper.driver) as counter:
+                start = time.perf_counter()
+                scraper.extract_menu()
+                elapsed = time.perf_counter() - start
+            results[mode] = {
+                "calls": counter.calls,
+                "seconds": elapsed,
+                "items": sum(len(items) for items in scraper.menu_data.values()),
+                "menu": scraper.menu_data,
+            }
+    finally:
+        if scraper.owns_driver and scraper.driver is not None:
+            scraper.driver.quit()
+    print(f"\n{'Method':<10}{'WebDriver calls':>18}{'Wall time (s)':>16}{'Items':>8}")
+    for mode, stats in results.items():
+        print(f"{mode:<10}{stats['calls']:>18}{stats['seconds']:>16.2f}{stats['items']:>8}")
+    same = results["element"]["menu"] == results["js"]["menu"]
+    print(f"Outputs identical: {same}")
+    return results
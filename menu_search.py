@@ -0,0 +1,214 @@
+import re
+import sys
+import time
+import argparse
+import numpy as np
+import pyarrow as pa
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from menu_index import INDEX_DIR, MenuIndex
+from menu_filters import FilterIndex, split_filters
+
+# Hybrid retrieval over the vector index: an in-memory BM25 inverted index
+# finds exact dish names, the FAISS index finds paraphrases, and the two
+# rankings are merged with reciprocal rank fusion (RRF). Both retrievers run
+# at the same time; with a latency budget, whatever has finished when the
+# budget runs out is fused and the rest is dropped. Structured filters
+# (restaurant, location, price range, veg status) are resolved first through
+# menu_filters, and both retrievers only score the rows they allow.
+
+RRF_K = 60
+DEPTH = 50
+TOKEN = re.compile(r"\w+")
+NAME_WEIGHT = 2
+
+
+def tokenize(text):
+    """Lowercase word tokens with a trailing plural "s" removed ("prawns" -> "prawn")."""
+    return [t[:-1] if len(t) > 3 and t.endswith("s") and not t.endswith("ss") else t
+            for t in TOKEN.findall(text.lower())]
+
+
+class BM25Index:
+    """Okapi BM25 over item name (counted NAME_WEIGHT times) and description."""
+
+    def __init__(self, names, descriptions, k1=1.2, b=0.75):
+        self.k1, self.b = k1, b
+        self.vocabulary = {}
+        term_ids, doc_ids = [], []
+        lengths = np.zeros(len(names), dtype=np.float32)
+        for doc, (name, description) in enumerate(zip(names, descriptions)):
+            tokens = tokenize(name or "") * NAME_WEIGHT + tokenize(description or "")
+            lengths[doc] = len(tokens)
+            for token in tokens:
+                term_ids.append(self.vocabulary.setdefault(token, len(self.vocabulary)))
+            doc_ids.extend([doc] * len(tokens))
+        # Postings in CSR form: docs[offsets[t]:offsets[t + 1]] hold term t, with frequencies in tfs.
+        count = max(len(names), 1)
+        keys, tfs = np.unique(np.array(term_ids, dtype=np.int64) * count + np.array(doc_ids, dtype=np.int64),
+                              return_counts=True)
+        terms = keys // count
+        self.docs = (keys % count).astype(np.int32)
+        self.tfs = tfs.astype(np.float32)
+        self.offsets = np.searchsorted(terms, np.arange(len(self.vocabulary) + 1))
+        document_frequency = np.diff(self.offsets)
+        self.idf = np.log1p((len(names) - document_frequency + 0.5) / (document_frequency + 0.5)).astype(np.float32)
+        self.norms = (k1 * (1 - b + b * lengths / max(lengths.mean(), 1))).astype(np.float32)
+        self.size = len(names)
+
+    @classmethod
+    def from_rows(cls, rows):
+        return cls(rows["name"].to_pylist(), rows["description"].to_pylist())
+
+    def scores(self, query, mask=None):
+        """Dense score array; with a boolean row mask, rows outside it are never scored."""
+        scores = np.zeros(self.size, dtype=np.float32)
+        for token in set(tokenize(query)):
+            term = self.vocabulary.get(token)
+            if term is None:
+                continue
+            start, end = self.offsets[term], self.offsets[term + 1]
+            docs, tfs = self.docs[start:end], self.tfs[start:end]
+            if mask is not None:
+                allowed = mask[docs]
+                docs, tfs = docs[allowed], tfs[allowed]
+            scores[docs] += self.idf[term] * tfs * (self.k1 + 1) / (tfs + self.norms[docs])
+        return scores
+
+    def search(self, query, k=DEPTH, mask=None):
+        """(scores, ids), best first, of up to k documents matching any query term."""
+        scores = self.scores(query, mask)
+        matched = np.flatnonzero(scores)
+        if len(matched) > k:
+            matched = matched[np.argpartition(-scores[matched], k - 1)[:k]]
+        order = matched[np.argsort(-scores[matched], kind="stable")]
+        return scores[order], order
+
+
+def fuse(rankings, rrf_k=RRF_K):
+    """Reciprocal rank fusion of id rankings: {id: score}, sorted best first."""
+    fused = {}
+    for ranking in rankings:
+        for rank, doc in enumerate(ranking):
+            fused[doc] = fused.get(doc, 0.0) + 1.0 / (rrf_k + rank + 1)
+    return dict(sorted(fused.items(), key=lambda item: -item[1]))
+
+
+class HybridSearcher:
+    def __init__(self, menu_index, bm25=None, depth=DEPTH, rrf_k=RRF_K, workers=2):
+        self.index = menu_index
+        self.bm25 = bm25 or BM25Index.from_rows(menu_index.rows)
+        self.filters = FilterIndex(menu_index.rows)
+        self.depth = depth
+        self.rrf_k = rrf_k
+        # workers=0 runs the retrievers one after the other in the caller's thread (no budget cut-off),
+        # for callers such as menu_service that already search from a thread pool.
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="retriever") if workers else None
+
+    @classmethod
+    def load(cls, directory=INDEX_DIR, **options):
+        return cls(MenuIndex.load(directory), **options)
+
+    def _bm25(self, query, allowed):
+        start = time.perf_counter()
+        mask = self.filters.mask(allowed) if allowed is not None else None
+        _, ids = self.bm25.search(query, self.depth, mask)
+        return "bm25", ids.tolist(), time.perf_counter() - start
+
+    def _vector(self, query, allowed, vector=None):
+        start = time.perf_counter()
+        vector = self.index.encoder.encode([query]) if vector is None else vector
+        _, ids = self.index.search_vectors(vector, self.depth, allowed)
+        return "vector", [i for i in ids[0].tolist() if i >= 0], time.perf_counter() - start
+
+    def search(self, query, k=10, budget_ms=None, mode="hybrid", filters=None, vector=None):
+        """Top-k distinct items for query, plus per-retriever timings.
+
+        mode is "hybrid", "bm25" or "vector". filters may hold restaurants,
+        location, veg_status, min_price and max_price (as returned by
+        menu_catalog.parse_question). With budget_ms, retrievers still running
+        when it expires are left out of the fusion (at least one retriever's
+        results are always waited for) and listed under "skipped". vector is
+        the query's embedding, when the caller has already encoded it.
+        """
+        start = time.perf_counter()
+        constraints = split_filters(filters)
+        allowed = self.filters.select(**constraints) if constraints else None
+        if allowed is not None and not len(allowed):
+            return {"skipped": [], "hits": [], "matched_rows": 0, "total_ms": (time.perf_counter() - start) * 1000}
+        names = {"hybrid": ("bm25", "vector"), "bm25": ("bm25",), "vector": ("vector",)}[mode]
+        if self.pool is None:
+            finished, skipped = [self._bm25(query, allowed) if name == "bm25" else
+                                 self._vector(query, allowed, vector) for name in names], []
+        else:
+            futures = {self.pool.submit(self._bm25, query, allowed) if name == "bm25" else
+                       self.pool.submit(self._vector, query, allowed, vector): name for name in names}
+            done, pending = wait(futures, timeout=budget_ms / 1000 if budget_ms is not None else None)
+            if not done:
+                done, pending = wait(futures, return_when=FIRST_COMPLETED)
+            finished, skipped = [future.result() for future in done], [futures[future] for future in pending]
+        rankings, result = [], {"skipped": sorted(skipped),
+                                "matched_rows": len(allowed) if allowed is not None else self.filters.size}
+        for name, ids, seconds in finished:
+            rankings.append(ids)
+            result[f"{name}_ms"] = seconds * 1000
+        fused = list(fuse(rankings, self.rrf_k).items())
+        # Menus often list the same dish more than once; keep only its best-ranked copy. Rows are
+        # converted a few at a time, since turning all of them into dicts costs more than the search.
+        hits, seen, chunk = [], set(), 2 * k
+        for offset in range(0, len(fused), chunk):
+            ranked = fused[offset:offset + chunk]
+            rows = self.index.rows.take(pa.array([doc for doc, _ in ranked], pa.int64())).to_pylist()
+            for row, (_, score) in zip(rows, ranked):
+                key = (row["restaurant"], row["name"], row["price"])
+                if key not in seen:
+                    seen.add(key)
+                    row["score"] = score
+                    hits.append(row)
+                    if len(hits) == k:
+                        break
+            if len(hits) == k:
+                break
+        result["hits"] = hits
+        result["total_ms"] = (time.perf_counter() - start) * 1000
+        return result
+
+    def close(self):
+        if self.pool:
+            self.pool.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hybrid BM25 + vector search over the menu index.")
+    parser.add_argument("question")
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--index", default=INDEX_DIR)
+    parser.add_argument("--mode", choices=["hybrid", "bm25", "vector"], default="hybrid")
+    parser.add_argument("--budget-ms", type=float, help="latency budget per query")
+    parser.add_argument("--restaurant", action="append", dest="restaurants", help="restaurant key; repeat for several")
+    parser.add_argument("--veg", dest="veg_status", choices=["Veg", "Non-Veg", "Unknown"])
+    parser.add_argument("--min-price", type=int)
+    parser.add_argument("--max-price", type=int)
+    parser.add_argument("--parse", action="store_true",
+                        help='take filters from the question, e.g. "veg paneer under ₹400 in Connaught Place"')
+    args = parser.parse_args()
+    question = args.question
+    filters = {key: getattr(args, key) for key in ("restaurants", "veg_status", "min_price", "max_price")}
+    if args.parse:
+        from menu_catalog import parse_question
+
+        question, parsed = parse_question(question)
+        filters.update(parsed)
+    try:
+        searcher = HybridSearcher.load(args.index)
+    except FileNotFoundError:
+        print(f"No index in {args.index}/; run: python menu_index.py build")
+        sys.exit(1)
+    result = searcher.search(question, args.k, args.budget_ms, args.mode, filters)
+    for hit in result["hits"]:
+        price = f"₹{hit['price']}" if hit["price"] is not None else ""
+        print(f"{hit['score']:.4f}  {hit['restaurant']:<18}{hit['name'][:40]:<42}{price:>7}  {hit['veg_status']}")
+    timings = ", ".join(f"{name} {result[f'{name}_ms']:.2f} ms" for name in ("bm25", "vector") if f"{name}_ms" in result)
+    skipped = f", skipped {', '.join(result['skipped'])}" if result["skipped"] else ""
+    print(f"{len(result['hits'])} results from {result['matched_rows']} rows in {result['total_ms']:.2f} ms "
+          f"({timings}{skipped})")
+    searcher.close()
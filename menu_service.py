@@ -0,0 +1,270 @@
+import sys
+import json
+import time
+import asyncio
+import argparse
+import numpy as np
+from collections import deque
+from urllib.parse import urlsplit, parse_qs
+from concurrent.futures import ThreadPoolExecutor
+from menu_index import INDEX_DIR
+from menu_filters import check_filters
+from menu_search import HybridSearcher
+from query_cache import QueryCache
+
+# Asyncio HTTP query service over the menu index, so a UI (streamlit, gradio)
+# can be a thin client:
+#
+#   GET  /search?q=paneer&k=10&mode=hybrid&veg=Veg&max_price=400&restaurant=tamasha&parse=1
+#   POST /search   {"query": "...", "k": 10, "mode": "hybrid", "filters": {...}, "parse": false}
+#   GET  /metrics  request, batch and cache counters
+#   GET  /health
+#
+# Questions arriving together are encoded together: EncoderBatcher collects
+# up to max_batch of them, waiting at most max_wait_ms after the first, and
+# runs one encoder call for the batch. Each question's BM25 and FAISS search
+# then runs in a thread pool (one after the other, so there is no latency
+# budget here), and the event loop only parses requests and writes responses.
+
+HOST = "127.0.0.1"
+PORT = 8321
+MAX_BATCH = 32
+MAX_WAIT_MS = 1.0
+WORKERS = 8
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+class EncoderBatcher:
+    def __init__(self, encoder, pool, max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS):
+        self.encoder = encoder
+        self.pool = pool
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.queue = None
+        self.task = None
+        self.stats = {"batches": 0, "encoded": 0, "largest": 0}
+
+    def start(self):
+        self.queue = asyncio.Queue()
+        self.task = asyncio.get_running_loop().create_task(self.run())
+
+    async def encode(self, text):
+        """(1, dim) vector for one question, encoded in a batch with whatever else is waiting."""
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((text, future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                vectors = await loop.run_in_executor(self.pool, self.encoder.encode, [text for text, _ in batch])
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            self.stats["batches"] += 1
+            self.stats["encoded"] += len(batch)
+            self.stats["largest"] = max(self.stats["largest"], len(batch))
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector[None, :])
+
+    def stop(self):
+        if self.task:
+            self.task.cancel()
+
+
+class MenuService:
+    def __init__(self, searcher, cache=None, max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS, workers=WORKERS):
+        self.searcher = searcher
+        self.cache = cache
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search")
+        self.batcher = EncoderBatcher(searcher.index.encoder, self.pool, max_batch, max_wait_ms)
+        self.server = None
+        self.latencies = deque(maxlen=10000)
+        self.stats = {"requests": 0, "searches": 0, "errors": 0}
+
+    @classmethod
+    def load(cls, directory=INDEX_DIR, cache=True, workers=WORKERS, **options):
+        searcher = HybridSearcher.load(directory, workers=0)
+        return cls(searcher, QueryCache(searcher) if cache else None, workers=workers, **options)
+
+    async def start(self, host=HOST, port=PORT):
+        self.batcher.start()
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.batcher.stop()
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+        self.pool.shutdown(wait=False)
+        self.searcher.close()
+
+    async def search(self, query, k=10, mode="hybrid", filters=None):
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        key = self.cache.key(query, k, mode, filters) if self.cache else None
+        result = self.cache.get(key, start=start) if self.cache else None
+        if result is None:
+            vector = await self.batcher.encode(query)
+            result = self.cache.get(key, vector, start) if self.cache else None
+            if result is None:
+                result = await loop.run_in_executor(
+                    self.pool, lambda: self.searcher.search(query, k, None, mode, filters, vector=vector))
+                if self.cache:
+                    result = self.cache.put(key, vector, result, filters)
+        result["total_ms"] = (time.perf_counter() - start) * 1000
+        self.stats["searches"] += 1
+        self.latencies.append(result["total_ms"])
+        return result
+
+    async def route(self, method, target, body):
+        url = urlsplit(target)
+        if url.path == "/health":
+            return 200, {"status": "ok", "rows": self.searcher.index.meta["rows"]}
+        if url.path == "/metrics":
+            return 200, self.metrics()
+        if url.path != "/search":
+            return 404, {"error": f"no route {url.path}"}
+        if method == "GET":
+            request = search_request(parse_qs(url.query))
+        elif method == "POST":
+            request = json.loads(body or b"{}")
+            if not isinstance(request, dict):
+                return 400, {"error": f"body must be a JSON object, not {type(request).__name__}"}
+        else:
+            return 405, {"error": f"{method} not allowed"}
+        query, filters = request.get("query") or "", request.get("filters") or {}
+        if not isinstance(query, str) or not query.strip():
+            return 400, {"error": "missing query (q=...)"}
+        query = query.strip()
+        check_filters(filters)
+        if request.get("parse"):
+            from menu_catalog import parse_question
+
+            query, parsed = parse_question(query)
+            filters = dict(filters, **parsed)
+        mode = request.get("mode", "hybrid")
+        if mode not in ("hybrid", "bm25", "vector"):
+            return 400, {"error": f"unknown mode {mode!r}"}
+        result = await self.search(query, int(request.get("k", 10)), mode, filters)
+        return 200, dict(result, query=query, filters=filters)
+
+    async def handle(self, reader, writer):
+        """One connection; requests on it are answered in turn (HTTP/1.1 keep-alive)."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                parts = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = headers.get("content-length") or "0"
+                if not length.isdigit():
+                    # Without a length the next request cannot be found, so answer and close.
+                    headers["connection"] = "close"
+                body = await reader.readexactly(int(length)) if length.isdigit() and int(length) else b""
+                self.stats["requests"] += 1
+                try:
+                    if len(parts) != 3:
+                        raise ValueError(f"malformed request line {request_line.strip()!r}")
+                    if not length.isdigit():
+                        raise ValueError(f"bad Content-Length {length!r}")
+                    method, target, _ = parts
+                    status, payload = await self.route(method, target, body)
+                except (ValueError, TypeError) as error:
+                    status, payload = 400, {"error": str(error)}
+                except Exception as error:
+                    self.stats["errors"] += 1
+                    status, payload = 500, {"error": f"{type(error).__name__}: {error}"}
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                close = headers.get("connection", "").lower() == "close"
+                writer.write((f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                              f"Content-Type: application/json; charset=utf-8\r\n"
+                              f"Content-Length: {len(data)}\r\n"
+                              f"{'Connection: close' if close else 'Connection: keep-alive'}\r\n\r\n").encode("latin-1") + data)
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def metrics(self):
+        batches = self.batcher.stats
+        metrics = dict(self.stats, **{f"encoder_{name}": value for name, value in batches.items()})
+        metrics["encoder_mean_batch"] = round(batches["encoded"] / batches["batches"], 2) if batches["batches"] else 0
+        if self.latencies:
+            metrics["p50_ms"] = round(float(np.percentile(self.latencies, 50)), 3)
+            metrics["p99_ms"] = round(float(np.percentile(self.latencies, 99)), 3)
+        if self.cache:
+            metrics["cache"] = self.cache.metrics()
+        return metrics
+
+
+def search_request(params):
+    """A POST-style request dict from /search query-string parameters."""
+    first = {name: values[0] for name, values in params.items()}
+    filters = {
+        "restaurants": params.get("restaurant"),
+        "location": first.get("location"),
+        "veg_status": first.get("veg"),
+        "min_price": int(first["min_price"]) if "min_price" in first else None,
+        "max_price": int(first["max_price"]) if "max_price" in first else None,
+    }
+    return {"query": first.get("q"), "k": first.get("k", 10), "mode": first.get("mode", "hybrid"),
+            "parse": first.get("parse") in ("1", "true"), "filters": filters}
+
+
+async def serve(args):
+    service = MenuService.load(args.index, cache=not args.no_cache, workers=args.workers,
+                               max_batch=args.max_batch, max_wait_ms=args.max_wait_ms)
+    port = await service.start(args.host, args.port)
+    print(f"Serving {service.searcher.index.meta['rows']} items from {args.index}/ on http://{args.host}:{port}/search")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP query service over the menu index.")
+    parser.add_argument("--index", default=INDEX_DIR)
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--workers", type=int, default=WORKERS, help="search threads")
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH, help="questions per encoder call")
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS, help="how long a batch waits to fill")
+    parser.add_argument("--no-cache", action="store_true", help="answer every request without the query cache")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except FileNotFoundError:
+        print(f"No index in {args.index}/; run: python menu_index.py build")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,230 @@
+import os
+import re
+import sys
+import csv
+import json
+import hashlib
+
+# Streaming output for one restaurant. Each item is appended to
+# <output>.jsonl.part, with its category, as soon as it is extracted, so a
+# crash part-way through a scrape leaves everything read so far on disk.
+# finalize() streams that log back, grouped by category, into the CSV and the
+# indented JSON, then renames all three files into place. Only byte offsets and
+# dedup digests are held in memory, never the rows themselves.
+
+CSV_HEADER = [
+    "Restaurant Name", "Location", "Operating Hours", "Contact",
+    "Category", "Item Name", "Description", "Price", "Veg Status",
+]
+PRICE_ONLY_NAME = re.compile(r'^₹\d+$')
+# json.dumps(..., ensure_ascii=False) builds a new encoder on every call.
+_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _digest(values):
+    return hashlib.blake2b("\x1f".join(values).encode("utf-8"), digest_size=16).digest()
+
+
+class RowDeduper:
+    """Applies a save policy to CSV rows one at a time."""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.seen = set()
+        self.best = {}
+        self.replaced = {}
+        self.rows = 0
+
+    def accept(self, row):
+        """Return the row to write, or None if the policy drops it."""
+        dedupe = self.policy.get("dedupe")
+        if self.policy.get("skip_price_names") and PRICE_ONLY_NAME.match(row[5].strip()):
+            return None
+        if dedupe in ("stripped_row", "name_price"):
+            row = row[:5] + tuple((value or "").strip() for value in row[5:])
+        if dedupe == "name_price":
+            # One row per (name, price). A later copy with a longer description
+            # or a known veg status replaces the first one's row in place.
+            key = _digest([row[5], row[7]])
+            description_length, veg_known = len(row[6]), row[8] != "Unknown"
+            existing = self.best.get(key)
+            if existing is not None:
+                if description_length > existing[0] or (veg_known and not existing[1]):
+                    self.best[key] = (description_length, veg_known, existing[2])
+                    self.replaced[existing[2]] = row
+                return None
+            self.best[key] = (description_length, veg_known, self.rows)
+        elif dedupe in ("row", "stripped_row"):
+            key = _digest(row)
+            if key in self.seen:
+                return None
+            self.seen.add(key)
+        self.rows += 1
+        return row
+
+
+class MenuSink:
+    def __init__(self, output, restaurant_info, policy, resume=False):
+        self.output = output
+        self.policy = policy
+        self.prefix = (restaurant_info["name"], restaurant_info["location"],
+                       restaurant_info["hours"], restaurant_info["contact"])
+        self.log_path = f"{output}.jsonl.part"
+        # category -> [[start, end], ...] byte ranges of its item lines in the log.
+        self.spans = {}
+        self.items = 0
+        if resume and os.path.exists(self.log_path):
+            self.log = open(self.log_path, "r+b")
+            self._replay()
+        else:
+            self.log = open(self.log_path, "wb")
+
+    def add_category(self, category, reset=True):
+        """Start a category; reset drops what was logged for it before, like menu_data[name] = []."""
+        self._append({"category": category, "reset": reset})
+        self.log.flush()
+
+    def add(self, category, items):
+        self.spans.setdefault(category, [])
+        for item in items:
+            self._append({"category": category, "item": item})
+        self.log.flush()
+
+    def _append(self, record):
+        start = self.log.tell()
+        self.log.write(_encode(record).encode("utf-8") + b"\n")
+        self._index(record, start, self.log.tell())
+
+    def _index(self, record, start, end):
+        category = record["category"]
+        if "item" not in record:
+            if record["reset"] or category not in self.spans:
+                self.spans[category] = []
+            return
+        spans = self.spans.setdefault(category, [])
+        if spans and spans[-1][1] == start:
+            spans[-1][1] = end
+        else:
+            spans.append([start, end])
+        self.items += 1
+
+    def _replay(self):
+        """Rebuild the index from an existing log, dropping a last line cut short by a crash."""
+        while True:
+            start = self.log.tell()
+            line = self.log.readline()
+            if not line.endswith(b"\n"):
+                self.log.seek(start)
+                self.log.truncate()
+                return
+            self._index(json.loads(line), start, self.log.tell())
+
+    def finalize(self):
+        """Write <output>.csv and <output>.json from the log and move them and <output>.jsonl into place."""
+        self._close()
+        csv_tmp = f"{self.output}.csv.part"
+        json_tmp = f"{self.output}.json.part"
+        deduper = RowDeduper(self.policy)
+        with open(self.log_path, "rb") as log, \
+                open(csv_tmp, "w", newline="", encoding="utf-8") as csv_file, \
+                open(json_tmp, "w", encoding="utf-8") as json_file:
+            self._write_outputs(log, csv.writer(csv_file), json_file, deduper)
+            for f in (csv_file, json_file):
+                f.flush()
+                os.fsync(f.fileno())
+        if deduper.replaced:
+            self._patch_rows(csv_tmp, deduper.replaced)
+        os.replace(self.log_path, f"{self.output}.jsonl")
+        os.replace(csv_tmp, f"{self.output}.csv")
+        os.replace(json_tmp, f"{self.output}.json")
+
+    def abort(self):
+        """Close the log and leave it on disk; `python menu_sink.py recover` turns it into outputs."""
+        self._close()
+        print(f"Partial results ({self.items} items) kept in {self.log_path}")
+
+    def discard(self):
+        self._close()
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
+
+    def _close(self):
+        if self.log.closed:
+            return
+        self.log.flush()
+        os.fsync(self.log.fileno())
+        self.log.close()
+
+    def _categories(self):
+        drop_empty = self.policy.get("drop_empty_categories")
+        return [category for category, spans in self.spans.items() if spans or not drop_empty]
+
+    def _items(self, log, category):
+        for start, end in self.spans[category]:
+            log.seek(start)
+            while log.tell() < end:
+                yield json.loads(log.readline())["item"]
+
+    def _write_outputs(self, log, writer, json_file, deduper):
+        """One pass over the log, category by category: CSV rows and the indented JSON."""
+        writer.writerow(CSV_HEADER)
+        categories = self._categories()
+        json_file.write("{" if categories else "{}")
+        for i, category in enumerate(categories):
+            json_file.write(("," if i else "") + "\n    " + _encode(category) + ": ")
+            first = True
+            for item in self._items(log, category):
+                json_file.write(("[" if first else ",") + "\n        " + _indented_item(item))
+                first = False
+                row = deduper.accept(self.prefix + (category,) + (
+                    item.get("name", ""), item.get("description", ""),
+                    item.get("price", ""), item.get("veg_status", ""),
+                ))
+                if row is not None:
+                    writer.writerow(row)
+            json_file.write("[]" if first else "\n    ]")
+        if categories:
+            json_file.write("\n}")
+
+    def _patch_rows(self, path, replaced):
+        patched_path = f"{path}.patched"
+        with open(path, newline="", encoding="utf-8") as source, \
+                open(patched_path, "w", newline="", encoding="utf-8") as target:
+            reader = csv.reader(source)
+            writer = csv.writer(target)
+            writer.writerow(next(reader))
+            for index, row in enumerate(reader):
+                writer.writerow(replaced.get(index, row))
+            target.flush()
+            os.fsync(target.fileno())
+        os.replace(patched_path, path)
+
+
+def _indented_item(item):
+    """json.dumps(item, indent=4) nested two levels deep, as json.dump(menu_data, indent=4) lays it out."""
+    if not item or any(isinstance(value, (dict, list)) for value in item.values()):
+        return json.dumps(item, indent=4, ensure_ascii=False).replace("\n", "\n        ")
+    # Flat items (the usual case) skip the pure-Python indenting encoder.
+    fields = ",\n            ".join(
+        f"{_encode(key)}: {_encode(value)}" for key, value in item.items()
+    )
+    return "{\n            " + fields + "\n        }"
+
+
+def recover(output, restaurant_info, policy):
+    """Finalize the <output>.jsonl.part left behind by a failed scrape."""
+    sink = MenuSink(output, restaurant_info, policy, resume=True)
+    sink.finalize()
+    return sink.items
+
+
+if __name__ == "__main__":
+    # python menu_sink.py recover tamasha
+    if len(sys.argv) != 3 or sys.argv[1] != "recover":
+        print("Usage: python menu_sink.py recover <restaurant_key>")
+        sys.exit(1)
+    from restaurant_config import load_restaurant
+
+    restaurant = load_restaurant(sys.argv[2])
+    items = recover(restaurant["output"], restaurant["restaurant_info"], restaurant["save"])
+    print(f"Recovered {items} items into {restaurant['output']}.json, .csv and .jsonl")
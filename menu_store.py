@@ -0,0 +1,223 @@
+import os
+import sys
+import glob
+import json
+import argparse
+import datetime
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
+from restaurant_config import restaurants_by_output
+from menu_cleaning import CSV_COLUMNS, VEG_STATUSES, clean_menu
+
+# Consolidated menu store. Every *_menu.csv (or *_menu.json when there is no
+# CSV) is loaded into one Arrow dataset:
+#
+#   menu_store/restaurants.arrow                 one row of metadata per restaurant
+#   menu_store/items/restaurant=<key>/scrape_date=<YYYY-MM-DD>/items.arrow
+#
+# Item files are uncompressed Arrow IPC, so readers memory-map them instead of
+# parsing. Rows go through menu_cleaning first; category and veg status are
+# dictionary-encoded, prices are integers, and restaurant/scrape_date come
+# from the partition path.
+
+STORE_ROOT = "menu_store"
+
+ITEM_SCHEMA = pa.schema([
+    ("position", pa.int32()),
+    ("category", pa.dictionary(pa.int32(), pa.string())),
+    ("name", pa.string()),
+    ("description", pa.string()),
+    ("price", pa.int32()),
+    ("veg_status", pa.dictionary(pa.int8(), pa.string())),
+])
+RESTAURANT_SCHEMA = pa.schema([
+    ("restaurant", pa.string()),
+    ("name", pa.string()),
+    ("location", pa.string()),
+    ("hours", pa.string()),
+    ("contact", pa.string()),
+    ("output", pa.string()),
+])
+
+
+def read_menu_csv(path):
+    options = pa_csv.ConvertOptions(column_types={column: pa.string() for column in CSV_COLUMNS},
+                                    strings_can_be_null=False)
+    table = pa_csv.read_csv(path, parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                            convert_options=options)
+    return table.rename_columns([CSV_COLUMNS[name] for name in table.column_names])
+
+
+def read_menu_json(path, restaurant_info):
+    with open(path, encoding="utf-8") as f:
+        return menu_table(json.load(f), restaurant_info)
+
+
+def menu_table(menu_data, restaurant_info):
+    """A scraper's menu_data dict as a table with the same columns as read_menu_csv()."""
+    rows = [(category, item.get("name", ""), item.get("description", ""), item.get("price", ""),
+             item.get("veg_status", "Unknown")) for category, items in menu_data.items() for item in items]
+    columns = list(zip(*rows)) if rows else [()] * 5
+    table = pa.table({name: pa.array(values, pa.string()) for name, values in
+                      zip(["category", "name", "description", "price", "veg_status"], columns)})
+    for field, value in (("restaurant_name", "name"), ("location", "location"),
+                         ("hours", "hours"), ("contact", "contact")):
+        table = table.append_column(field, pa.array([restaurant_info[value]] * len(table), pa.string()))
+    return table
+
+
+def to_items(table, report=None):
+    """Clean one restaurant's rows and normalise them into ITEM_SCHEMA.
+
+    Pass a dict as report to collect menu_cleaning's change counts.
+    """
+    frame, changes = clean_menu(table.to_pandas())
+    if report is not None:
+        report.update(changes)
+    category_codes, categories = pd.factorize(frame["category"])
+    return pa.table([
+        pa.array(range(len(frame)), pa.int32()),
+        pa.DictionaryArray.from_arrays(pa.array(category_codes, pa.int32()), pa.array(categories, pa.string())),
+        pa.array(frame["name"], pa.string()),
+        pa.array(frame["description"], pa.string()),
+        pa.array(frame["price"], pa.int32()),
+        pa.DictionaryArray.from_arrays(pa.array(frame["veg_status"].cat.codes, pa.int8()), pa.array(VEG_STATUSES)),
+    ], schema=ITEM_SCHEMA)
+
+
+def find_sources(directory="."):
+    """Each output's CSV, or its JSON when no CSV was written."""
+    sources = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*_menu.json"))):
+        sources[os.path.basename(path)[:-len(".json")]] = path
+    for path in sorted(glob.glob(os.path.join(directory, "*_menu.csv"))):
+        sources[os.path.basename(path)[:-len(".csv")]] = path
+    return sources
+
+
+def partition_path(root, restaurant, scrape_date):
+    return os.path.join(root, "items", f"restaurant={restaurant}", f"scrape_date={scrape_date}", "items.arrow")
+
+
+def write_ipc(table, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def consolidate(directory=".", root=STORE_ROOT, scrape_date=None):
+    """Load every scraper output in `directory` into the store; returns {restaurant: item count}."""
+    configs = restaurants_by_output()
+    restaurants = {row["restaurant"]: row for row in read_restaurants(root).to_pylist()}
+    written = {}
+    for output, path in find_sources(directory).items():
+        config = configs.get(output)
+        key = config["key"] if config else output[:-len("_menu")]
+        if path.endswith(".csv"):
+            table = read_menu_csv(path)
+        elif config:
+            table = read_menu_json(path, config["restaurant_info"])
+        else:
+            print(f"Skipping {path}: no CSV and no restaurants.json entry for its metadata")
+            continue
+        date = scrape_date or datetime.date.fromtimestamp(os.path.getmtime(path)).isoformat()
+        if len(table):
+            info = {column: table[column][0].as_py() for column in ("restaurant_name", "location", "hours", "contact")}
+        else:
+            info = dict(config["restaurant_info"], restaurant_name=config["restaurant_info"]["name"]) if config else {}
+        restaurants[key] = {
+            "restaurant": key, "name": info.get("restaurant_name", key), "location": info.get("location", ""),
+            "hours": info.get("hours", ""), "contact": info.get("contact", ""), "output": output,
+        }
+        report = {}
+        items = to_items(table, report)
+        write_ipc(items, partition_path(root, key, date))
+        written[key] = len(items)
+        dropped = report["rows_in"] - report["rows_out"]
+        print(f"{path} -> {partition_path(root, key, date)} ({len(items)} items"
+              f"{f', {dropped} noise rows dropped' if dropped else ''})")
+    write_ipc(pa.Table.from_pylist(list(restaurants.values()), schema=RESTAURANT_SCHEMA),
+              os.path.join(root, "restaurants.arrow"))
+    return written
+
+
+def read_restaurants(root=STORE_ROOT):
+    path = os.path.join(root, "restaurants.arrow")
+    if not os.path.exists(path):
+        return RESTAURANT_SCHEMA.empty_table()
+    return pa.ipc.open_file(pa.memory_map(path)).read_all()
+
+
+def partitions(root=STORE_ROOT):
+    """{restaurant: [scrape_date, ...]} with dates in ascending order."""
+    found = {}
+    for path in glob.glob(os.path.join(root, "items", "restaurant=*", "scrape_date=*", "items.arrow")):
+        date_dir = os.path.dirname(path)
+        restaurant = os.path.basename(os.path.dirname(date_dir)).split("=", 1)[1]
+        found.setdefault(restaurant, []).append(os.path.basename(date_dir).split("=", 1)[1])
+    return {restaurant: sorted(dates) for restaurant, dates in sorted(found.items())}
+
+
+def load_items(root=STORE_ROOT, restaurants=None, scrape_date=None):
+    """Memory-map the item partitions into one table.
+
+    By default the latest scrape of every restaurant is loaded; pass
+    scrape_date to load that day instead.
+    """
+    tables = []
+    for restaurant, dates in partitions(root).items():
+        if restaurants and restaurant not in restaurants:
+            continue
+        date = scrape_date if scrape_date else dates[-1]
+        if date not in dates:
+            continue
+        table = pa.ipc.open_file(pa.memory_map(partition_path(root, restaurant, date))).read_all()
+        constant = pa.array([0] * len(table), pa.int32())
+        table = table.append_column("restaurant", pa.DictionaryArray.from_arrays(constant, pa.array([restaurant])))
+        table = table.append_column("scrape_date", pa.array([datetime.date.fromisoformat(date)] * len(table), pa.date32()))
+        tables.append(table)
+    if not tables:
+        return ITEM_SCHEMA.append(pa.field("restaurant", pa.dictionary(pa.int32(), pa.string()))).append(
+            pa.field("scrape_date", pa.date32())).empty_table()
+    # Each partition has its own category dictionary; unify them so the table
+    # can be grouped and filtered as one (only the small index columns are copied).
+    return pa.concat_tables(tables).unify_dictionaries()
+
+
+def summary(items):
+    grouped = items.group_by("restaurant").aggregate([
+        ("name", "count"), ("category", "count_distinct"), ("price", "approximate_median"),
+        ("price", "min"), ("price", "max"),
+    ])
+    veg = pc.equal(pc.cast(items["veg_status"], pa.string()), "Veg")
+    veg_counts = items.append_column("is_veg", pc.cast(veg, pa.int32())).group_by("restaurant").aggregate([("is_veg", "sum")])
+    veg_by_restaurant = dict(zip(veg_counts["restaurant"].to_pylist(), veg_counts["is_veg_sum"].to_pylist()))
+    rows = grouped.to_pylist()
+    for row in rows:
+        row["veg"] = veg_by_restaurant[row["restaurant"]]
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Consolidated Arrow store of scraped menus.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("consolidate", help="load *_menu.csv / *_menu.json into the store")
+    build.add_argument("--dir", default=".", help="directory holding the scraper outputs")
+    build.add_argument("--date", help="scrape date for the partitions (default: each file's modification date)")
+    build.add_argument("--root", default=STORE_ROOT)
+    show = commands.add_parser("show", help="summarise the latest scrape of each restaurant")
+    show.add_argument("--root", default=STORE_ROOT)
+    args = parser.parse_args()
+    if args.command == "consolidate":
+        written = consolidate(args.dir, args.root, args.date)
+        print(f"Stored {sum(written.values())} items from {len(written)} restaurants in {args.root}/")
+        sys.exit(0)
+    items = load_items(args.root)
+    print(f"{'Restaurant':<20}{'Items':>7}{'Categories':>12}{'Veg':>6}{'Min ₹':>8}{'Median ₹':>10}{'Max ₹':>8}")
+    for row in summary(items):
+        print(f"{row['restaurant']:<20}{row['name_count']:>7}{row['category_count_distinct']:>12}{row['veg']:>6}"
+              f"{row['price_min'] or 0:>8}{row['price_approximate_median'] or 0:>10.0f}{row['price_max'] or 0:>8}")
@@ -0,0 +1,170 @@
+import time
+
+# Condition-based waits. Each wait runs as one execute_async_script call that
+# polls inside the page, so waiting costs a single WebDriver round trip and ends
+# as soon as the condition holds instead of after a fixed sleep.
+
+DEFAULT_STAGE_TIMEOUTS = {
+    "post_load": 10.0,
+    "cookie_consent": 3.0,
+    "category_click": 5.0,
+}
+
+DOM_QUIET_JS = r"""
+var quietMs = arguments[0], timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var start = performance.now(), last = start;
+var observer = new MutationObserver(function () { last = performance.now(); });
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+(function check() {
+    var now = performance.now();
+    if (now - last >= quietMs || now - start >= timeoutMs) {
+        observer.disconnect();
+        done(now - last >= quietMs);
+        return;
+    }
+    setTimeout(check, 50);
+})();
+"""
+
+NETWORK_IDLE_JS = r"""
+var idleMs = arguments[0], timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var start = performance.now(), last = start;
+var observer = new PerformanceObserver(function () { last = performance.now(); });
+observer.observe({type: 'resource', buffered: false});
+(function check() {
+    var now = performance.now();
+    if (now - last >= idleMs || now - start >= timeoutMs) {
+        observer.disconnect();
+        done(now - last >= idleMs);
+        return;
+    }
+    setTimeout(check, 50);
+})();
+"""
+
+# The item xpath usually matches across the whole document, so the previous
+# category's items can already meet the count before a click has any effect.
+# MARK_ITEMS_JS records the first matching item and the count before the click;
+# ITEM_COUNT_JS then waits for the count to be met after the items changed (a
+# different first item, the old one detached, or a different count), or, if
+# nothing changes, after the DOM has been quiet for quietMs.
+MARK_ITEMS_JS = r"""
+var found = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+window.__pageWaitItems = {first: found.snapshotLength ? found.snapshotItem(0) : null, count: found.snapshotLength};
+"""
+
+ITEM_COUNT_JS = r"""
+var xpath = arguments[0], expected = arguments[1], timeoutMs = arguments[2], quietMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var before = window.__pageWaitItems || null;
+window.__pageWaitItems = null;
+var start = performance.now(), last = start;
+var observer = new MutationObserver(function () { last = performance.now(); });
+observer.observe(document.documentElement, {childList: true, subtree: true});
+(function check() {
+    var found = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var count = found.snapshotLength, first = count ? found.snapshotItem(0) : null;
+    var changed = !before || count !== before.count || first !== before.first;
+    var now = performance.now();
+    var met = count >= expected && (changed || now - last >= quietMs);
+    if (met || now - start >= timeoutMs) {
+        observer.disconnect();
+        done(met);
+        return;
+    }
+    setTimeout(check, 50);
+})();
+"""
+
+
+class PageWaiter:
+    def __init__(self, driver, timeouts=None):
+        self.driver = driver
+        self.timeouts = dict(DEFAULT_STAGE_TIMEOUTS, **(timeouts or {}))
+        self.timings = []
+
+    def _run(self, stage, condition, script, args, timeout, baseline):
+        self.driver.set_script_timeout(timeout + 5)
+        start = time.perf_counter()
+        try:
+            satisfied = bool(self.driver.execute_async_script(script, *args))
+        except Exception as e:
+            print(f"Wait for {condition} during {stage} failed: {e}")
+            satisfied = False
+        elapsed = time.perf_counter() - start
+        self.timings.append({
+            "stage": stage,
+            "condition": condition,
+            "seconds": elapsed,
+            "satisfied": satisfied,
+            "replaced_sleep": baseline,
+        })
+        return satisfied
+
+    def _remaining(self, stage, started):
+        return max(self.timeouts[stage] - (time.perf_counter() - started), 0.1)
+
+    def wait_for_dom_quiet(self, stage, quiet_ms=500, baseline=0.0, timeout=None):
+        timeout = self.timeouts[stage] if timeout is None else timeout
+        return self._run(stage, f"dom quiet {quiet_ms}ms", DOM_QUIET_JS,
+                         (quiet_ms, timeout * 1000), timeout, baseline)
+
+    def wait_for_network_idle(self, stage, idle_ms=500, baseline=0.0, timeout=None):
+        timeout = self.timeouts[stage] if timeout is None else timeout
+        return self._run(stage, f"network idle {idle_ms}ms", NETWORK_IDLE_JS,
+                         (idle_ms, timeout * 1000), timeout, baseline)
+
+    def mark_items(self, xpath):
+        """Remember the items xpath matches now; call before the click that wait_for_item_count waits on."""
+        try:
+            self.driver.execute_script(MARK_ITEMS_JS, xpath)
+        except Exception as e:
+            print(f"Could not mark items before waiting: {e}")
+
+    def wait_for_item_count(self, stage, xpath, expected, baseline=0.0, quiet_ms=500):
+        """At least expected items, once they differ from those seen by mark_items()."""
+        timeout = self.timeouts[stage]
+        return self._run(stage, f"{expected} items", ITEM_COUNT_JS,
+                         (xpath, expected, timeout * 1000, quiet_ms), timeout, baseline)
+
+    def wait_for_page_ready(self, stage, baseline=0.0):
+        """Network idle, then DOM quiet, both inside the stage's timeout."""
+        started = time.perf_counter()
+        self.wait_for_network_idle(stage, baseline=baseline, timeout=self._remaining(stage, started))
+        return self.wait_for_dom_quiet(stage, timeout=self._remaining(stage, started))
+
+    def report(self):
+        if not self.timings:
+            return
+        print(f"\n{'Stage':<16}{'Condition':<22}{'Waited (s)':>11}{'Met':>6}{'Fixed sleep (s)':>17}")
+        for t in self.timings:
+            print(f"{t['stage']:<16}{t['condition']:<22}{t['seconds']:>11.2f}{'yes' if t['satisfied'] else 'no':>6}{t['replaced_sleep']:>17.1f}")
+        waited = sum(t["seconds"] for t in self.timings)
+        replaced = sum(t["replaced_sleep"] for t in self.timings)
+        print(f"Total waited: {waited:.2f}s vs {replaced:.1f}s of fixed sleeps ({replaced - waited:+.2f}s saved)")
+
+
+class NoWait:
+    """Stand-in used when there is no live page to wait on (HTML snapshots)."""
+
+    timings = []
+
+    def wait_for_dom_quiet(self, stage, quiet_ms=500, baseline=0.0, timeout=None):
+        return True
+
+    def wait_for_network_idle(self, stage, idle_ms=500, baseline=0.0, timeout=None):
+        return True
+
+    def mark_items(self, xpath):
+        pass
+
+    def wait_for_item_count(self, stage, xpath, expected, baseline=0.0, quiet_ms=500):
+        return True
+
+    def wait_for_page_ready(self, stage, baseline=0.0):
+        return True
+
+    def report(self):
+        pass
@@ -0,0 +1,250 @@
+import re
+import sys
+import time
+import argparse
+import threading
+import numpy as np
+from collections import OrderedDict
+from menu_index import INDEX_DIR
+from menu_catalog import name_key
+from menu_filters import split_filters
+from menu_search import HybridSearcher
+
+# Two-tier cache in front of HybridSearcher.search():
+#
+#   exact     an LRU keyed on the normalised question (lowercase, punctuation
+#             and extra spaces removed) plus mode, k and filters
+#   semantic  a question whose embedding is within `threshold` cosine of a
+#             cached question with the same mode, k and filters gets that
+#             question's answer
+#
+# Entries expire after `ttl` seconds. reload() swaps in a rebuilt index and
+# drops only the entries that a changed restaurant menu could affect, found
+# by comparing the per-restaurant hashes in the two indexes' meta.json.
+
+CAPACITY = 1024
+TTL_SECONDS = 600
+SEMANTIC_THRESHOLD = 0.9
+WORD = re.compile(r"\w+")
+
+
+def normalize_query(query):
+    return " ".join(WORD.findall(query.lower()))
+
+
+def filter_key(filters):
+    """Hashable, order-independent form of a filters dict."""
+    constraints = split_filters(filters)
+    if "restaurants" in constraints:
+        constraints["restaurants"] = tuple(sorted({name_key(name) for name in constraints["restaurants"]}))
+    if "location" in constraints:
+        constraints["location"] = constraints["location"].lower()
+    return tuple(sorted(constraints.items()))
+
+
+class CacheEntry:
+    def __init__(self, result, created, slot, restaurants, scope):
+        self.result = result
+        self.created = created
+        self.slot = slot
+        # Restaurants in the answer, and the restaurants the filters allow (None: all of them).
+        self.restaurants = restaurants
+        self.scope = scope
+
+
+class QueryCache:
+    def __init__(self, searcher, capacity=CAPACITY, ttl=TTL_SECONDS, threshold=SEMANTIC_THRESHOLD,
+                 clock=time.monotonic):
+        """threshold=None turns the semantic tier off; ttl=None never expires entries."""
+        self.searcher = searcher
+        self.capacity = capacity
+        self.ttl = ttl
+        self.threshold = threshold
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.stats = {"exact_hits": 0, "semantic_hits": 0, "misses": 0, "uncached": 0,
+                      "expired": 0, "evicted": 0, "invalidated": 0}
+        self._reset()
+
+    def _reset(self):
+        # Least recently used first.
+        self.entries = OrderedDict()
+        # Question embeddings by slot; groups holds each slot's (mode, k, filters) id, -1 when free.
+        self.vectors = np.zeros((self.capacity, self.searcher.index.encoder.dim), dtype=np.float32)
+        self.groups = np.full(self.capacity, -1, dtype=np.int64)
+        self.slot_keys = [None] * self.capacity
+        self.group_ids = {}
+        self.free = list(range(self.capacity - 1, -1, -1))
+
+    def key(self, query, k=10, mode="hybrid", filters=None):
+        return normalize_query(query), mode, k, filter_key(filters)
+
+    def get(self, key, vector=None, start=None):
+        """The cached answer for key, or with a question vector the nearest cached one; None on a miss.
+
+        Callers that encode the question themselves (menu_service batches it)
+        check the exact tier first, then again with the vector, then put().
+        """
+        start = time.perf_counter() if start is None else start
+        with self.lock:
+            if vector is None:
+                entry, source = self._get(key), "exact"
+            elif self.threshold is not None:
+                entry, source = self._nearest(key[1:], vector[0]), "semantic"
+            else:
+                entry = None
+            if entry is None:
+                return None
+            self.stats[f"{source}_hits"] += 1
+            result = dict(entry.result, cache=source)
+        result["hits"] = [dict(hit) for hit in result["hits"]]
+        result["total_ms"] = (time.perf_counter() - start) * 1000
+        return result
+
+    def put(self, key, vector, result, filters=None):
+        """Record a miss and keep its answer."""
+        with self.lock:
+            self.stats["misses"] += 1
+            # A retriever cut off by the latency budget leaves a partial answer, not worth keeping.
+            if result["skipped"]:
+                self.stats["uncached"] += 1
+            else:
+                self._put(key, vector[0], result, filters)
+        return dict(result, cache="miss")
+
+    def search(self, query, k=10, budget_ms=None, mode="hybrid", filters=None):
+        """HybridSearcher.search() through the cache; the result's "cache" is "exact", "semantic" or "miss"."""
+        start = time.perf_counter()
+        key = self.key(query, k, mode, filters)
+        result = self.get(key, start=start)
+        if result:
+            return result
+        vector = self.searcher.index.encoder.encode([query])
+        result = self.get(key, vector, start)
+        if result:
+            return result
+        result = self.put(key, vector, self.searcher.search(query, k, budget_ms, mode, filters, vector=vector), filters)
+        result["total_ms"] = (time.perf_counter() - start) * 1000
+        return result
+
+    def _get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if self.ttl is not None and self.clock() - entry.created > self.ttl:
+            self._remove(key)
+            self.stats["expired"] += 1
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def _nearest(self, group_key, vector):
+        group = self.group_ids.get(group_key)
+        if group is None:
+            return None
+        slots = np.flatnonzero(self.groups == group)
+        if not len(slots):
+            return None
+        similarities = self.vectors[slots] @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+        return self._get(self.slot_keys[slots[best]])
+
+    def _put(self, key, vector, result, filters):
+        if key in self.entries:
+            self._remove(key)
+        while len(self.entries) >= self.capacity:
+            self._remove(next(iter(self.entries)))
+            self.stats["evicted"] += 1
+        slot = self.free.pop()
+        self.vectors[slot] = vector
+        self.groups[slot] = self.group_ids.setdefault(key[1:], len(self.group_ids))
+        self.slot_keys[slot] = key
+        restaurants = {hit["restaurant"].lower() for hit in result["hits"]}
+        allowed = split_filters(filters).get("restaurants")
+        # A location filter can match restaurants added later, so only a restaurant list narrows the scope.
+        scope = {key.lower() for key in self.searcher.filters.restaurant_keys(allowed)} if allowed else None
+        self.entries[key] = CacheEntry(result, self.clock(), slot, restaurants, scope)
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        self.groups[entry.slot] = -1
+        self.slot_keys[entry.slot] = None
+        self.free.append(entry.slot)
+
+    def invalidate(self, restaurants):
+        """Drop every entry a change to these restaurants' menus could affect; returns how many.
+
+        That is entries whose answer came from one of them, and entries whose
+        filters did not rule them out.
+        """
+        names = {name.lower() for name in restaurants}
+        with self.lock:
+            stale = [key for key, entry in self.entries.items()
+                     if entry.restaurants & names or entry.scope is None or entry.scope & names]
+            for key in stale:
+                self._remove(key)
+            self.stats["invalidated"] += len(stale)
+        return len(stale)
+
+    def clear(self):
+        with self.lock:
+            self.stats["invalidated"] += len(self.entries)
+            self._reset()
+
+    def reload(self, searcher):
+        """Serve from a rebuilt index; returns the restaurants whose menus changed (None: everything was dropped)."""
+        old, new = self.searcher.index.meta, searcher.index.meta
+        if old["encoder_version"] != new["encoder_version"] or "restaurants" not in old or "restaurants" not in new:
+            # Cached question embeddings are not comparable with the new encoder's.
+            with self.lock:
+                self.searcher = searcher
+                self.stats["invalidated"] += len(self.entries)
+                self._reset()
+            return None
+        changed = {name for name in old["restaurants"].keys() | new["restaurants"].keys()
+                   if old["restaurants"].get(name) != new["restaurants"].get(name)}
+        self.searcher = searcher
+        if changed:
+            self.invalidate(changed)
+        return changed
+
+    def hit_rate(self):
+        hits = self.stats["exact_hits"] + self.stats["semantic_hits"]
+        lookups = hits + self.stats["misses"]
+        return hits / lookups if lookups else 0.0
+
+    def metrics(self):
+        return dict(self.stats, entries=len(self.entries), hit_rate=round(self.hit_rate(), 4))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Answer questions (one per line on stdin) through the query cache.")
+    parser.add_argument("--index", default=INDEX_DIR)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--mode", choices=["hybrid", "bm25", "vector"], default="hybrid")
+    parser.add_argument("--ttl", type=float, default=TTL_SECONDS)
+    parser.add_argument("--threshold", type=float, default=SEMANTIC_THRESHOLD,
+                        help="cosine similarity for a semantic hit; 0 or less disables the tier")
+    parser.add_argument("--parse", action="store_true", help="take filters from each question")
+    args = parser.parse_args()
+    try:
+        searcher = HybridSearcher.load(args.index)
+    except FileNotFoundError:
+        print(f"No index in {args.index}/; run: python menu_index.py build")
+        sys.exit(1)
+    cache = QueryCache(searcher, ttl=args.ttl, threshold=args.threshold if args.threshold > 0 else None)
+    for line in sys.stdin:
+        question, filters = line.strip(), None
+        if not question:
+            continue
+        if args.parse:
+            from menu_catalog import parse_question
+
+            question, filters = parse_question(question)
+        result = cache.search(question, args.k, mode=args.mode, filters=filters)
+        top = result["hits"][0]["name"] if result["hits"] else "-"
+        print(f"{result['cache']:<9}{result['total_ms']:>8.2f} ms  {line.strip()[:40]:<42}{top}")
+    print(", ".join(f"{name} {value}" for name, value in cache.metrics().items()))
+    searcher.close()
@@ -0,0 +1,29 @@
+import os
+import json
+from functools import lru_cache
+
+# Restaurant profiles from restaurants.json. Kept apart from menu_engine.py so
+# tools that only read scraped data do not import Selenium.
+
+RESTAURANTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "restaurants.json")
+
+
+@lru_cache(maxsize=None)
+def _read_restaurants(path):
+    with open(path, encoding="utf-8") as f:
+        return {restaurant["key"]: restaurant for restaurant in json.load(f)}
+
+
+def load_restaurants(path=RESTAURANTS_FILE):
+    return _read_restaurants(os.path.abspath(path))
+
+
+def load_restaurant(key, path=RESTAURANTS_FILE):
+    restaurants = load_restaurants(path)
+    if key not in restaurants:
+        raise KeyError(f"Unknown restaurant {key!r}; known: {', '.join(restaurants)}")
+    return restaurants[key]
+
+
+def restaurants_by_output(path=RESTAURANTS_FILE):
+    return {restaurant["output"]: restaurant for restaurant in load_restaurants(path).values()}
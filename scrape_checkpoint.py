@@ -0,0 +1,138 @@
+import os
+import json
+import time
+
+# Checkpoints for long scrapes. While the element path walks a menu, each
+# finished category's items are appended to checkpoints/<output>.jsonl, so a
+# scrape that dies late in a big menu can be rerun with --resume and pick up
+# from the first category it had not finished. The file is removed once the
+# outputs are saved. Batch runs also record finished restaurants in
+# checkpoints/batch.json, and --resume skips those until the whole batch has
+# finished.
+#
+# Each category is tried up to CATEGORY_ATTEMPTS times, backing off
+# exponentially between attempts; a category that still fails is left out of
+# the checkpoint (and the outputs) instead of failing the whole restaurant.
+
+CHECKPOINT_DIR = "checkpoints"
+BATCH_FILE = "batch.json"
+CATEGORY_ATTEMPTS = 3
+BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 8.0
+
+
+def with_backoff(run, retry_on, attempts=CATEGORY_ATTEMPTS, base=BACKOFF_SECONDS, cap=MAX_BACKOFF_SECONDS,
+                 sleep=time.sleep, label=""):
+    """run(), retried on retry_on exceptions with delays of base, 2*base, ... up to cap; the last error is raised."""
+    for attempt in range(attempts):
+        try:
+            return run()
+        except retry_on as e:
+            if attempt == attempts - 1:
+                raise
+            delay = min(cap, base * 2 ** attempt)
+            print(f"Attempt {attempt + 1} of {label or 'category'} failed ({type(e).__name__}), retrying in {delay:.1f}s")
+            sleep(delay)
+
+
+class CategoryCheckpoint:
+    def __init__(self, path, url, resume=False):
+        self.path = path
+        self.url = url
+        self.file = None
+        # key -> (items, region hash) of categories finished by the interrupted run;
+        # the hash is the region's fingerprint on incremental runs, else None.
+        self.previous = self._load() if resume else {}
+
+    @classmethod
+    def for_output(cls, output, url, resume=False, directory=CHECKPOINT_DIR):
+        return cls(os.path.join(directory, f"{output}.jsonl"), url, resume)
+
+    def _load(self):
+        """Finished categories from an earlier run of the same URL, ignoring a last line cut short by a crash."""
+        previous = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                header = json.loads(f.readline() or "{}")
+                if header.get("url") != self.url:
+                    return {}
+                for line in f:
+                    if not line.endswith("\n"):
+                        break
+                    record = json.loads(line)
+                    previous[record["key"]] = (record["items"], record.get("hash"))
+        except (OSError, ValueError):
+            return {}
+        if previous:
+            print(f"Resuming: {len(previous)} categories already extracted in {self.path}")
+        return previous
+
+    def get(self, key):
+        return self.previous.get(key)
+
+    def record(self, key, items, region_hash=None):
+        if self.file is None:
+            # The new checkpoint starts with what was carried over from the old one.
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self.file = open(self.path, "w", encoding="utf-8")
+            self.file.write(json.dumps({"url": self.url, "started_at": time.time()}) + "\n")
+            for previous_key, (previous_items, previous_hash) in self.previous.items():
+                self._write(previous_key, previous_items, previous_hash)
+        if key not in self.previous:
+            self._write(key, items, region_hash)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def _write(self, key, items, region_hash):
+        self.file.write(json.dumps({"key": key, "items": items, "hash": region_hash}, ensure_ascii=False) + "\n")
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def clear(self):
+        """Drop the checkpoint once the outputs it protected are saved."""
+        self.close()
+        self.previous = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class BatchState:
+    """Restaurants a batch run has finished, with their result rows."""
+
+    def __init__(self, path, completed=None):
+        self.path = path
+        self.completed = completed or {}
+
+    @classmethod
+    def load(cls, resume=False, directory=CHECKPOINT_DIR):
+        path = os.path.join(directory, BATCH_FILE)
+        if not resume:
+            return cls(path)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(path, json.load(f)["completed"])
+        except (OSError, ValueError, KeyError):
+            return cls(path)
+
+    def done(self, key):
+        return key in self.completed
+
+    def mark(self, result):
+        if result["status"] not in ("ok", "unchanged"):
+            return
+        self.completed[result["restaurant"]] = result
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"completed": self.completed}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def finish(self, keys):
+        """Remove the state once every restaurant in the batch has finished, so the next --resume starts afresh."""
+        if all(self.done(key) for key in keys):
+            self.completed = {}
+            if os.path.exists(self.path):
+                os.remove(self.path)
@@ -0,0 +1,110 @@
+import csv
+import time
+import argparse
+from multiprocessing import util
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import requests
+from driver_session import SessionManager
+from menu_engine import load_restaurants, scrape_restaurant as scrape_with_engine, RESULT_FIELDS
+from scrape_checkpoint import BatchState
+
+# One SessionManager (and HTTP session) per worker process, created by the pool
+# initializer, so warm browsers and connections are reused across the
+# restaurants that worker handles.
+_sessions = None
+_http = None
+
+TIMING_FIELDS = RESULT_FIELDS
+
+
+def init_worker(max_pages, max_rss_mb, load_profile):
+    global _sessions, _http
+    _sessions = SessionManager(max_pages=max_pages, max_rss_mb=max_rss_mb, profile=load_profile)
+    _http = requests.Session()
+    # Worker processes exit without running atexit hooks; a Finalize with an
+    # exit priority still runs, so the pooled browsers are quit on shutdown.
+    util.Finalize(None, _sessions.close, exitpriority=10)
+
+
+def scrape_restaurant(key, extraction_mode, run_started, fast_path=True, incremental=False, trace=False, resume=False):
+    """Scrape one restaurant in the current worker process and return its timing row."""
+    return scrape_with_engine(key, _sessions, extraction_mode, fast_path, _http, run_started, incremental, trace,
+                              resume=resume)
+
+
+def run_all(keys, workers=2, extraction_mode="element", summary_path="scrape_timings.csv",
+            max_pages=50, max_rss_mb=1500, load_profile="default", fast_path=True, incremental=False, trace=False,
+            resume=False):
+    """Scrape restaurants concurrently with at most `workers` browsers alive at once."""
+    run_started = time.time()
+    # The batch state is only written here, in the parent, as results come in.
+    batch = BatchState.load(resume)
+    results = [batch.completed[key] for key in keys if batch.done(key)]
+    for result in results:
+        print(f"[skipped] {result['restaurant']}: finished by the previous batch")
+    # One restaurant per worker process at a time, so each process holds at most
+    # one Chrome; the session manager recycles it by page count or memory.
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(max_pages, max_rss_mb, load_profile)) as pool:
+        futures = {
+            pool.submit(scrape_restaurant, key, extraction_mode, run_started, fast_path, incremental, trace, resume): key
+            for key in keys if not batch.done(key)
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {field: "" for field in TIMING_FIELDS}
+                result.update(restaurant=key, status="failed", error=f"{type(e).__name__}: {e}")
+            batch.mark(result)
+            print(f"[{result['status']}] {key}: {result['items']} items via {result['method']} in {result['total_seconds']}s")
+            results.append(result)
+    batch.finish(keys)
+    results.sort(key=lambda r: keys.index(r["restaurant"]))
+    write_summary(results, summary_path)
+    print_summary(results, time.time() - run_started)
+    return results
+
+
+def write_summary(results, path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=TIMING_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"Timing summary saved to {path}")
+
+
+def print_summary(results, wall_seconds):
+    print(f"\n{'Restaurant':<20}{'Status':<11}{'Method':<9}{'Items':>7}{'Setup (s)':>11}{'Scrape (s)':>12}{'Total (s)':>11}")
+    for r in results:
+        print(f"{r['restaurant']:<20}{r['status']:<11}{r['method']:<9}{r['items']:>7}{r['setup_seconds']:>11}{r['scrape_seconds']:>12}{r['total_seconds']:>11}")
+    serial = sum(r["total_seconds"] or 0 for r in results)
+    print(f"\nWall time: {wall_seconds:.1f}s (sum of per-restaurant time: {serial:.1f}s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape several restaurants in parallel.")
+    parser.add_argument("restaurants", nargs="*", help="restaurant keys from restaurants.json (default: all)")
+    parser.add_argument("--workers", type=int, default=2, help="number of concurrent browser workers")
+    parser.add_argument("--mode", choices=["element", "js", "snapshot"], default="element")
+    parser.add_argument("--no-fast-path", action="store_true", help="always use the browser, never plain HTTP")
+    parser.add_argument("--profile", choices=["default", "lean"], default="default", help="page-load profile")
+    parser.add_argument("--summary", default="scrape_timings.csv", help="where to write the timing summary")
+    parser.add_argument("--max-pages", type=int, default=50, help="recycle a browser after this many pages")
+    parser.add_argument("--max-rss-mb", type=int, default=1500, help="recycle a browser above this resident memory")
+    parser.add_argument("--incremental", action="store_true", help="skip menus and categories unchanged since the last run")
+    parser.add_argument("--trace", action="store_true",
+                        help="write each restaurant's stage spans to traces/ (merge with scrape_trace.py merge)")
+    parser.add_argument("--resume", action="store_true",
+                        help="skip restaurants the last batch finished and continue interrupted ones from checkpoints/")
+    args = parser.parse_args()
+    restaurants = load_restaurants()
+    keys = args.restaurants or list(restaurants)
+    unknown = [key for key in keys if key not in restaurants]
+    if unknown:
+        parser.error(f"unknown restaurant(s): {', '.join(unknown)}")
+    run_all(keys, workers=args.workers, extraction_mode=args.mode, summary_path=args.summary,
+            max_pages=args.max_pages, max_rss_mb=args.max_rss_mb, load_profile=args.profile,
+            fast_path=not args.no_fast_path, incremental=args.incremental, trace=args.trace,
+            resume=args.resume)
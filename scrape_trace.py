@@ -0,0 +1,160 @@
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+
+# Span timings for one scrape. MenuScraper wraps each stage (page load, waits,
+# cookie consent, category discovery, every category and item, save_data) in
+# tracer.span(name, **args); a Tracer records start and end with
+# perf_counter_ns and exports them as Chrome trace-event JSON, for
+# chrome://tracing or https://ui.perfetto.dev, and as a per-stage table.
+#
+# Tracing is off unless a Tracer is passed in: the default NULL_TRACER hands
+# back one shared no-op context manager, so a disabled span costs a method call.
+
+TRACE_DIR = "traces"
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullTracer:
+    enabled = False
+
+    def span(self, name, **args):
+        return _NULL_SPAN
+
+    def instant(self, name, **args):
+        pass
+
+
+NULL_TRACER = NullTracer()
+
+
+class Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.events.append((self.name, self.start, end, threading.get_native_id(), self.args))
+        return False
+
+
+class Tracer:
+    enabled = True
+
+    def __init__(self, process_name=None):
+        self.events = []
+        self.pid = os.getpid()
+        self.process_name = process_name
+        # perf_counter_ns has no fixed origin; anchoring it to the wall clock
+        # lines up traces written by different worker processes.
+        self.origin_ns = time.perf_counter_ns()
+        self.wall_origin_us = time.time() * 1e6
+
+    def span(self, name, **args):
+        return Span(self, name, args)
+
+    def instant(self, name, **args):
+        self.events.append((name, time.perf_counter_ns(), None, threading.get_native_id(), args))
+
+    def chrome_events(self):
+        events = []
+        if self.process_name:
+            events.append({"name": "process_name", "ph": "M", "pid": self.pid, "tid": 0,
+                           "args": {"name": self.process_name}})
+        for name, start, end, tid, args in self.events:
+            event = {"name": name, "cat": "scrape", "pid": self.pid, "tid": tid,
+                     "ts": round(self.wall_origin_us + (start - self.origin_ns) / 1000, 3), "args": args}
+            if end is None:
+                event.update(ph="i", s="t")
+            else:
+                event.update(ph="X", dur=round((end - start) / 1000, 3))
+            events.append(event)
+        return events
+
+    def write_chrome(self, path):
+        write_trace(self.chrome_events(), path)
+        return path
+
+    def summary(self):
+        return summarize(self.chrome_events())
+
+
+def write_trace(events, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def read_trace(path):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data["traceEvents"] if isinstance(data, dict) else data
+
+
+def trace_path(output, directory=TRACE_DIR):
+    return os.path.join(directory, f"{output}.trace.json")
+
+
+def summarize(events):
+    """[{stage, count, total_ms, mean_ms, max_ms}] for complete events, slowest stage first."""
+    stages = {}
+    for event in events:
+        if event.get("ph") != "X":
+            continue
+        durations = stages.setdefault(event["name"], [])
+        durations.append(event["dur"] / 1000)
+    rows = [{"stage": name, "count": len(durations), "total_ms": round(sum(durations), 3),
+             "mean_ms": round(sum(durations) / len(durations), 3), "max_ms": round(max(durations), 3)}
+            for name, durations in stages.items()]
+    return sorted(rows, key=lambda row: -row["total_ms"])
+
+
+def print_summary(rows):
+    print(f"\n{'Stage':<22}{'Count':>7}{'Total ms':>12}{'Mean ms':>11}{'Max ms':>11}")
+    for row in rows:
+        print(f"{row['stage']:<22}{row['count']:>7}{row['total_ms']:>12.1f}{row['mean_ms']:>11.3f}{row['max_ms']:>11.1f}")
+
+
+if __name__ == "__main__":
+    # python scrape_trace.py summary traces/tamasha_menu.trace.json
+    # python scrape_trace.py merge traces/*.trace.json -o traces/run.json
+    parser = argparse.ArgumentParser(description="Summarise or merge scrape traces.")
+    parser.add_argument("command", choices=["summary", "merge"])
+    parser.add_argument("traces", nargs="+")
+    parser.add_argument("-o", "--output", help="merged trace file (merge)")
+    args = parser.parse_args()
+    events = [event for path in args.traces for event in read_trace(path)]
+    if args.command == "merge":
+        if not args.output:
+            parser.error("merge needs -o/--output")
+        write_trace(events, args.output)
+        print(f"Merged {len(args.traces)} traces ({len(events)} events) into {args.output}")
+        sys.exit(0)
+    print_summary(summarize(events))
@@ -0,0 +1,74 @@
+import pytest
+from dish_matching import cluster_names, normalize_name
+
+# Labelled spellings the thresholds in dish_matching.py are tuned against.
+# Each SAME group must end up in one cluster; every name in a DIFFERENT
+# group must end up in a cluster of its own.
+SAME = [
+    ["Dal Makhani", "Dal Makhni", "Punjabi Dal Makhani"],
+    ["Paneer Tikka", "Panner Tikka"],
+    ["Gulab Jamun", "Gulab Jamoon"],
+    ["Chicken Tikka", "Chiken Tikka"],
+    ["Aloo Gobi", "Aloo Gobhi"],
+    ["Kadhai Paneer", "Kadai Paneer"],
+    ["Laccha Paratha", "Lachha Paratha"],
+    ["Chilli Mushroom", "Chilly Mushroom"],
+    ["Achari Paneer Tikka", "Achaari Paneer Tikka"],
+    ["Chicken Seekh Kebab", "Chicken Seekh Kabab"],
+    ["Dimsum", "Dimsums"],
+    ["Honey Chilli Potato", "Honey Chilli Potatoes"],
+    ["Dahi Kebab", "Dahi ke Kebab"],
+    ["Bhatti Da Murgh", "Bhatti Ka Murgh"],
+    ["Butter Chicken", "Butter Chicken (Boneless)"],
+    ["Kadhai Chicken", "Kadhai Chicken (Boneless)"],
+    ["Dal Tadka", "Hing Dal Tadka"],
+    ["Steamed Rice", "Plain Steamed Rice"],
+    ["Chicken Biryani", "Chicken Dum Biryani"],
+    ["Masala Papad", "Fried Masala Papad"],
+    ["Stir Fry Asian Greens", "Stir Fried Asian Greens"],
+    ["Mutton Rogan Josh", "Darzi Mutton Rogan Josh"],
+    ["Malai Paneer Tikka", "Paneer Malai Tikka"],
+    ["Veg Hot and Sour Soup", "Veg Hot & Sour Soup"],
+    ["Veg Manchow Soup", "Manchow Soup"],
+]
+DIFFERENT = [
+    ["Tandoori Roti", "Tandoori Naan", "Tandoori Khumbh"],
+    ["Chilli Chicken", "Chicken 65", "Saag Chicken", "Chicken & Chips", "Chicken Strips"],
+    ["Chicken Malai Tikka", "Chicken Tikka Masala Pizza"],
+    ["Chicken Tikka", "Chicken Tikka Masala"],
+    ["Chicken Tikka", "Chicken Taka Tak"],
+    ["Paneer Tikka", "Chicken Tikka"],
+    ["Paneer Tikka", "Paneer Tikki"],
+    ["Laccha Paratha", "Pudina Paratha"],
+    ["Palak Paneer", "Palak Paneer ki Seekh"],
+    ["Mutton Seekh", "Chicken Seekh"],
+    ["Chocolate Cake", "Coffee Chocolate Shake"],
+    ["Mix Vegetable", "Mixed Vegetable Raita"],
+    ["Chilli Cheese Naan", "Chilli Cheese Toast"],
+    ["Butter Chicken", "Butter Naan"],
+    ["Veg Manchow Soup", "Non-Veg Manchow Soup"],
+    ["Veg Fried Rice", "Egg Fried Rice"],
+    ["Chicken Noodles", "Chicken Fried Rice"],
+    ["Dal Makhani", "Dal Tadka"],
+    ["Gulab Jamun", "Kala Jamun"],
+    ["Fish Fingers", "Fingers"],
+]
+
+
+def labels(names):
+    return list(cluster_names([normalize_name(name) for name in names]))
+
+
+@pytest.mark.parametrize("names", SAME, ids=lambda names: " / ".join(names))
+def test_same_dish(names):
+    assert len(set(labels(names))) == 1
+
+
+@pytest.mark.parametrize("names", DIFFERENT, ids=lambda names: " / ".join(names))
+def test_different_dishes(names):
+    assert len(set(labels(names))) == len(names)
+
+
+def test_unqualified_name_does_not_bridge_ingredients():
+    veg, _, chicken = labels(["Veg Chilli Garlic Noodles", "Chilli Garlic Noodles", "Chicken Chilli Garlic Noodles"])
+    assert veg != chicken
@@ -0,0 +1,27 @@
+from embedding_cache import EmbeddingCache
+from menu_index import make_encoder
+
+
+def test_rebuild_keeps_other_versions(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    small, large = make_encoder("hashing:64"), make_encoder("hashing:128")
+    cache.encode(small, ["paneer tikka", "dal makhani"])
+    cache.encode(large, ["paneer tikka"])
+    cache.close()
+
+    cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    cache.encode(small, ["paneer tikka"])
+    assert cache.evict_orphans(small.version) == 1
+    assert dict((version, count) for version, _, count in cache.summary()) == {small.version: 1, large.version: 1}
+    assert cache.clear(large.version) == 1
+    assert [version for version, _, _ in cache.summary()] == [small.version]
+
+
+def test_encoded_counts_distinct_texts(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.db"))
+    encoder = make_encoder("hashing:64")
+    cache.encode(encoder, ["paneer tikka", "paneer tikka", "dal makhani", "paneer tikka"])
+    assert cache.stats["misses"] == 4
+    assert cache.stats["encoded"] == 2
+    cache.encode(encoder, ["dal makhani", "butter naan"])
+    assert (cache.stats["hits"], cache.stats["encoded"]) == (1, 3)
@@ -0,0 +1,89 @@
+import json
+import threading
+import pytest
+from http_fast_path import (FastPathUnavailable, fetch_menu_over_http, menu_from_state, page_json_url,
+                            recording_path, serve_recordings)
+
+# The fast path against a local stand-in server that serves recorded pages
+# (http_fast_path.py serve), so no request leaves the machine.
+
+DEFAULTS = {"name": "", "description": "", "price": "", "veg_status": "Unknown"}
+STATE = {"pages": {"restaurant": {"order": {"menuList": {"menus": [{"menu": {"name": "Menu", "categories": [
+    {"category": {"name": "Starters", "items": [
+        {"item": {"name": "Paneer Tikka", "desc": "From the tandoor.", "display_price": 395, "dietary_slugs": ["veg"]}},
+        {"item": {"name": "Chicken 65", "price": "445", "dietary_slugs": ["non-veg"]}},
+    ]}},
+    {"category": {"name": "Breads", "items": [{"item": {"name": "Butter Naan", "price": 85.0}}]}},
+]}}]}}}}}
+MENU = {
+    "Starters": [
+        {"name": "Paneer Tikka", "description": "From the tandoor.", "price": "₹395", "veg_status": "Veg"},
+        {"name": "Chicken 65", "description": "", "price": "₹445", "veg_status": "Non-Veg"},
+    ],
+    "Breads": [{"name": "Butter Naan", "description": "", "price": "₹85", "veg_status": "Unknown"}],
+}
+
+
+def order_page(state):
+    encoded = json.dumps(json.dumps(state))
+    return f"<html><script>window.__PRELOADED_STATE__ = JSON.parse({encoded});</script></html>"
+
+
+@pytest.fixture
+def server(tmp_path):
+    """(recordings directory, base URL) of a stand-in server on a free port."""
+    httpd = serve_recordings(str(tmp_path), port=0)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield tmp_path, f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def record(directory, url, body):
+    with open(recording_path(str(directory), url), "w", encoding="utf-8") as f:
+        f.write(body)
+
+
+def test_reads_preloaded_state(server):
+    directory, base = server
+    url = f"{base}/ncr/some-restaurant/order"
+    record(directory, url, order_page(STATE))
+    assert fetch_menu_over_http(url, DEFAULTS) == MENU
+
+
+def test_falls_back_to_page_json(server):
+    directory, base = server
+    url = f"{base}/ncr/some-restaurant/order"
+    record(directory, url, "<html>no state here</html>")
+    record(directory, page_json_url(url), json.dumps(STATE))
+    assert fetch_menu_over_http(url, DEFAULTS) == MENU
+
+
+def test_unrecorded_page_is_unavailable(server):
+    _, base = server
+    with pytest.raises(FastPathUnavailable):
+        fetch_menu_over_http(f"{base}/ncr/missing/order", DEFAULTS)
+
+
+@pytest.mark.parametrize("menus", [
+    [{"menu": []}],
+    [{"menu": {"categories": "Starters"}}],
+    [{"menu": {"categories": [["Starters"]]}}],
+    [{"menu": {"categories": [{"category": {"name": 7, "items": []}}]}}],
+    [{"menu": {"categories": [{"category": {"name": "Starters", "items": {"item": {}}}}]}}],
+    [{"menu": {"categories": [{"category": {"name": "Starters", "items": ["Paneer Tikka"]}}]}}],
+    [{"menu": {"categories": [{"category": {"name": "Starters", "items": [{"item": {"name": ["Paneer"]}}]}}]}}],
+    [{"menu": {"categories": [{"category": {"name": "Starters", "items": [
+        {"item": {"name": "Paneer Tikka", "price": {"amount": 395}}}]}}]}}],
+    [{"menu": {"categories": [{"category": {"name": "Starters", "items": [
+        {"item": {"name": "Paneer Tikka", "dietary_slugs": "veg"}}]}}]}}],
+])
+def test_unexpected_state_shape_is_unavailable(menus, server):
+    with pytest.raises(FastPathUnavailable):
+        menu_from_state({"menus": menus}, DEFAULTS)
+    directory, base = server
+    url = f"{base}/ncr/odd-restaurant/order"
+    record(directory, url, order_page({"menus": menus}))
+    with pytest.raises(FastPathUnavailable):
+        fetch_menu_over_http(url, DEFAULTS)
@@ -0,0 +1,22 @@
+import pandas as pd
+from menu_cleaning import clean_menu, normalize_case
+
+
+def test_case_is_fixed_word_by_word():
+    names = pd.Series(["CHEF'S SPECIAL", "chef's special", "BBQ Wings", "paneer tikka", "McDonald's Burger", "DAL"])
+    assert normalize_case(names).tolist() == [
+        "Chef's Special", "Chef's Special", "BBQ Wings", "Paneer Tikka", "McDonald's Burger", "DAL"]
+
+
+def test_dropped_rows_are_counted_by_reason():
+    frame = pd.DataFrame({
+        "category": ["Starters"] * 5,
+        "name": ["Paneer Tikka", "₹245", "", "  ", "Your Order (0)"],
+        "price": ["₹245"] * 5,
+        "veg_status": ["Veg"] * 5,
+    })
+    cleaned, report = clean_menu(frame)
+    assert cleaned["name"].tolist() == ["Paneer Tikka"]
+    assert report["cart_rows_dropped"] == 1
+    assert report["price_name_rows_dropped"] == 1
+    assert report["empty_name_rows_dropped"] == 2
@@ -0,0 +1,52 @@
+import pytest
+from menu_catalog import ask, bulk_load, connect, menus_from_outputs, search
+from menu_filters import FilterIndex
+from menu_index import menu_rows
+from test_startup import MENU_CSV
+
+# The outputs' restaurant key is connaught_royale and its display name
+# "Connaught Royale 1"; filters accept either.
+
+NAMES = [["connaught_royale"], ["Connaught Royale 1"], ["connaught royale"], ["CONNAUGHT_ROYALE"]]
+
+
+@pytest.fixture(scope="module")
+def outputs(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("outputs")
+    (directory / "connaught_royale_menu.csv").write_text(MENU_CSV, encoding="utf-8")
+    return str(directory)
+
+
+@pytest.fixture(scope="module")
+def filters(outputs):
+    return FilterIndex(menu_rows(outputs))
+
+
+@pytest.fixture(scope="module")
+def catalog(outputs, tmp_path_factory):
+    conn = connect(str(tmp_path_factory.mktemp("catalog") / "menu_catalog.db"))
+    bulk_load(conn, menus_from_outputs(outputs))
+    return conn
+
+
+@pytest.mark.parametrize("restaurants", NAMES)
+def test_filter_index_accepts_keys_and_display_names(filters, restaurants):
+    assert len(filters.select(restaurants=restaurants)) == 3
+    assert filters.restaurant_keys(restaurants) == ["connaught_royale"]
+
+
+def test_filter_index_location_matches_restaurant_name(filters):
+    assert len(filters.select(location="Connaught Royale")) == 3
+    assert len(filters.select(location="Connaught Place")) == 3
+    assert len(filters.select(restaurants=["Punjab Grill"])) == 0
+    assert len(filters.select(location="Punjab Grill")) == 0
+
+
+@pytest.mark.parametrize("restaurants", NAMES)
+def test_catalog_accepts_keys_and_display_names(catalog, restaurants):
+    assert [row[2] for row in search(catalog, "paneer", restaurants=restaurants)] == ["Paneer Tikka"]
+
+
+def test_question_naming_a_restaurant(catalog):
+    assert [row[2] for row in ask(catalog, "veg paneer at Connaught Royale")] == ["Paneer Tikka"]
+    assert ask(catalog, "veg paneer at Punjab Grill") == []
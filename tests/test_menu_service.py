@@ -0,0 +1,75 @@
+import json
+import asyncio
+import pytest
+from menu_index import build_index
+from menu_service import MenuService
+from test_startup import MENU_CSV
+
+# Malformed requests must come back as 400 before any encoding or search
+# work is queued, and leave the service answering the next request.
+
+
+@pytest.fixture(scope="module")
+def index_dir(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("outputs")
+    (directory / "connaught_royale_menu.csv").write_text(MENU_CSV, encoding="utf-8")
+    out = directory / "menu_index"
+    build_index(str(directory), str(out), encoder_spec="hashing")
+    return str(out)
+
+
+async def exchange(port, raw):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(raw)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    body = json.loads(await reader.readexactly(int(headers["content-length"])))
+    writer.close()
+    return status, body
+
+
+def post(body):
+    return (f"POST /search HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n").encode() + body
+
+
+def run(index_dir, raw):
+    async def main():
+        service = MenuService.load(index_dir, workers=1)
+        port = await service.start(port=0)
+        try:
+            response = await exchange(port, raw)
+            return response, service.batcher.stats["encoded"], service.stats["errors"]
+        finally:
+            await service.stop()
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("raw", [
+    post(b"[1]"),
+    post(b'"paneer"'),
+    post(b'{"query": 5}'),
+    post(b'{"query": "paneer", "filters": [1]}'),
+    post(b'{"query": "paneer", "filters": {"veg_status": "veg"}}'),
+    post(b'{"query": "paneer", "filters": {"max_price": "400"}}'),
+    post(b'{"query": "paneer", "filters": {"restaurants": "connaught_royale"}}'),
+    b"GET /search?q=paneer&veg=veg HTTP/1.1\r\nConnection: close\r\n\r\n",
+    b"GARBAGE\r\nConnection: close\r\n\r\n",
+    b"GET /search?q=paneer HTTP/1.1\r\nContent-Length: lots\r\n\r\n",
+], ids=["list body", "string body", "number query", "list filters", "veg status", "string price",
+        "string restaurants", "GET veg status", "request line", "content length"])
+def test_bad_request_is_400_without_encoding(index_dir, raw):
+    (status, body), encoded, errors = run(index_dir, raw)
+    assert status == 400, body
+    assert encoded == 0 and errors == 0
+
+
+def test_valid_request_is_answered(index_dir):
+    (status, body), encoded, errors = run(index_dir, post(b'{"query": "paneer", "filters": {"veg_status": "Veg"}}'))
+    assert status == 200, body
+    assert encoded == 1 and errors == 0
+    assert body["hits"] and all(hit["veg_status"] == "Veg" for hit in body["hits"])
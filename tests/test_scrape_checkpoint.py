@@ -0,0 +1,26 @@
+import os
+import json
+from menu_engine import MenuScraper
+from scrape_checkpoint import CategoryCheckpoint
+
+RESTAURANTS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "restaurants.json")
+
+
+def test_failed_scrape_closes_checkpoint(tmp_path, monkeypatch):
+    with open(RESTAURANTS, encoding="utf-8") as f:
+        restaurant = json.load(f)[0]
+    monkeypatch.chdir(tmp_path)
+    scraper = MenuScraper(restaurant, driver=object(), checkpoint=True)
+    scraper.load_page = lambda: None
+    scraper.page_unchanged = lambda: False
+    scraper.open_sink = lambda: None
+
+    def extract_menu():
+        scraper.checkpoint.record("Starters#1", [{"name": "Paneer Tikka"}])
+        raise RuntimeError("browser went away")
+
+    scraper.extract_menu = extract_menu
+    assert scraper.scrape() is None
+    assert scraper.checkpoint.file is None
+    resumed = CategoryCheckpoint.for_output(restaurant["output"], scraper.url, resume=True)
+    assert resumed.get("Starters#1") == ([{"name": "Paneer Tikka"}], None)
@@ -0,0 +1,39 @@
+import pytest
+from benchmarks.bench_startup import BUDGET_MS, HEAVY_MODULES, build_catalog, import_times, measure
+
+# `menu_cli.py query` and `stats` must start without the scraping and vector
+# stacks: under `python -X importtime` neither may import a HEAVY_MODULES
+# entry or add more than BUDGET_MS of imports over a bare interpreter.
+
+MENU_CSV = """\
+Restaurant Name,Location,Operating Hours,Contact,Category,Item Name,Description,Price,Veg Status
+Connaught Royale 1,"Connaught Place, New Delhi",12:00 PM to 11:00 PM,+91 11 33106243,Main Course,Paneer Tikka,Cottage cheese from the tandoor.,₹395,Veg
+Connaught Royale 1,"Connaught Place, New Delhi",12:00 PM to 11:00 PM,+91 11 33106243,Main Course,Butter Chicken,,₹495,Non-Veg
+Connaught Royale 1,"Connaught Place, New Delhi",12:00 PM to 11:00 PM,+91 11 33106243,Breads,Butter Naan,Soft Indian flatbread coated with butter.,₹85,Veg
+"""
+
+
+@pytest.fixture(scope="module")
+def outputs(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("outputs")
+    (directory / "connaught_royale_menu.csv").write_text(MENU_CSV, encoding="utf-8")
+    db = directory / "menu_catalog.db"
+    build_catalog(str(directory), str(db))
+    return directory, db
+
+
+@pytest.fixture(scope="module")
+def interpreter_modules():
+    return {name.strip() for name in import_times(["-c", "pass"])}
+
+
+@pytest.mark.parametrize("command", ["query", "stats"])
+def test_startup_within_budget(command, outputs, interpreter_modules):
+    directory, db = outputs
+    argv = {
+        "query": ["menu_cli.py", "query", "veg paneer under ₹400", "--db", str(db)],
+        "stats": ["menu_cli.py", "stats", "--dir", str(directory)],
+    }[command]
+    total, added, heavy = measure(argv, interpreter_modules, repeat=3)
+    assert not heavy, f"{command} imports {', '.join(heavy)}"
+    assert total <= BUDGET_MS, f"{command} adds {total:.1f} ms of imports: {sorted(added, key=added.get)[-5:]}"